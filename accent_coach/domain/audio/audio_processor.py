@@ -4,11 +4,22 @@ Audio Processor Implementation
 Migrated from root audio_processor.py with improvements.
 """
 
+import base64
+import functools
+import hashlib
 import io
-from typing import Optional, Tuple
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
 import numpy as np
 
 
+# Audio payload inside a gTTS batchexecute response line
+_GTTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+
 class AudioProcessor:
     """
     Audio processing utilities.
@@ -22,8 +33,8 @@ class AudioProcessor:
         Load audio from bytes and convert to numpy array.
 
         Tries multiple methods in order:
-        1. soundfile (most reliable for WAV)
-        2. librosa (good for various formats)
+        1. soundfile (most reliable for WAV) + soxr resampling
+        2. librosa (good for various formats, e.g. MP3 via audioread)
         3. torchaudio (PyTorch fallback)
 
         Args:
@@ -37,7 +48,7 @@ class AudioProcessor:
         try:
             import soundfile as sf
             audio_file = io.BytesIO(audio_bytes)
-            waveform, sr = sf.read(audio_file, dtype='float32')
+            waveform, sr = sf.read(audio_file, dtype='float32', always_2d=False)
 
             # Convert to mono if stereo
             if waveform.ndim > 1 and waveform.shape[1] > 1:
@@ -58,7 +69,7 @@ class AudioProcessor:
             try:
                 import librosa
                 audio_file = io.BytesIO(audio_bytes)
-                waveform, sr = librosa.load(audio_file, sr=target_sr, mono=True)
+                waveform, sr = librosa.load(audio_file, sr=target_sr, mono=True, res_type="soxr_hq")
                 return waveform.astype(np.float32), target_sr
 
             except Exception:
@@ -92,25 +103,89 @@ class AudioProcessor:
 
     @staticmethod
     def _resample(waveform: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Resample audio using librosa."""
-        import librosa
-        return librosa.resample(waveform, orig_sr=orig_sr, target_sr=target_sr)
+        """Resample 1D audio with soxr (falls back to librosa if unavailable)."""
+        try:
+            import soxr
+            return soxr.resample(waveform, orig_sr, target_sr, quality="HQ")
+        except ImportError:
+            import librosa
+            return librosa.resample(waveform, orig_sr=orig_sr, target_sr=target_sr, res_type="soxr_hq")
+
+    @staticmethod
+    def peak(waveform: np.ndarray) -> float:
+        """
+        Compute the absolute peak of a waveform.
+
+        Uses max(-min, max) so no temporary |x| array is allocated.
+
+        Args:
+            waveform: Input audio waveform
+
+        Returns:
+            Peak absolute amplitude (0.0 for empty input)
+        """
+        if waveform.size == 0:
+            return 0.0
+        # float() before negating: -int16(-32768) would overflow
+        return max(-float(waveform.min()), float(waveform.max()))
+
+    @staticmethod
+    def rms(waveform: np.ndarray) -> float:
+        """
+        Compute the RMS level of a waveform.
+
+        Uses a single dot product (no squared temporary array).
+
+        Args:
+            waveform: Input audio waveform
+
+        Returns:
+            RMS amplitude (0.0 for empty input)
+        """
+        if waveform.size == 0:
+            return 0.0
+        # float64 before the dot product: int16 squares would overflow
+        samples = np.asarray(waveform, dtype=np.float64).reshape(-1)
+        return float(np.sqrt(np.dot(samples, samples) / samples.size))
 
     @staticmethod
-    def normalize_audio(waveform: np.ndarray, target_level: float = 0.95) -> np.ndarray:
+    def to_int16(waveform: np.ndarray) -> np.ndarray:
+        """
+        Quantize a float waveform in [-1, 1] to int16 PCM.
+
+        Args:
+            waveform: Float audio waveform
+
+        Returns:
+            int16 waveform (half the memory of float32)
+        """
+        scaled = np.multiply(waveform, np.float32(32767.0), dtype=np.float32)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16)
+
+    @staticmethod
+    def normalize_audio(
+        waveform: np.ndarray,
+        target_level: float = 0.95,
+        inplace: bool = False,
+    ) -> np.ndarray:
         """
         Normalize audio to target level.
 
         Args:
             waveform: Input audio waveform
             target_level: Target peak level (0.0 to 1.0)
+            inplace: Scale the buffer in place instead of returning a copy.
+                Only use this when the caller owns the waveform.
 
         Returns:
-            Normalized waveform
+            Normalized waveform (float32, C-contiguous)
         """
-        max_val = np.abs(waveform).max()
+        waveform = np.ascontiguousarray(waveform, dtype=np.float32)
+        max_val = AudioProcessor.peak(waveform)
         if max_val > 0:
-            return waveform * (target_level / max_val)
+            out = waveform if inplace else None
+            return np.multiply(waveform, np.float32(target_level / max_val), out=out)
         return waveform
 
 
@@ -119,34 +194,204 @@ class TTSGenerator:
     Text-to-Speech generator using gTTS.
 
     Migrated from root audio_processor.py.
+
+    All instances share one pooled, keep-alive HTTP session so repeated
+    synthesis calls reuse the TCP/TLS connection to the TTS endpoint
+    instead of opening a new one per request.
     """
 
-    @staticmethod
-    def generate_audio(text: str, lang: str = "en") -> Optional[bytes]:
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+
+    # Opt-in second-tier cache for synthesized MP3s. Files are never evicted,
+    # so only point this at a directory whose growth is managed elsewhere
+    CACHE_DIR: Optional[Path] = (
+        Path(os.environ["ACCENT_COACH_TTS_CACHE_DIR"])
+        if os.environ.get("ACCENT_COACH_TTS_CACHE_DIR")
+        else None
+    )
+
+    _session = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def _get_session(cls):
+        """Return the process-wide pooled HTTP session, creating it on first use."""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=cls.POOL_CONNECTIONS,
+                        pool_maxsize=cls.POOL_MAXSIZE,
+                        max_retries=Retry(total=2, backoff_factor=0.1),
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def _pooled_stream(cls, tts):
         """
-        Generate TTS audio using gTTS.
+        Drop-in replacement for gTTS.stream() that uses the shared session.
+
+        gTTS opens a fresh requests.Session for every request; this sends
+        the same prepared requests over the pooled session instead.
+
+        Args:
+            tts: gTTS instance
+
+        Yields:
+            Decoded MP3 byte fragments
+        """
+        import urllib.request
+        import requests
+        from gtts.tts import gTTSError
+
+        session = cls._get_session()
+        for prepared in tts._prepare_requests():
+            try:
+                response = session.send(
+                    prepared,
+                    proxies=urllib.request.getproxies(),
+                    timeout=tts.timeout,
+                )
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                raise gTTSError(tts=tts, response=response)
+            except requests.exceptions.RequestException:
+                raise gTTSError(tts=tts)
+
+            for line in response.iter_lines(chunk_size=1024):
+                decoded_line = line.decode("utf-8")
+                if "jQ1olc" in decoded_line:
+                    audio_search = _GTTS_AUDIO_RE.search(decoded_line)
+                    if not audio_search:
+                        raise gTTSError(tts=tts, response=response)
+                    yield base64.b64decode(audio_search.group(1).encode("ascii"))
+
+    @classmethod
+    def _fetch(cls, text: str, lang: str, slow: bool) -> bytes:
+        """Run gTTS over the pooled session and return MP3 bytes (raises on failure)."""
+        from gtts import gTTS
+
+        tts = gTTS(text=text, lang=lang, slow=slow)
+        tts.stream = functools.partial(cls._pooled_stream, tts)
+        mp3_fp = io.BytesIO()
+        tts.write_to_fp(mp3_fp)
+        mp3_fp.seek(0)
+        return mp3_fp.getvalue()
+
+    @classmethod
+    def _cache_path(cls, text: str, lang: str, slow: bool) -> Optional[Path]:
+        """Content-addressed disk cache path, or None if the disk tier is disabled."""
+        if cls.CACHE_DIR is None:
+            return None
+        key = hashlib.blake2b(f"{text}|{lang}|{slow}".encode("utf-8"), digest_size=16).hexdigest()
+        return Path(cls.CACHE_DIR) / f"{key}.mp3"
+
+    @classmethod
+    def _fetch_with_disk_cache(cls, text: str, lang: str, slow: bool) -> bytes:
+        """Disk tier of the TTS cache; falls through to gTTS on a miss."""
+        path = cls._cache_path(text, lang, slow)
+        if path is not None and path.is_file():
+            try:
+                return path.read_bytes()
+            except OSError:
+                pass
+
+        audio = cls._fetch(text, lang, slow)
+
+        if path is not None and audio:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(audio)
+                os.replace(tmp_path, path)
+            except OSError:
+                # Non-fatal: the audio is still returned and kept in memory
+                pass
+
+        return audio
+
+    @classmethod
+    def _synthesize(cls, text: str, lang: str, slow: bool) -> Optional[bytes]:
+        """Return MP3 bytes from the memory/disk cache or gTTS (None on failure)."""
+        try:
+            return _cached_tts(cls, text, lang, slow)
+        except Exception:
+            return None
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop the in-process TTS cache (the disk tier is left untouched)."""
+        _cached_tts.cache_clear()
+
+    @classmethod
+    def stream_audio(cls, text: str, lang: str = "en", slow: bool = False) -> Iterator[bytes]:
+        """
+        Stream TTS audio as MP3 fragments as they arrive from gTTS.
+
+        Lets callers start playback at time-to-first-byte instead of
+        waiting for the full synthesis.
 
         Args:
             text: Text to convert to speech
             lang: Language code
+            slow: Whether to generate slow speech
 
-        Returns:
-            Audio bytes in MP3 format, or None on failure
+        Yields:
+            MP3 byte chunks; stops early (without raising) on failure
         """
         try:
             from gtts import gTTS
 
-            tts = gTTS(text=text, lang=lang, slow=False)
-            mp3_fp = io.BytesIO()
-            tts.write_to_fp(mp3_fp)
-            mp3_fp.seek(0)
-            return mp3_fp.getvalue()
+            tts = gTTS(text=text, lang=lang, slow=slow)
+            yield from cls._pooled_stream(tts)
 
         except Exception:
-            return None
+            return
 
-    @staticmethod
-    def generate_slow_audio(text: str, lang: str = "en") -> Optional[bytes]:
+    @classmethod
+    def warmup(cls, text: str = "warm up", lang: str = "en") -> bool:
+        """
+        Open the pooled connection to the TTS endpoint ahead of the first request.
+
+        Bypasses the TTS cache so the TCP/TLS session is actually established.
+
+        Args:
+            text: Short text to synthesize
+            lang: Language code
+
+        Returns:
+            True if the warm-up synthesis succeeded
+        """
+        try:
+            return bool(cls._fetch(text, lang, slow=False))
+        except Exception:
+            return False
+
+    @classmethod
+    def generate_audio(cls, text: str, lang: str = "en") -> Optional[bytes]:
+        """
+        Generate TTS audio using gTTS.
+
+        Args:
+            text: Text to convert to speech
+            lang: Language code
+
+        Returns:
+            Audio bytes in MP3 format, or None on failure
+        """
+        return cls._synthesize(text, lang, slow=False)
+
+    @classmethod
+    def generate_slow_audio(cls, text: str, lang: str = "en") -> Optional[bytes]:
         """
         Generate slow TTS audio for pronunciation practice.
 
@@ -157,17 +402,18 @@ class TTSGenerator:
         Returns:
             Audio bytes in MP3 format, or None on failure
         """
-        try:
-            from gtts import gTTS
+        return cls._synthesize(text, lang, slow=True)
 
-            tts = gTTS(text=text, lang=lang, slow=True)
-            mp3_fp = io.BytesIO()
-            tts.write_to_fp(mp3_fp)
-            mp3_fp.seek(0)
-            return mp3_fp.getvalue()
 
-        except Exception:
-            return None
+@functools.lru_cache(maxsize=512)
+def _cached_tts(generator_cls, text: str, lang: str, slow: bool) -> bytes:
+    """
+    In-process tier of the TTS cache, keyed on (text, lang, slow).
+
+    Failures raise and are therefore never cached. ~50 KB per entry,
+    so a full cache holds roughly 25 MB.
+    """
+    return generator_cls._fetch_with_disk_cache(text, lang, slow)
 
 
 class AudioValidator:
@@ -195,7 +441,7 @@ class AudioValidator:
         Returns:
             True if audio is silent
         """
-        return np.abs(waveform).max() < threshold
+        return AudioProcessor.peak(waveform) < threshold
 
     @staticmethod
     def validate_audio_data(waveform: Optional[np.ndarray], sr: Optional[int]) -> Tuple[bool, str]:
@@ -215,9 +461,7 @@ class AudioValidator:
         if len(waveform) == 0:
             return False, "Audio waveform is empty"
 
-        if AudioValidator.is_silent(waveform):
-            return False, "Audio appears to be silent"
-
+        # O(1) checks first so rejected clips never pay for a buffer scan
         if not AudioValidator.is_valid_sample_rate(sr):
             return False, f"Unusual sample rate: {sr} Hz"
 
@@ -228,4 +472,13 @@ class AudioValidator:
         if duration > 300:  # 5 minutes
             return False, f"Audio too long: {duration:.2f} seconds"
 
+        # Peak from a min() and a max() reduction (no |x| temporary); both
+        # propagate NaN, so a non-finite peak also flags NaN/inf samples
+        peak = AudioProcessor.peak(waveform)
+        if not np.isfinite(peak):
+            return False, "Audio contains NaN or infinite values"
+
+        if peak < 0.01:
+            return False, "Audio appears to be silent"
+
         return True, "Valid"
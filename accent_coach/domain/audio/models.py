@@ -7,7 +7,7 @@ from typing import Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Configuration for audio processing."""
     sample_rate: int = 16000  # target sample rate
@@ -15,12 +15,20 @@ class AudioConfig:
     enable_enhancement: bool = True
     enable_vad: bool = True
     enable_denoising: bool = True
+    store_int16: bool = False  # keep the processed waveform as int16 PCM (half the memory)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedAudio:
     """Result of audio processing."""
     waveform: np.ndarray
     sample_rate: int
     duration_seconds: float  # duration in seconds
     quality_metrics: Optional[dict] = None
+
+    @property
+    def waveform_f32(self) -> np.ndarray:
+        """Waveform as float32 in [-1, 1]; int16 PCM is converted on access."""
+        if self.waveform.dtype == np.int16:
+            return np.multiply(self.waveform, np.float32(1 / 32768.0), dtype=np.float32)
+        return self.waveform
@@ -2,7 +2,9 @@
 Audio Processing Service (BC1)
 """
 
-from typing import Optional
+import io
+from typing import Iterator, Optional
+import numpy as np
 from .models import AudioConfig, ProcessedAudio
 from .audio_processor import AudioProcessor, TTSGenerator, AudioValidator
 
@@ -23,6 +25,8 @@ class AudioService:
     Dependencies: NONE (pure processing)
     """
 
+    NORMALIZE_TARGET_LEVEL = 0.95
+
     def __init__(self, processor: AudioProcessor = None, tts_generator: TTSGenerator = None):
         """
         Args:
@@ -58,17 +62,48 @@ class AudioService:
         if not is_valid:
             raise AudioValidationError(f"Invalid audio: {error_message}")
 
-        # 3. Apply normalization if configured
+        # 3. Apply normalization if configured (buffer is ours, scale in place)
         if config.normalize:
-            waveform = self._processor.normalize_audio(waveform)
+            waveform = self._processor.normalize_audio(
+                waveform, target_level=self.NORMALIZE_TARGET_LEVEL, inplace=True
+            )
+
+        # 4. Optionally store as int16 PCM; consumers read waveform_f32
+        if config.store_int16:
+            waveform = self._processor.to_int16(waveform)
 
-        # 4. Return ProcessedAudio
+        # 5. Return ProcessedAudio
         return ProcessedAudio(
             waveform=waveform,
             sample_rate=sr,
-            duration_seconds=len(waveform) / sr
+            duration_seconds=len(waveform) / sr,
         )
 
+    def warmup(self, sample_length: int = 16000, include_tts: bool = True) -> None:
+        """
+        Prime the audio pipeline at startup so the first request does not pay for it.
+
+        Decodes, resamples, validates and normalizes a synthetic tone (loading
+        soundfile/soxr on the way) and, optionally, opens the TTS connection.
+
+        Args:
+            sample_length: Number of samples in the synthetic clip (at 16 kHz)
+            include_tts: Also warm up the TTS generator (needs network access)
+        """
+        import soundfile as sf
+
+        config = AudioConfig()
+        t = np.arange(sample_length, dtype=np.float32) / config.sample_rate
+        tone = 0.5 * np.sin(2 * np.pi * 440.0 * t)
+
+        # Encode at a different rate so the resampler is exercised too
+        buffer = io.BytesIO()
+        sf.write(buffer, np.repeat(tone, 2), config.sample_rate * 2, format="WAV")
+        self.process_recording(buffer.getvalue(), config)
+
+        if include_tts:
+            self._tts.warmup()
+
     def generate_tts(self, text: str, lang: str = 'en', slow: bool = False) -> Optional[bytes]:
         """
         Generate speech audio from text.
@@ -85,3 +120,17 @@ class AudioService:
             return self._tts.generate_slow_audio(text, lang)
         else:
             return self._tts.generate_audio(text, lang)
+
+    def generate_tts_stream(self, text: str, lang: str = 'en', slow: bool = False) -> Iterator[bytes]:
+        """
+        Stream speech audio from text chunk by chunk.
+
+        Args:
+            text: Text to convert to speech
+            lang: Language code (default: 'en')
+            slow: Whether to generate slow speech for practice
+
+        Returns:
+            Iterator of MP3 byte chunks (empty on failure)
+        """
+        return self._tts.stream_audio(text, lang, slow=slow)
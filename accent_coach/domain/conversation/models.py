@@ -2,10 +2,15 @@
 Conversation Tutoring domain models
 """
 
+import itertools
+import json
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import Deque, Iterator, List, Optional, Dict, Tuple, Union
+
+from .tokens import count_tokens
 
 
 class ConversationMode(Enum):
@@ -14,7 +19,7 @@ class ConversationMode(Enum):
     EXAM = "exam"  # Feedback at end
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationConfig:
     """Configuration for conversation practice."""
     mode: ConversationMode = ConversationMode.PRACTICE
@@ -26,9 +31,13 @@ class ConversationConfig:
     asr_model: str = "facebook/wav2vec2-base-960h"
     sample_rate: int = 16000
     max_history_turns: int = 5  # Context window for LLM
+    keep_full_history: bool = True  # False: session keeps only the last max_history_turns (prompts are bounded either way)
+    max_prompt_tokens: int = 1500  # Token budget for conversation history in the prompt
+    history_anchor_turns: int = 0  # Opening turns always kept verbatim at the start of the history
+    stream_audio: bool = False  # True: hand back follow-up TTS as a chunk iterator instead of bytes
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TutorResponse:
     """Parsed response from LLM tutor."""
     correction: str
@@ -39,7 +48,7 @@ class TutorResponse:
     assistant_response: str = ""  # Full response text
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnResult:
     """Simplified turn result for UI interactions."""
     user_transcript: str
@@ -48,28 +57,66 @@ class TurnResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """Single turn in a conversation."""
     user_transcript: str
     tutor_response: TutorResponse
     follow_up_audio: Optional[bytes] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    # Lazy MP3 chunk iterator, set instead of follow_up_audio when streaming (see stream_audio)
+    follow_up_audio_stream: Optional[Iterator[bytes]] = field(default=None, repr=False, compare=False)
+    _context_lines: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _token_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def context_lines(self) -> Tuple[str, ...]:
+        """
+        Prompt context lines for this turn ("Student: ..." / "Tutor: ...").
+
+        Formatted on first use and memoized, since a stored turn does not change.
+        """
+        if self._context_lines is None:
+            lines = [f"Student: {self.user_transcript}"]
+            # Only include follow-up question from tutor response
+            if self.tutor_response.follow_up_question:
+                lines.append(f"Tutor: {self.tutor_response.follow_up_question}")
+            self._context_lines = tuple(lines)
+        return self._context_lines
+
+    def token_count(self) -> int:
+        """Tokens this turn adds to the prompt context (counted once, then memoized)."""
+        if self._token_count is None:
+            self._token_count = count_tokens("\n".join(self.context_lines()))
+        return self._token_count
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage."""
-        return {
-            "user_transcript": self.user_transcript,
-            "correction": self.tutor_response.correction,
-            "explanation": self.tutor_response.explanation,
-            "improved_version": self.tutor_response.improved_version,
-            "follow_up_question": self.tutor_response.follow_up_question,
-            "errors_count": len(self.tutor_response.errors_detected),
-            "timestamp": self.timestamp.isoformat(),
-        }
-
-
-@dataclass
+        return dict(self._export())
+
+    def _export(self) -> Dict:
+        """
+        Storage dict for this turn, built once and memoized.
+
+        A stored turn does not change, so repeated session exports only pay
+        for new turns. Callers must not mutate the returned dict.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "user_transcript": self.user_transcript,
+                "correction": self.tutor_response.correction,
+                "explanation": self.tutor_response.explanation,
+                "improved_version": self.tutor_response.improved_version,
+                "follow_up_question": self.tutor_response.follow_up_question,
+                "errors_count": len(self.tutor_response.errors_detected),
+                "timestamp": self.timestamp.isoformat(),
+            }
+        return self._cached_dict
+
+
+@dataclass(slots=True)
 class ConversationSession:
     """Represents a conversation practice session."""
     session_id: str
@@ -77,34 +124,62 @@ class ConversationSession:
     topic: str
     level: str
     mode: ConversationMode
-    history: List[ConversationTurn] = field(default_factory=list)
+    # A list keeps every turn; a deque(maxlen=N) keeps only the last N (see keep_full_history)
+    history: Union[List[ConversationTurn], Deque[ConversationTurn]] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
     status: str = "active"  # active, completed
+    anchor_size: int = 0  # Number of opening turns kept as the cache anchor
+    _anchor: List[ConversationTurn] = field(default_factory=list, init=False, repr=False, compare=False)
+    _total_errors: int = field(default=0, init=False, repr=False, compare=False)
+    _turn_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Running totals, maintained by add_turn so get_stats is O(1) and
+        # stays correct when a bounded history drops old turns
+        self._total_errors = sum(
+            len(turn.tutor_response.errors_detected)
+            for turn in self.history
+        )
+        self._turn_count = len(self.history)
+        self._anchor = list(itertools.islice(self.history, self.anchor_size))
 
     def add_turn(self, turn: ConversationTurn):
         """Add a turn to the conversation history."""
         self.history.append(turn)
+        if len(self._anchor) < self.anchor_size:
+            self._anchor.append(turn)
+        self._total_errors += len(turn.tutor_response.errors_detected)
+        self._turn_count += 1
         self.last_activity = datetime.now()
 
     def get_recent_history(self, max_turns: int = 5) -> List[ConversationTurn]:
         """Get recent conversation history for context."""
+        if isinstance(self.history, deque):
+            start = max(0, len(self.history) - max_turns)
+            return list(itertools.islice(self.history, start, None))
         return self.history[-max_turns:] if len(self.history) > max_turns else self.history
 
+    def get_cache_anchor(self) -> Tuple[ConversationTurn, ...]:
+        """
+        Opening turns of the session (up to anchor_size), never reordered or
+        dropped, even once a bounded history has evicted them. Prompts that
+        start with these keep a stable prefix for provider prompt caching.
+        """
+        return tuple(self._anchor)
+
     def get_stats(self) -> Dict:
         """Calculate session statistics."""
-        total_errors = sum(
-            len(turn.tutor_response.errors_detected)
-            for turn in self.history
-        )
+        total_errors = self._total_errors
+        total_turns = self._turn_count
 
         duration_minutes = (self.last_activity - self.started_at).total_seconds() / 60
 
         return {
             "session_id": self.session_id,
-            "total_turns": len(self.history),
+            "total_turns": total_turns,
             "total_errors": total_errors,
-            "avg_errors_per_turn": round(total_errors / len(self.history), 2) if self.history else 0,
+            "avg_errors_per_turn": round(total_errors / total_turns, 2) if total_turns else 0,
             "duration_minutes": round(duration_minutes, 1),
             "topic": self.topic,
             "level": self.level,
@@ -114,15 +189,33 @@ class ConversationSession:
 
     def to_dict(self) -> Dict:
         """Export session to dictionary for storage."""
+        return self._export(isoformat=True)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Export session as UTF-8 JSON (same shape as to_dict).
+
+        Uses orjson when installed, which encodes the datetimes in C
+        instead of calling isoformat() per turn.
+        """
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(self.to_dict()).encode("utf-8")
+        return orjson.dumps(self._export(isoformat=False))
+
+    def _export(self, isoformat: bool) -> Dict:
+        """Build the export dict; datetimes stay native when isoformat is False."""
         return {
             "session_id": self.session_id,
             "user_id": self.user_id,
             "topic": self.topic,
             "level": self.level,
             "mode": self.mode.value,
-            "started_at": self.started_at.isoformat(),
-            "last_activity": self.last_activity.isoformat(),
+            "started_at": self.started_at.isoformat() if isoformat else self.started_at,
+            "last_activity": self.last_activity.isoformat() if isoformat else self.last_activity,
             "status": self.status,
-            "history": [turn.to_dict() for turn in self.history],
+            # to_dict hands out copies; the JSON path can serialize the memoized dicts directly
+            "history": [turn.to_dict() if isoformat else turn._export() for turn in self.history],
             "stats": self.get_stats(),
         }
@@ -5,8 +5,11 @@ Provides structured prompts for LLM-based conversation tutoring.
 Migrated from prompt_templates.py to follow DDD architecture.
 """
 
-from typing import List, Optional, Dict
-from .models import ConversationTurn, ConversationConfig, ConversationMode
+import functools
+import re
+import sys
+from typing import List, Optional, Dict, Sequence
+from .models import ConversationTurn, ConversationConfig, ConversationMode, TutorResponse
 
 
 class PromptBuilder:
@@ -74,12 +77,38 @@ Focus area: {focus_area}
 Pay special attention to errors related to: {focus_area}
 Provide targeted practice in this area through your questions."""
 
+    # Closing block of every user prompt; a single template instead of per-turn line lists
+    CURRENT_TURN_TEMPLATE = (
+        "Student's current message:\n"
+        '"{user_transcript}"\n'
+        "\n"
+        "Please analyze and respond following the format above."
+    )
+
+    # Section marker name -> parsed result key (interned: used as dict keys on every parse)
+    _SECTION_KEYS = {
+        sys.intern(name): sys.intern(key)
+        for name, key in (
+            ("CORRECTION", "correction"),
+            ("EXPLANATION", "explanation"),
+            ("IMPROVED VERSION", "improved_version"),
+            ("FOLLOW UP QUESTION", "follow_up_question"),
+            ("ERRORS FOUND", "errors_found"),  # For exam mode
+        )
+    }
+
+    # Matches "[MARKER]" plus an optional trailing colon, e.g. "[FOLLOW UP QUESTION]: "
+    _SECTION_RE = re.compile(
+        r"\[(" + "|".join(re.escape(name) for name in _SECTION_KEYS) + r")\]\s*:?\s*"
+    )
+
     @classmethod
     def build_prompt(
         cls,
         user_transcript: str,
         conversation_history: List[ConversationTurn],
         config: ConversationConfig,
+        anchor: Sequence[ConversationTurn] = (),
     ) -> Dict[str, str]:
         """
         Build complete prompt for conversation tutor.
@@ -88,74 +117,167 @@ Provide targeted practice in this area through your questions."""
             user_transcript: What the user just said
             conversation_history: Previous conversation turns
             config: Conversation configuration
+            anchor: Opening turns to always keep first (see ConversationSession.get_cache_anchor)
 
         Returns:
             Dict with 'system' and 'user' prompt sections
         """
-        # Build system prompt based on mode
-        if config.mode == ConversationMode.PRACTICE:
-            system_prompt = cls.PRACTICE_MODE_SYSTEM.format(user_level=config.user_level)
-        else:  # EXAM mode
-            system_prompt = cls.EXAM_MODE_SYSTEM.format(user_level=config.user_level)
-
-        # Add topic if specified
-        if config.topic:
-            system_prompt += cls.TOPIC_ADDITION.format(topic=config.topic)
-
-        # Add focus area if specified
-        if config.focus_area:
-            system_prompt += cls.FOCUS_AREA_ADDITION.format(focus_area=config.focus_area)
+        system_prompt = cls.build_system_prompt(config)
 
         # Build user prompt with conversation history
-        user_prompt = cls._build_user_prompt(user_transcript, conversation_history, config)
+        user_prompt = cls._build_user_prompt(user_transcript, conversation_history, config, anchor)
 
         return {
             "system": system_prompt,
             "user": user_prompt,
         }
 
+    @classmethod
+    def build_system_prompt(cls, config: ConversationConfig) -> str:
+        """
+        Build the system prompt for a configuration.
+
+        The system prompt is invariant across the turns of a session, so it
+        is rendered once per (mode, level, topic, focus area) and memoized.
+
+        Args:
+            config: Conversation configuration
+
+        Returns:
+            Rendered system prompt
+        """
+        return cls._render_system_prompt(
+            config.mode, config.user_level, config.topic, config.focus_area
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _render_system_prompt(
+        cls,
+        mode: ConversationMode,
+        user_level: str,
+        topic: Optional[str],
+        focus_area: Optional[str],
+    ) -> str:
+        """Render (uncached) system prompt; see build_system_prompt."""
+        # Build system prompt based on mode
+        if mode == ConversationMode.PRACTICE:
+            parts = [cls.PRACTICE_MODE_SYSTEM.format(user_level=user_level)]
+        else:  # EXAM mode
+            parts = [cls.EXAM_MODE_SYSTEM.format(user_level=user_level)]
+
+        # Add topic if specified
+        if topic:
+            parts.append(cls.TOPIC_ADDITION.format(topic=topic))
+
+        # Add focus area if specified
+        if focus_area:
+            parts.append(cls.FOCUS_AREA_ADDITION.format(focus_area=focus_area))
+
+        return "".join(parts)
+
     @classmethod
     def _build_user_prompt(
         cls,
         user_transcript: str,
         conversation_history: List[ConversationTurn],
         config: ConversationConfig,
+        anchor: Sequence[ConversationTurn] = (),
     ) -> str:
         """
         Build user prompt with conversation context.
 
+        Ordering matters for provider prompt caching, which keys on the
+        longest identical prefix: the static system prompt is sent first,
+        then frozen history (append-only, deterministic lines), and the new
+        user turn strictly last. Nothing per-call (timestamps, counters) may
+        appear before the current turn.
+
         Args:
             user_transcript: Current user input
             conversation_history: Previous turns
             config: Configuration
+            anchor: Opening turns to always keep first
 
         Returns:
             Formatted user prompt
         """
-        parts = []
+        parts = cls._history_block(conversation_history, config, anchor)
+        parts.append(cls._current_turn_text(user_transcript))
+        return "\n".join(parts)
 
-        # Add conversation history (last N turns for context)
-        if conversation_history:
-            parts.append("Recent conversation context:")
+    @classmethod
+    def _history_block(
+        cls,
+        conversation_history: List[ConversationTurn],
+        config: ConversationConfig,
+        anchor: Sequence[ConversationTurn] = (),
+    ) -> List[str]:
+        """
+        Prompt lines for prior turns (empty when there is no history).
 
-            # Get last N turns based on config
-            recent_turns = conversation_history[-config.max_history_turns:]
+        Anchor turns come first under their own heading and are never
+        trimmed, so the start of the prompt stays byte-identical as the
+        conversation grows; only the recent tail is budgeted and trimmed.
+        """
+        if not conversation_history and not anchor:
+            return []
 
+        parts = []
+        budget = config.max_prompt_tokens
+        if anchor:
+            parts.append("Conversation opening:")
+            for turn in anchor:
+                parts.extend(turn.context_lines())
+                budget -= turn.token_count()
+            parts.append("")
+
+        # Get last N turns based on config, then trim oldest to fit the token budget
+        anchor_ids = {id(turn) for turn in anchor}
+        recent_turns = cls._fit_token_budget(
+            [
+                turn for turn in conversation_history[-config.max_history_turns:]
+                if id(turn) not in anchor_ids
+            ],
+            max(budget, 0),
+        )
+
+        if recent_turns:
+            parts.append("Recent conversation context:")
             for turn in recent_turns:
-                parts.append(f"Student: {turn.user_transcript}")
-                # Only include follow-up question from tutor response
-                if turn.tutor_response.follow_up_question:
-                    parts.append(f"Tutor: {turn.tutor_response.follow_up_question}")
-
+                # Lines are formatted once per turn and reused on later calls
+                parts.extend(turn.context_lines())
             parts.append("")  # Blank line
+        return parts
 
-        # Add current user input
-        parts.append("Student's current message:")
-        parts.append(f'"{user_transcript}"')
-        parts.append("")
-        parts.append("Please analyze and respond following the format above.")
+    @classmethod
+    def _current_turn_text(cls, user_transcript: str) -> str:
+        """Prompt text for the new user turn (always last)."""
+        return cls.CURRENT_TURN_TEMPLATE.format_map({"user_transcript": user_transcript})
+
+    @staticmethod
+    def _fit_token_budget(
+        turns: List[ConversationTurn],
+        max_tokens: int,
+    ) -> List[ConversationTurn]:
+        """
+        Keep the most recent turns whose context fits in max_tokens.
 
-        return "\n".join(parts)
+        Args:
+            turns: Candidate turns, oldest first
+            max_tokens: Token budget for the history section
+
+        Returns:
+            Suffix of turns that fits the budget (oldest first)
+        """
+        used = 0
+        start = len(turns)
+        for i in range(len(turns) - 1, -1, -1):
+            used += turns[i].token_count()
+            if used > max_tokens:
+                break
+            start = i
+        return turns[start:]
 
     @classmethod
     def parse_llm_response(cls, llm_text: str) -> Dict[str, str]:
@@ -182,60 +304,68 @@ Provide targeted practice in this area through your questions."""
             "errors_detected": [],
         }
 
-        # Define section markers
-        sections = {
-            "[CORRECTION]": "correction",
-            "[EXPLANATION]": "explanation",
-            "[IMPROVED VERSION]": "improved_version",
-            "[FOLLOW UP QUESTION]": "follow_up_question",
-            "[ERRORS FOUND]": "errors_found",  # For exam mode
-        }
-
-        # Parse each section
-        for marker, key in sections.items():
-            if marker in llm_text:
-                # Extract text after marker until next marker or end
-                start = llm_text.find(marker) + len(marker)
-                end = len(llm_text)
-
-                # Find next marker
-                for other_marker in sections.keys():
-                    if other_marker != marker:
-                        next_pos = llm_text.find(other_marker, start)
-                        if next_pos != -1 and next_pos < end:
-                            end = next_pos
+        # Single pass: each marker's value runs until the next marker (or end)
+        matches = list(cls._SECTION_RE.finditer(llm_text))
+        seen = set()
+        for i, match in enumerate(matches):
+            key = cls._SECTION_KEYS[match.group(1)]
+            if key in seen:
+                continue  # First occurrence of a marker wins
+            seen.add(key)
 
-                value = llm_text[start:end].strip()
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(llm_text)
+            result[key] = llm_text[match.end():end].strip()
 
-                # Remove leading colon if present (e.g., "[FOLLOW UP QUESTION]: text")
-                if value.startswith(":"):
-                    value = value[1:].strip()
-
-                result[key] = value
+        correction = result["correction"]
 
         # Build full assistant response
         response_parts = []
 
-        if result.get("correction"):
-            response_parts.append(result["correction"])
+        if correction:
+            response_parts.append(correction)
 
-        if result.get("explanation"):
+        if result["explanation"]:
             response_parts.append(result["explanation"])
 
-        if result.get("improved_version"):
+        if result["improved_version"]:
             response_parts.append(f"Better way: {result['improved_version']}")
 
-        if result.get("follow_up_question"):
+        if result["follow_up_question"]:
             response_parts.append(result["follow_up_question"])
 
         result["assistant_response"] = "\n\n".join(response_parts)
 
         # Extract errors if mentioned
-        if "error" in result.get("correction", "").lower() or "mistake" in result.get("correction", "").lower():
-            result["errors_detected"].append(result["correction"])
+        correction_lower = correction.lower()
+        if "error" in correction_lower or "mistake" in correction_lower:
+            result["errors_detected"].append(correction)
 
         # Handle exam mode errors
         if result.get("errors_found"):
             result["errors_detected"].append(result["errors_found"])
 
         return result
+
+    @classmethod
+    def parse_tutor_response(cls, llm_text: str) -> TutorResponse:
+        """
+        Parse LLM output straight into a TutorResponse.
+
+        parse_llm_response always fills every field, so no per-field
+        defaults are needed here.
+
+        Args:
+            llm_text: Raw LLM output
+
+        Returns:
+            TutorResponse built from the parsed sections
+        """
+        parsed = cls.parse_llm_response(llm_text)
+        return TutorResponse(
+            correction=parsed["correction"],
+            explanation=parsed["explanation"],
+            improved_version=parsed["improved_version"],
+            follow_up_question=parsed["follow_up_question"],
+            errors_detected=parsed["errors_detected"],
+            assistant_response=parsed["assistant_response"],
+        )
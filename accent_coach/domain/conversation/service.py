@@ -5,8 +5,13 @@ Orchestrates conversation practice flow:
 Audio → ASR → LLM Feedback → TTS → Save
 """
 
-from typing import Optional
-from datetime import datetime
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Union
 
 from ..audio.models import AudioConfig, ProcessedAudio
 from ..transcription.models import ASRConfig, Transcription
@@ -19,6 +24,14 @@ from .models import (
 )
 from .prompts import PromptBuilder
 
+logger = logging.getLogger(__name__)
+
+# Fallback tutor reply when the LLM call fails
+_FALLBACK_EXPLANATION = "Error getting feedback: {error}"
+_FALLBACK_FOLLOW_UP = "Could you tell me more about that?"
+_FALLBACK_ASSISTANT = "I heard: '{transcript}'. Could you tell me more?"
+_FALLBACK_TRANSCRIPT_CHARS = 200
+
 
 class ConversationError(Exception):
     """Raised when conversation processing fails."""
@@ -42,12 +55,21 @@ class ConversationService:
     - Repository (optional) - Persistence
     """
 
+    # Marks the (memoized, turn-invariant) system prompt as a cacheable prefix
+    PROMPT_CACHE_HINTS = {"cache_control": {"type": "ephemeral"}}
+
+    # Follow-up TTS runs here, overlapped with persistence (shared across instances)
+    TTS_MAX_WORKERS = 4
+    _tts_executor: Optional[ThreadPoolExecutor] = None
+    _tts_executor_lock = threading.Lock()
+
     def __init__(
         self,
         audio_service,
         transcription_service,
         llm_service: LLMService,
         repository=None,
+        flush_threshold: int = 1,
     ):
         """
         Initialize ConversationService with required dependencies.
@@ -57,11 +79,17 @@ class ConversationService:
             transcription_service: TranscriptionService instance (BC2)
             llm_service: LLMService instance (BC6)
             repository: Optional ConversationRepository for persistence
+            flush_threshold: Turns buffered per session before one bulk
+                save_turns write (1 = save every turn immediately). Buffered
+                turns are flushed on close_session or flush_turns.
         """
         self._audio = audio_service
         self._transcription = transcription_service
         self._llm = llm_service
         self._repo = repository
+        self._flush_threshold = flush_threshold
+        self._pending_turns: Dict[str, List[ConversationTurn]] = {}
+        self._pending_lock = threading.Lock()
 
     def process_audio_turn(
         self,
@@ -75,8 +103,8 @@ class ConversationService:
         Pipeline:
         1. Audio → ASR (transcription)
         2. Transcript + History → LLM (feedback)
-        3. Follow-up question → TTS (audio)
-        4. Save turn (optional)
+        3. Follow-up question → TTS (audio), in the background or as a lazy stream
+        4. Save turn (optional) while TTS runs
 
         Args:
             audio_bytes: User's recorded audio
@@ -93,7 +121,8 @@ class ConversationService:
             # Step 1: Transcribe user speech
             user_transcript = self._transcribe_audio(audio_bytes, config)
 
-            if not user_transcript or user_transcript.strip() == "":
+            # _transcribe_audio strips whitespace, so an empty string is the only blank case
+            if not user_transcript:
                 raise ConversationError("Could not transcribe audio. Please try again.")
 
             # Step 2: Generate tutor feedback using LLM
@@ -101,35 +130,82 @@ class ConversationService:
                 user_transcript,
                 session.get_recent_history(config.max_history_turns),
                 config,
+                session=session,
             )
 
-            # Step 3: Generate TTS for follow-up question
-            follow_up_audio = None
+            # Step 3: Start TTS for follow-up question (streamed lazily, or in the background)
+            follow_up_future: Optional[Future] = None
+            follow_up_stream = None
             if config.generate_audio and tutor_response.follow_up_question:
-                follow_up_audio = self._generate_follow_up_audio(
-                    tutor_response.follow_up_question
-                )
-
-            # Step 4: Create conversation turn
+                if config.stream_audio:
+                    follow_up_stream = self._stream_follow_up_audio(
+                        tutor_response.follow_up_question
+                    )
+                else:
+                    follow_up_future = self._get_tts_executor().submit(
+                        self._generate_follow_up_audio,
+                        tutor_response.follow_up_question,
+                    )
+
+            # Step 4: Create conversation turn (audio is not persisted)
             turn = ConversationTurn(
                 user_transcript=user_transcript,
                 tutor_response=tutor_response,
-                follow_up_audio=follow_up_audio,
-                timestamp=datetime.now(),
+                follow_up_audio_stream=follow_up_stream,
             )
 
             # Step 5: Add to session
             session.add_turn(turn)
 
-            # Step 6: Save to repository (optional)
+            # Step 6: Save to repository (optional), overlapping with TTS
             if self._repo:
-                self._repo.save_turn(session.session_id, session.user_id, turn)
+                self._persist_turn(session, turn)
+
+            # Step 7: Attach follow-up audio once synthesized
+            if follow_up_future is not None:
+                turn.follow_up_audio = follow_up_future.result()
 
             return turn
 
         except Exception as e:
             raise ConversationError(f"Failed to process conversation turn: {str(e)}")
 
+    def _persist_turn(self, session: ConversationSession, turn: ConversationTurn) -> None:
+        """Save a turn now, or buffer it until the session's batch is full."""
+        if self._flush_threshold <= 1:
+            self._repo.save_turn(session.session_id, session.user_id, turn)
+            return
+
+        with self._pending_lock:
+            pending = self._pending_turns.setdefault(session.session_id, [])
+            pending.append(turn)
+            if len(pending) < self._flush_threshold:
+                return
+            turns = self._pending_turns.pop(session.session_id)
+
+        self._repo.save_turns(session.session_id, turns)
+
+    def flush_turns(self, session_id: Optional[str] = None) -> None:
+        """
+        Write buffered turns to the repository.
+
+        Args:
+            session_id: Session to flush (default: all sessions)
+        """
+        if not self._repo:
+            return
+
+        with self._pending_lock:
+            if session_id is None:
+                batches = self._pending_turns
+                self._pending_turns = {}
+            else:
+                turns = self._pending_turns.pop(session_id, None)
+                batches = {session_id: turns} if turns else {}
+
+        for batch_session_id, turns in batches.items():
+            self._repo.save_turns(batch_session_id, turns)
+
     def _transcribe_audio(self, audio_bytes: bytes, config: ConversationConfig) -> str:
         """
         Transcribe user's audio to text.
@@ -170,14 +246,19 @@ class ConversationService:
         user_transcript: str,
         conversation_history: list,
         config: ConversationConfig,
+        session: Optional[ConversationSession] = None,
     ) -> TutorResponse:
         """
         Generate tutor feedback using LLM.
 
+        When a session is given, its opening turns anchor the start of the
+        history so the prompt keeps a stable prefix for provider caching.
+
         Args:
             user_transcript: What the user said
             conversation_history: Previous turns for context
             config: Configuration with LLM settings
+            session: Optional session providing the cache anchor turns
 
         Returns:
             TutorResponse with corrections and follow-up
@@ -191,6 +272,7 @@ class ConversationService:
                 user_transcript,
                 conversation_history,
                 config,
+                anchor=session.get_cache_anchor() if session is not None else (),
             )
 
             # Call LLM
@@ -200,32 +282,39 @@ class ConversationService:
                 model=config.llm_model,
                 temperature=0.3,
                 max_tokens=500,
+                cache_hints=self.PROMPT_CACHE_HINTS,
             )
 
-            # Parse response
-            parsed = PromptBuilder.parse_llm_response(llm_output)
-
-            # Build TutorResponse
-            return TutorResponse(
-                correction=parsed.get("correction", ""),
-                explanation=parsed.get("explanation", ""),
-                improved_version=parsed.get("improved_version", ""),
-                follow_up_question=parsed.get("follow_up_question", "Could you tell me more?"),
-                errors_detected=parsed.get("errors_detected", []),
-                assistant_response=parsed.get("assistant_response", ""),
-            )
+            # Parse response into TutorResponse
+            return PromptBuilder.parse_tutor_response(llm_output)
 
         except Exception as e:
-            # Fallback response if LLM fails
+            # Fallback response if LLM fails. Only the exception type reaches the
+            # UI: str(e) can be expensive for SDK errors and leaks provider details.
+            logger.warning("Tutor feedback failed, using fallback response", exc_info=True)
             return TutorResponse(
                 correction="",
-                explanation=f"Error getting feedback: {str(e)}",
+                explanation=_FALLBACK_EXPLANATION.format(error=type(e).__name__),
                 improved_version=user_transcript,
-                follow_up_question="Could you tell me more about that?",
+                follow_up_question=_FALLBACK_FOLLOW_UP,
                 errors_detected=[],
-                assistant_response=f"I heard: '{user_transcript}'. Could you tell me more?",
+                assistant_response=_FALLBACK_ASSISTANT.format(
+                    transcript=user_transcript[:_FALLBACK_TRANSCRIPT_CHARS]
+                ),
             )
 
+    @classmethod
+    def _get_tts_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared follow-up TTS thread pool, creating it on first use."""
+        if cls._tts_executor is None:
+            with cls._tts_executor_lock:
+                if cls._tts_executor is None:
+                    cls._tts_executor = ThreadPoolExecutor(
+                        max_workers=cls.TTS_MAX_WORKERS,
+                        thread_name_prefix="conversation-tts",
+                    )
+        return cls._tts_executor
+
     def _generate_follow_up_audio(self, text: str) -> Optional[bytes]:
         """
         Generate TTS audio for follow-up question.
@@ -242,6 +331,25 @@ class ConversationService:
             # Non-fatal: user can still read the text
             return None
 
+    def _stream_follow_up_audio(self, text: str) -> Optional[Iterator[bytes]]:
+        """
+        Open a TTS stream for the follow-up question.
+
+        The iterator is lazy: synthesis starts when the caller begins
+        consuming chunks, so playback can start at time-to-first-chunk.
+
+        Args:
+            text: Follow-up question text
+
+        Returns:
+            Iterator of audio chunks or None if the stream cannot be opened
+        """
+        try:
+            return self._audio.generate_tts_stream(text)
+        except Exception:
+            # Non-fatal: user can still read the text
+            return None
+
     def create_session(
         self,
         user_id: str,
@@ -257,7 +365,11 @@ class ConversationService:
         Returns:
             New ConversationSession
         """
-        session_id = f"conv_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Epoch seconds + random suffix: no strftime, unique for same-second sessions
+        session_id = f"conv_{user_id}_{time.time_ns() // 1_000_000_000}_{secrets.token_hex(3)}"
+
+        # Full history by default; prompts only ever see the last max_history_turns
+        history = [] if config.keep_full_history else deque(maxlen=config.max_history_turns)
 
         session = ConversationSession(
             session_id=session_id,
@@ -265,23 +377,30 @@ class ConversationService:
             topic=config.topic or "General Conversation",
             level=config.user_level,
             mode=config.mode,
-            started_at=datetime.now(),
+            history=history,
+            anchor_size=config.history_anchor_turns,
         )
 
         # Session is created in-memory; turns will be saved via save_turn()
 
         return session
 
-    def close_session(self, session_id: str):
+    def close_session(self, session: Union[str, ConversationSession]):
         """
         Mark a session as completed.
 
         Args:
-            session_id: ID of session to close
+            session: Session (or ID of session) to close. Passing the session
+                also marks it completed.
         """
-        # Session closing handled in-memory by UI
-        # Repository persistence not needed for simple in-memory sessions
-        pass
+        # Session closing handled in-memory by UI; only buffered turns need writing
+        session_id = session.session_id if isinstance(session, ConversationSession) else session
+        self.flush_turns(session_id)
+
+        if not isinstance(session, ConversationSession):
+            return
+
+        session.status = "completed"
 
     def process_turn(
         self,
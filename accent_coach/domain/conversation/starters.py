@@ -114,6 +114,14 @@ class ConversationStarters:
         },
     }
 
+    # (topic, level) -> starters, flattened once so lookups are a single dict hit
+    _FLAT_STARTERS = {
+        (topic, level): tuple(starters)
+        for topic, levels in STARTERS_BY_TOPIC.items()
+        for level, starters in levels.items()
+    }
+    _TOPICS = tuple(STARTERS_BY_TOPIC)
+
     @classmethod
     def get_starter(cls, topic: str, level: str = "B1-B2") -> str:
         """
@@ -126,18 +134,20 @@ class ConversationStarters:
         Returns:
             Conversation starter question
         """
-        # Get topic starters, default to General Conversation
-        topic_starters = cls.STARTERS_BY_TOPIC.get(
-            topic, cls.STARTERS_BY_TOPIC["General Conversation"]
-        )
+        level_starters = cls._FLAT_STARTERS.get((topic, level))
 
-        # Get level starters, default to B1-B2
-        level_starters = topic_starters.get(level, topic_starters.get("B1-B2", []))
+        if level_starters is None:
+            # Default to General Conversation, then to B1-B2
+            if topic not in cls.STARTERS_BY_TOPIC:
+                topic = "General Conversation"
+            level_starters = cls._FLAT_STARTERS.get(
+                (topic, level), cls._FLAT_STARTERS.get((topic, "B1-B2"), ())
+            )
 
         if not level_starters:
             return "Tell me about your day."
 
-        return random.choice(level_starters)
+        return level_starters[random.randrange(len(level_starters))]
 
     @classmethod
     def get_topics(cls) -> List[str]:
@@ -147,7 +157,7 @@ class ConversationStarters:
         Returns:
             List of topic names
         """
-        return list(cls.STARTERS_BY_TOPIC.keys())
+        return list(cls._TOPICS)
 
     @classmethod
     def get_levels(cls) -> List[str]:
@@ -0,0 +1,46 @@
+"""
+Token counting for prompt budgeting
+
+Uses tiktoken (Rust BPE) when installed; otherwise falls back to a
+~4 characters-per-token estimate, which is close enough for trimming
+conversation history to a budget.
+"""
+
+import functools
+from typing import Optional
+
+
+# Encoding used for budgeting; the Groq-hosted models have their own
+# tokenizers, so this is an approximation either way.
+TIKTOKEN_ENCODING = "cl100k_base"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder() -> Optional[object]:
+    """Load the tiktoken encoder once (None if tiktoken is unavailable)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    except Exception:
+        # Not installed, or the encoding could not be downloaded
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count (or estimate) the number of LLM tokens in text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+
+    return (len(text) + 3) // 4
@@ -12,9 +12,11 @@ Dependencies: BC6 (LLM)
 
 from .service import LanguageQueryService
 from .models import QueryResult, QueryConfig, QueryCategory
+from .cache import SemanticCache
 
 __all__ = [
     "LanguageQueryService",
+    "SemanticCache",
     "QueryResult",
     "QueryConfig",
     "QueryCategory",
@@ -0,0 +1,168 @@
+"""
+Response cache for language queries
+
+Returns a previous answer when a new query repeats one already answered,
+skipping the LLM round trip. By default queries match only when their
+normalized text is identical (casing, punctuation and spacing ignored);
+near-duplicate matching is opt-in and needs a real sentence-embedding
+model, since surface similarity cannot tell "I am agree" from "I agree".
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import QueryResult
+
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """
+    Normalize a query for exact-match caching.
+
+    Casefolds, turns punctuation into spaces and collapses whitespace, so
+    "Is 'touch base' common?" and "is touch base common" share a key while
+    any change of wording does not.
+
+    Args:
+        text: User query
+
+    Returns:
+        Normalized query text
+    """
+    return _SPACE_RE.sub(" ", _NON_WORD_RE.sub(" ", text.casefold())).strip()
+
+
+class SemanticCache:
+    """
+    In-process cache of QueryResults.
+
+    Without an embed_fn, entries are keyed on normalize_query(). With one,
+    embeddings live in one preallocated (capacity, dim) matrix so a lookup
+    is a single matrix-vector product against the similarity threshold.
+    Entries expire after a TTL and the least recently used slot is reused
+    when the cache is full.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], np.ndarray]] = None,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+    ):
+        """
+        Args:
+            embed_fn: Maps text to an L2-normalized sentence embedding; enables
+                near-duplicate matching (None: exact normalized-text matching)
+            threshold: Minimum cosine similarity for a hit (embed_fn only)
+            max_entries: Maximum number of cached results
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self._embed = embed_fn
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+
+        self._keys: Dict[Tuple[str, str], int] = {}  # (namespace, normalized query) -> slot
+        self._slot_keys: List[Optional[Tuple[str, str]]] = [None] * max_entries
+        self._vectors: Optional[np.ndarray] = None  # (max_entries, dim), allocated on first store
+        self._results: List[Optional[QueryResult]] = [None] * max_entries
+        self._namespaces: List[Optional[str]] = [None] * max_entries
+        self._expires_at = np.zeros(max_entries, dtype=np.float64)
+        self._last_used = np.zeros(max_entries, dtype=np.float64)
+
+    def lookup(self, query: str, namespace: str = "") -> Optional[QueryResult]:
+        """
+        Find a cached result for a repeated query.
+
+        Args:
+            query: User query
+            namespace: Partition key (e.g. LLM model name)
+
+        Returns:
+            Cached QueryResult, or None on a miss
+        """
+        if self._embed is None:
+            key = (namespace, normalize_query(query))
+            now = time.monotonic()
+            with self._lock:
+                slot = self._keys.get(key)
+                if slot is None or self._expires_at[slot] <= now:
+                    return None
+                self._last_used[slot] = now
+                return self._results[slot]
+
+        if self._vectors is None:
+            return None
+
+        query_vector = self._embed(query)
+        now = time.monotonic()
+
+        with self._lock:
+            similarities = self._vectors @ query_vector
+            similarities[self._expires_at <= now] = -1.0
+            for i, entry_namespace in enumerate(self._namespaces):
+                if entry_namespace != namespace:
+                    similarities[i] = -1.0
+
+            best = int(np.argmax(similarities))
+            if similarities[best] < self._threshold:
+                return None
+
+            self._last_used[best] = now
+            return self._results[best]
+
+    def store(self, query: str, result: QueryResult, namespace: str = "") -> None:
+        """
+        Cache a result, evicting an expired or least recently used entry if full.
+
+        Args:
+            query: User query the result answers
+            result: Result to cache
+            namespace: Partition key (e.g. LLM model name)
+        """
+        key = (namespace, normalize_query(query))
+        query_vector = self._embed(query) if self._embed is not None else None
+        now = time.monotonic()
+
+        with self._lock:
+            slot = self._keys.get(key)
+            if slot is None:
+                # Empty/expired slots have expires_at <= now; otherwise evict LRU
+                expired = np.flatnonzero(self._expires_at <= now)
+                slot = int(expired[0]) if expired.size else int(np.argmin(self._last_used))
+                old_key = self._slot_keys[slot]
+                if old_key is not None:
+                    del self._keys[old_key]
+                self._keys[key] = slot
+                self._slot_keys[slot] = key
+
+            if query_vector is not None:
+                if self._vectors is None:
+                    self._vectors = np.zeros((self._max_entries, query_vector.shape[0]), dtype=np.float32)
+                self._vectors[slot] = query_vector
+            self._results[slot] = result
+            self._namespaces[slot] = namespace
+            self._expires_at[slot] = now + self._ttl
+            self._last_used[slot] = now
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._expires_at[:] = 0.0
+            self._last_used[:] = 0.0
+            self._keys = {}
+            self._slot_keys = [None] * self._max_entries
+            self._results = [None] * self._max_entries
+            self._namespaces = [None] * self._max_entries
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._expires_at > time.monotonic()))
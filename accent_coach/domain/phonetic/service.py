@@ -82,12 +82,10 @@ class PhoneticAnalysisService:
             if match:
                 phoneme_accuracy = 100.0
             else:
-                # Simple character-level accuracy
-                ref_chars = list(ref_ph) if ref_ph else []
-                rec_chars = list(rec_ph) if rec_ph else []
-                if len(ref_chars) > 0:
-                    correct = sum(1 for r, p in zip(ref_chars, rec_chars) if r == p)
-                    phoneme_accuracy = (correct / len(ref_chars)) * 100
+                # Simple character-level accuracy (zips the strings directly)
+                if ref_ph:
+                    correct = sum(r == p for r, p in zip(ref_ph, rec_ph or ""))
+                    phoneme_accuracy = (correct / len(ref_ph)) * 100
                 else:
                     phoneme_accuracy = 0.0
 
@@ -108,7 +106,9 @@ class PhoneticAnalysisService:
                 phoneme_accuracy=phoneme_accuracy
             ))
 
-        # Step 5: Calculate overall metrics
+        # Step 5: Calculate overall metrics. Counts are character-level on
+        # purpose and cannot be read off the step 3 alignment, which is
+        # per phoneme token and drops insertions between words.
         metrics_dict = MetricsCalculator.calculate_metrics(per_word_comparison_dict)
 
         metrics = PronunciationMetrics(
@@ -151,8 +151,8 @@ class PhoneticAnalysisService:
         Returns:
             List of words that need practice
         """
-        drill_words = []
-        for word_data in alignment:
-            if not word_data.match or word_data.phoneme_accuracy < 80:
-                drill_words.append(word_data.word)
-        return drill_words
+        return [
+            word_data.word
+            for word_data in alignment
+            if not word_data.match or word_data.phoneme_accuracy < 80
+        ]
@@ -5,11 +5,34 @@ Manages practice texts for pronunciation training.
 Migrated from root practice_texts.py with enhancements.
 """
 
-from typing import Dict, List, Optional
+import random
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# Difficulty inferred from category when a PracticeText does not set one
+_DIFFICULTY_BY_CATEGORY: Dict[str, str] = {
+    "Beginner": "Easy",
+    "Intermediate": "Medium",
+    "Advanced": "Hard",
+    "Common Phrases": "Easy",
+    "Idioms": "Medium",
+    "Business English": "Medium",
+    "Tongue Twisters": "Hard"
+}
+
+
+# Level reported by get_text_metadata: level categories map to themselves
+_LEVEL_CATEGORIES = frozenset({"Beginner", "Intermediate", "Advanced"})
+_LEVEL_BY_CATEGORY: Dict[str, str] = {
+    "Tongue Twisters": "Advanced",
+    "Common Phrases": "Beginner",
+    "Business English": "Intermediate",
+    "Idioms": "Intermediate",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PracticeText:
     """Represents a practice text with metadata."""
     text: str
@@ -19,23 +42,60 @@ class PracticeText:
     word_count: Optional[int] = None
 
     def __post_init__(self):
-        """Calculate word count and set defaults if not provided."""
+        # Frozen: derived fields are filled in via object.__setattr__
         if self.word_count is None:
-            self.word_count = len(self.text.split())
+            object.__setattr__(self, "word_count", len(self.text.split()))
         if self.focus is None:
-            self.focus = "General practice"
+            object.__setattr__(self, "focus", "General practice")
         if self.difficulty is None:
             # Infer difficulty from category if not set
-            difficulty_map = {
-                "Beginner": "Easy",
-                "Intermediate": "Medium",
-                "Advanced": "Hard",
-                "Common Phrases": "Easy",
-                "Idioms": "Medium",
-                "Business English": "Medium",
-                "Tongue Twisters": "Hard"
-            }
-            self.difficulty = difficulty_map.get(self.category, "Medium")
+            object.__setattr__(
+                self, "difficulty", _DIFFICULTY_BY_CATEGORY.get(self.category, "Medium")
+            )
+
+
+def _compile_practice_texts(
+    texts: Dict[str, List[str]], focus_by_category: Dict[str, str]
+) -> Dict[str, Tuple[PracticeText, ...]]:
+    """Build the PracticeText objects for every category once."""
+    return {
+        category: tuple(
+            PracticeText(
+                text=text,
+                category=category,
+                difficulty=None,  # Will be auto-set in __post_init__
+                focus=focus_by_category.get(category, "General practice")
+            )
+            for text in category_texts
+        )
+        for category, category_texts in texts.items()
+    }
+
+
+def _build_trigram_index(lowered_texts: Tuple[str, ...]) -> Dict[str, Tuple[int, ...]]:
+    """Map each character trigram to the (ordered) indices of texts containing it."""
+    postings: Dict[str, List[int]] = {}
+    for idx, text in enumerate(lowered_texts):
+        for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+            postings.setdefault(gram, []).append(idx)
+    return {gram: tuple(indices) for gram, indices in postings.items()}
+
+
+def _build_category_info(
+    texts: Dict[str, List[str]], descriptions: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """Compute count, description and average word count per category."""
+    return {
+        category: {
+            'count': len(category_texts),
+            'description': descriptions.get(category, ""),
+            'avg_words': (
+                sum(len(text.split()) for text in category_texts) / len(category_texts)
+                if category_texts else 0
+            ),
+        }
+        for category, category_texts in texts.items()
+    }
 
 
 class PracticeTextManager:
@@ -133,6 +193,44 @@ class PracticeTextManager:
         ],
     }
 
+    _FOCUS_BY_CATEGORY: Dict[str, str] = {
+        "Beginner": "Basic vocabulary and simple sentences",
+        "Intermediate": "Common expressions and conversations",
+        "Advanced": "Complex grammar and vocabulary",
+        "Common Phrases": "Practical daily phrases",
+        "Idioms": "Idiomatic expressions",
+        "Business English": "Professional communication",
+        "Tongue Twisters": "Pronunciation clarity and speed"
+    }
+
+    # TEXTS is constant, so PracticeText objects are built once at import
+    _COMPILED: Dict[str, Tuple[PracticeText, ...]] = _compile_practice_texts(
+        TEXTS, _FOCUS_BY_CATEGORY
+    )
+    _ALL_COMPILED: Tuple[PracticeText, ...] = tuple(
+        practice_text for group in _COMPILED.values() for practice_text in group
+    )
+
+    _CATEGORY_DESCRIPTIONS: Dict[str, str] = {
+        "Beginner": "Simple, short sentences perfect for starting learners",
+        "Intermediate": "Everyday conversations and common expressions",
+        "Advanced": "Complex sentences with sophisticated vocabulary",
+        "Common Phrases": "Practical phrases for daily interactions",
+        "Idioms": "English idioms and expressions",
+        "Business English": "Professional communication phrases",
+        "Tongue Twisters": "Challenging phrases for pronunciation practice"
+    }
+    _CATEGORY_INFO: Dict[str, Dict[str, Any]] = _build_category_info(
+        TEXTS, _CATEGORY_DESCRIPTIONS
+    )
+    _TOTAL_TEXT_COUNT: int = len(_ALL_COMPILED)
+
+    # Substring search index: lowercased texts plus a trigram inverted index
+    _ALL_LOWERED: Tuple[str, ...] = tuple(
+        practice_text.text.lower() for practice_text in _ALL_COMPILED
+    )
+    _TRIGRAM_INDEX: Dict[str, Tuple[int, ...]] = _build_trigram_index(_ALL_LOWERED)
+
     @classmethod
     def get_categories(cls) -> List[str]:
         """
@@ -152,32 +250,15 @@ class PracticeTextManager:
             category: Category name
             
         Returns:
-            List of PracticeText objects for the category
+            List of PracticeText objects for the category (shared and
+            immutable, built once at import)
         """
-        texts = cls.TEXTS.get(category, [])
-        return [
-            PracticeText(
-                text=text,
-                category=category,
-                difficulty=None,  # Will be auto-set in __post_init__
-                focus=cls._get_focus_for_category(category)
-            )
-            for text in texts
-        ]
-    
+        return list(cls._COMPILED.get(category, ()))
+
     @classmethod
     def _get_focus_for_category(cls, category: str) -> str:
         """Get focus area for a category."""
-        focus_map = {
-            "Beginner": "Basic vocabulary and simple sentences",
-            "Intermediate": "Common expressions and conversations",
-            "Advanced": "Complex grammar and vocabulary",
-            "Common Phrases": "Practical daily phrases",
-            "Idioms": "Idiomatic expressions",
-            "Business English": "Professional communication",
-            "Tongue Twisters": "Pronunciation clarity and speed"
-        }
-        return focus_map.get(category, "General practice")
+        return cls._FOCUS_BY_CATEGORY.get(category, "General practice")
 
     @classmethod
     def get_all_texts(cls) -> Dict[str, List[str]]:
@@ -201,7 +282,7 @@ class PracticeTextManager:
         Returns:
             PracticeText object or None if not found
         """
-        texts = cls.get_texts_for_category(category)
+        texts = cls._COMPILED.get(category, ())
         if 0 <= index < len(texts):
             return texts[index]
         return None
@@ -219,15 +300,10 @@ class PracticeTextManager:
             PracticeText object with metadata
         """
         # Determine difficulty based on category
-        difficulty = None
-        if category in ["Beginner", "Intermediate", "Advanced"]:
+        if category in _LEVEL_CATEGORIES:
             difficulty = category
-        elif category == "Tongue Twisters":
-            difficulty = "Advanced"
-        elif category == "Common Phrases":
-            difficulty = "Beginner"
-        elif category in ["Business English", "Idioms"]:
-            difficulty = "Intermediate"
+        else:
+            difficulty = _LEVEL_BY_CATEGORY.get(category)
 
         return PracticeText(
             text=text,
@@ -246,21 +322,35 @@ class PracticeTextManager:
         Returns:
             List of PracticeText objects matching the query
         """
-        results = []
         query_lower = query.lower()
-        
-        for category, texts in cls.TEXTS.items():
-            for text in texts:
-                if query_lower in text.lower():
-                    results.append(
-                        PracticeText(
-                            text=text,
-                            category=category,
-                            focus=cls._get_focus_for_category(category)
-                        )
-                    )
-        
-        return results
+        candidates = cls._search_candidates(query_lower)
+        return [
+            cls._ALL_COMPILED[idx]
+            for idx in candidates
+            if query_lower in cls._ALL_LOWERED[idx]
+        ]
+
+    @classmethod
+    def _search_candidates(cls, query_lower: str) -> List[int]:
+        """
+        Indices of texts that contain every trigram of the query, in order.
+
+        A superset of the substring matches; search_texts verifies each one.
+        Queries shorter than a trigram fall back to scanning every text.
+        """
+        if len(query_lower) < 3:
+            return list(range(len(cls._ALL_COMPILED)))
+
+        grams = {query_lower[i:i + 3] for i in range(len(query_lower) - 2)}
+        postings = sorted((cls._TRIGRAM_INDEX.get(gram, ()) for gram in grams), key=len)
+
+        # Intersect shortest-first so the working set shrinks fastest
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return sorted(candidates)
 
     @classmethod
     def get_random_text(cls, category: Optional[str] = None) -> Optional[PracticeText]:
@@ -273,17 +363,8 @@ class PracticeTextManager:
         Returns:
             Random PracticeText object
         """
-        import random
-        
-        if category:
-            texts = cls.get_texts_for_category(category)
-            return random.choice(texts) if texts else None
-        else:
-            # Get all texts as PracticeText objects
-            all_texts = []
-            for cat in cls.get_categories():
-                all_texts.extend(cls.get_texts_for_category(cat))
-            return random.choice(all_texts) if all_texts else None
+        texts = cls._COMPILED.get(category, ()) if category else cls._ALL_COMPILED
+        return random.choice(texts) if texts else None
 
     @classmethod
     def get_total_text_count(cls) -> int:
@@ -293,7 +374,7 @@ class PracticeTextManager:
         Returns:
             Total count of texts
         """
-        return sum(len(texts) for texts in cls.TEXTS.values())
+        return cls._TOTAL_TEXT_COUNT
 
     @classmethod
     def get_category_info(cls, category: Optional[str] = None) -> Dict[str, any]:
@@ -307,33 +388,8 @@ class PracticeTextManager:
             Dictionary with category stats. If category specified, returns single dict.
             If category is None, returns dict of all categories.
         """
-        category_descriptions = {
-            "Beginner": "Simple, short sentences perfect for starting learners",
-            "Intermediate": "Everyday conversations and common expressions",
-            "Advanced": "Complex sentences with sophisticated vocabulary",
-            "Common Phrases": "Practical phrases for daily interactions",
-            "Idioms": "English idioms and expressions",
-            "Business English": "Professional communication phrases",
-            "Tongue Twisters": "Challenging phrases for pronunciation practice"
-        }
-        
+        # Stats are precomputed; copies keep callers from editing the cache
         if category:
-            # Return info for specific category
-            if category not in cls.TEXTS:
-                return {}
-            texts = cls.TEXTS[category]
-            return {
-                'count': len(texts),
-                'description': category_descriptions.get(category, ""),
-                'avg_words': sum(len(text.split()) for text in texts) / len(texts) if texts else 0
-            }
-        else:
-            # Return info for all categories
-            info = {}
-            for cat, texts in cls.TEXTS.items():
-                info[cat] = {
-                    'count': len(texts),
-                    'description': category_descriptions.get(cat, ""),
-                    'avg_words': sum(len(text.split()) for text in texts) / len(texts) if texts else 0
-                }
-            return info
+            info = cls._CATEGORY_INFO.get(category)
+            return dict(info) if info else {}
+        return {cat: dict(info) for cat, info in cls._CATEGORY_INFO.items()}
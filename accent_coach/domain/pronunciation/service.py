@@ -3,11 +3,15 @@ Pronunciation Practice Service (BC4)
 """
 
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, Tuple
 from .models import PracticeConfig, PracticeResult
 from ..audio.models import AudioConfig
 from ..transcription.models import ASRConfig
 
+# (word, match) from a WordComparison, fetched in one C-level call
+_WORD_AND_MATCH = attrgetter('word', 'match')
+
 
 class PronunciationError(Exception):
     """Raised when pronunciation practice fails."""
@@ -55,6 +59,9 @@ class PronunciationPracticeService:
         self._llm = llm_service
         self._repo = repository
 
+        # Last (key, AudioConfig, ASRConfig) derived from a PracticeConfig
+        self._derived_configs = None
+
     def analyze_recording(
         self,
         audio_bytes: bytes,
@@ -90,19 +97,12 @@ class PronunciationPracticeService:
             >>> assert result.analysis.metrics.word_accuracy >= 0
         """
         try:
+            audio_config, asr_config = self._configs_for(config)
+
             # Step 1: Process audio (AudioService)
-            audio_config = AudioConfig(
-                sample_rate=config.sample_rate,
-                normalize=config.normalize_audio,
-            )
             processed_audio = self._audio.process_recording(audio_bytes, audio_config)
 
             # Step 2: Transcribe (TranscriptionService)
-            asr_config = ASRConfig(
-                model_name=config.asr_model,
-                use_g2p=config.use_g2p,
-                language=config.language,
-            )
             transcription = self._transcription.transcribe(processed_audio, asr_config)
 
             # Step 3: Phonetic analysis (PhoneticAnalysisService)
@@ -137,6 +137,36 @@ class PronunciationPracticeService:
         except Exception as e:
             raise PronunciationError(f"Pronunciation analysis failed: {e}")
 
+    def _configs_for(self, config: PracticeConfig) -> Tuple[AudioConfig, ASRConfig]:
+        """
+        Derive the audio and ASR configs for a practice config.
+
+        Reuses the previous pair while the relevant settings are unchanged,
+        which is the normal case across recordings in one session.
+        """
+        key = (
+            config.sample_rate,
+            config.normalize_audio,
+            config.asr_model,
+            config.use_g2p,
+            config.language,
+        )
+        cached = self._derived_configs
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        audio_config = AudioConfig(
+            sample_rate=config.sample_rate,
+            normalize=config.normalize_audio,
+        )
+        asr_config = ASRConfig(
+            model_name=config.asr_model,
+            use_g2p=config.use_g2p,
+            language=config.language,
+        )
+        self._derived_configs = (key, audio_config, asr_config)
+        return audio_config, asr_config
+
     def _get_llm_feedback(self, reference_text: str, analysis) -> Optional[str]:
         """
         Get LLM feedback for pronunciation mistakes.
@@ -148,23 +178,19 @@ class PronunciationPracticeService:
         Returns:
             LLM feedback text or None on failure
         """
+        # Convert WordComparison objects to dicts for LLM service
+        per_word_comparison = [
+            {'word': word, 'match': match}
+            for word, match in map(_WORD_AND_MATCH, analysis.per_word_comparison)
+        ]
+
+        # Only the provider call is guarded: its failures (network, rate
+        # limits, SDK-specific errors) have no common base class
         try:
-            # Convert WordComparison objects to dicts for LLM service
-            per_word_comparison = [
-                {
-                    'word': wc.word,
-                    'match': wc.match,
-                }
-                for wc in analysis.per_word_comparison
-            ]
-
-            feedback = self._llm.generate_pronunciation_feedback(
+            return self._llm.generate_pronunciation_feedback(
                 reference_text=reference_text,
                 per_word_comparison=per_word_comparison
             )
-
-            return feedback
-
         except Exception:
             # LLM feedback is optional - don't fail the whole flow
             return None
@@ -12,6 +12,7 @@ Dependencies: Audio Service (through ProcessedAudio interface)
 from .service import TranscriptionService, TranscriptionError
 from .models import ASRConfig, Transcription
 from .asr_manager import ASRModelManager
+from .batching import BatchingTranscriber
 
 __all__ = [
     "TranscriptionService",
@@ -19,4 +20,5 @@ __all__ = [
     "ASRConfig",
     "Transcription",
     "ASRModelManager",
+    "BatchingTranscriber",
 ]
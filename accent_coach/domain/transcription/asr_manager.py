@@ -4,12 +4,32 @@ ASR Manager Implementation
 Migrated from root asr_model.py with improvements.
 """
 
+import contextlib
+import functools
+import threading
+
 import torch
+from gruut import sentences
 from transformers import AutoProcessor, AutoModelForCTC
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 import numpy as np
 
 
+@functools.lru_cache(maxsize=1024)
+def _g2p(decoded: str, lang: str) -> str:
+    """
+    Memoized gruut G2P for decoded transcripts.
+
+    Practice sessions repeat the same prompts, so identical transcripts
+    are converted once per (text, lang).
+    """
+    ph_parts = []
+    for sent in sentences(decoded, lang=lang):
+        for w in sent:
+            ph_parts.append(" ".join(w.phonemes) if w.phonemes else w.text)
+    return " ".join(ph_parts)
+
+
 class ASRModelManager:
     """
     Manages ASR model loading and transcription.
@@ -17,7 +37,25 @@ class ASRModelManager:
     Handles model caching, device management, and transcription.
     """
 
-    def __init__(self, default_model: str, model_options: dict, device: Optional[str] = None):
+    # Vocab entries that mark a model emitting ARPAbet phonemes
+    PHONEME_MARKERS = ("AA", "AE", "AH", "SH", "NG", "TH", "DH", "ZH")
+
+    # Loaded (processor, model, is_phoneme) shared by every manager in the
+    # process, keyed by (model_name, device, dtype, backend, compile_model)
+    _MODEL_CACHE: Dict[tuple, tuple] = {}
+    _MODEL_CACHE_LOCK = threading.Lock()
+    # One lock per cache key, held through the download so concurrent loads of
+    # the same model wait for it while other models and cache hits do not
+    _MODEL_LOAD_LOCKS: Dict[tuple, threading.Lock] = {}
+
+    def __init__(
+        self,
+        default_model: str,
+        model_options: dict,
+        device: Optional[str] = None,
+        compile_model: bool = False,
+        backend: str = "torch",
+    ):
         """
         Initialize ASR manager.
 
@@ -25,15 +63,36 @@ class ASRModelManager:
             default_model: Default model name for fallback
             model_options: Dictionary of available model options
             device: Device to use ('cuda' or 'cpu'). Auto-detect if None.
+            compile_model: Wrap the loaded model with torch.compile. The
+                first forward pass pays the compile cost, so call warmup().
+            backend: "torch" (default) or "onnx". The ONNX backend exports the
+                model to ONNX Runtime on the CPU (needs optimum[onnxruntime]).
         """
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown ASR backend: {backend}")
         self.default_model = default_model
         self.model_options = model_options
+        self.compile_model = compile_model
+        self.backend = backend
 
         self.processor = None
         self.model = None
         self.model_name = None
+        self._is_phoneme = False
+
+        if backend == "onnx":
+            # Runs on ONNX Runtime's CPU execution provider
+            self.device = "cpu"
+        else:
+            self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = self._inference_dtype(self.device)
 
-        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+    @staticmethod
+    def _inference_dtype(device: str) -> torch.dtype:
+        """Half precision on GPU (bf16 where supported), fp32 on CPU."""
+        if not device.startswith("cuda"):
+            return torch.float32
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
 
     def load_model(self, model_name: str, hf_token: Optional[str] = None) -> None:
         """
@@ -62,7 +121,34 @@ class ASRModelManager:
                 raise RuntimeError(f"Failed to load ASR model: {e}")
 
     def _load_model_internal(self, model_name: str, hf_token: Optional[str]) -> None:
-        """Internal method to load model."""
+        """Internal method to load model (weights shared via _MODEL_CACHE)."""
+        key = (model_name, self.device, self.dtype, self.backend, self.compile_model)
+        with ASRModelManager._MODEL_CACHE_LOCK:
+            cached = ASRModelManager._MODEL_CACHE.get(key)
+            load_lock = ASRModelManager._MODEL_LOAD_LOCKS.setdefault(key, threading.Lock())
+
+        if cached is None:
+            with load_lock:
+                # Another thread may have finished loading while we waited
+                with ASRModelManager._MODEL_CACHE_LOCK:
+                    cached = ASRModelManager._MODEL_CACHE.get(key)
+                if cached is None:
+                    self._load_from_hub(model_name, hf_token)
+                    with ASRModelManager._MODEL_CACHE_LOCK:
+                        ASRModelManager._MODEL_CACHE[key] = (self.processor, self.model, self._is_phoneme)
+
+        if cached is not None:
+            self.processor, self.model, self._is_phoneme = cached
+        self.model_name = model_name
+
+    @classmethod
+    def clear_model_cache(cls) -> None:
+        """Drop the process-wide model cache (managers keep their references)."""
+        with cls._MODEL_CACHE_LOCK:
+            cls._MODEL_CACHE.clear()
+
+    def _load_from_hub(self, model_name: str, hf_token: Optional[str]) -> None:
+        """Load processor and model weights from Hugging Face."""
         kwargs = {"token": hf_token} if hf_token else {}
 
         # Load processor and model
@@ -73,31 +159,57 @@ class ASRModelManager:
             **kwargs
         )
 
-        self.model = AutoModelForCTC.from_pretrained(
+        if self.backend == "onnx":
+            self.model = self._load_onnx_model(model_name, kwargs)
+        else:
+            self.model = AutoModelForCTC.from_pretrained(
+                model_name,
+                trust_remote_code=False,
+                local_files_only=False,
+                torch_dtype=self.dtype,
+                **kwargs
+            )
+
+            # Move to device; inference only, so disable dropout
+            self.model = self.model.to(self.device)
+            self.model.eval()
+            if self.compile_model and hasattr(torch, "compile"):
+                # dynamic=True: clip lengths vary, avoid a recompile per length
+                self.model = torch.compile(self.model, dynamic=True)
+        self.model_name = model_name
+
+        # The vocab is fixed per model, so detect phoneme output once here
+        vocab = self.processor.tokenizer.get_vocab()
+        self._is_phoneme = any(p in vocab for p in self.PHONEME_MARKERS)
+
+    @staticmethod
+    def _load_onnx_model(model_name: str, kwargs: dict):
+        """Export/load the CTC model with ONNX Runtime on the CPU."""
+        try:
+            from optimum.onnxruntime import ORTModelForCTC
+        except ImportError as e:
+            raise RuntimeError(
+                "ONNX backend requires optimum[onnxruntime] to be installed"
+            ) from e
+
+        # Same forward signature and logits output as AutoModelForCTC
+        return ORTModelForCTC.from_pretrained(
             model_name,
-            trust_remote_code=False,
-            local_files_only=False,
+            export=True,
+            provider="CPUExecutionProvider",
             **kwargs
         )
 
-        # Move to device
-        self.model = self.model.to(self.device)
-        self.model_name = model_name
-
     def _is_phoneme_model(self) -> bool:
         """
         Detect if the model outputs phonemes directly.
 
+        Computed once when the model is loaded (see _load_model_internal).
+
         Returns:
             True if model is phoneme-based
         """
-        if self.processor is None:
-            return False
-
-        vocab = self.processor.tokenizer.get_vocab()
-        phoneme_markers = ["AA", "AE", "AH", "SH", "NG", "TH", "DH", "ZH"]
-
-        return any(p in vocab for p in phoneme_markers)
+        return self._is_phoneme
 
     def transcribe(
         self,
@@ -124,21 +236,93 @@ class ASRModelManager:
         if self.processor is None or self.model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        # Convert to numpy array if needed
-        if not isinstance(audio, np.ndarray):
-            audio = np.array(audio)
+        decoded = self._decode_batch([self._as_waveform(audio)], sr)[0]
+        return decoded, self._to_phonemes(decoded, use_g2p, lang)
+
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        sr: int,
+        use_g2p: bool = True,
+        lang: str = "en-us"
+    ) -> List[Tuple[str, str]]:
+        """
+        Transcribe several clips in one padded forward pass.
+
+        Only checkpoints whose feature extractor returns an attention mask
+        are batched. Group-norm wav2vec2 models (e.g. wav2vec2-base-960h)
+        take no mask and normalize over the padding too, so padded clips
+        would decode differently; those are decoded one clip at a time.
+
+        Args:
+            audios: Audio waveforms (numpy arrays), all at the same sample rate
+            sr: Sample rate
+            use_g2p: Use grapheme-to-phoneme conversion
+            lang: Language code for G2P
+
+        Returns:
+            List of (decoded_text, phoneme_string), in input order
+
+        Raises:
+            RuntimeError: If model not loaded
+        """
+        if self.processor is None or self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        if not audios:
+            return []
+
+        audios = [self._as_waveform(a) for a in audios]
+        if len(audios) > 1 and not self._supports_padded_batch():
+            decoded_texts = [self._decode_batch([a], sr)[0] for a in audios]
+        else:
+            decoded_texts = self._decode_batch(audios, sr)
+        return [
+            (decoded, self._to_phonemes(decoded, use_g2p, lang))
+            for decoded in decoded_texts
+        ]
+
+    def _supports_padded_batch(self) -> bool:
+        """True if the feature extractor masks padding, so batching is output-neutral."""
+        feature_extractor = getattr(self.processor, "feature_extractor", None)
+        return getattr(feature_extractor, "return_attention_mask", False) is True
+
+    @staticmethod
+    def _as_waveform(audio) -> np.ndarray:
+        """
+        Return audio as a 1-D, C-contiguous float32 array.
+
+        No-op (no copy) when the input already has that layout, so the
+        processor does not make a hidden conversion copy of the clip.
+        """
+        return np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
 
+    def _decode_batch(self, audios: List[np.ndarray], sr: int) -> List[str]:
+        """Run the model on a batch of clips and greedy-decode each one."""
         # Preprocess
         inputs = self.processor(
-            audio,
+            audios if len(audios) > 1 else audios[0],
             sampling_rate=sr,
             return_tensors="pt",
             padding="longest",
         )
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
-
-        # Forward pass
-        with torch.no_grad():
+        # On CPU the processor output is already float32 and in place; on GPU
+        # copies are queued asynchronously (the .cpu() read below syncs)
+        if self.device != "cpu":
+            inputs = {
+                k: v.to(self.device, dtype=self.dtype, non_blocking=True)
+                if v.is_floating_point()
+                else v.to(self.device, non_blocking=True)
+                for k, v in inputs.items()
+            }
+
+        # Forward pass (inference_mode skips autograd bookkeeping; half
+        # precision autocast halves activation bandwidth on CUDA)
+        autocast = (
+            torch.autocast(device_type="cuda", dtype=self.dtype)
+            if self.device.startswith("cuda")
+            else contextlib.nullcontext()
+        )
+        with torch.inference_mode(), autocast:
             outputs = self.model(**inputs)
 
         # Extract logits
@@ -147,31 +331,49 @@ class ASRModelManager:
         else:
             raise RuntimeError("Model output has no logits. Unsupported model type.")
 
-        # Decode
-        pred_ids = torch.argmax(logits, dim=-1)
-        decoded = self.processor.batch_decode(pred_ids, skip_special_tokens=True)[0]
+        # Decode: argmax on the device, then copy only the int ids to host once
+        pred_ids = logits.argmax(dim=-1).cpu()
+
+        # Drop frames that only cover another clip's zero padding (the
+        # attention mask keeps them out of the valid frames' context)
+        if len(audios) > 1 and isinstance(self.model, torch.nn.Module) and hasattr(
+            self.model, "_get_feat_extract_output_lengths"
+        ):
+            frames = self.model._get_feat_extract_output_lengths(
+                torch.tensor([len(a) for a in audios])
+            )
+            pred_ids = [ids[:n] for ids, n in zip(pred_ids, frames.tolist())]
 
-        # Phoneme conversion
-        recorded_phoneme_str = decoded
+        return self.processor.batch_decode(pred_ids, skip_special_tokens=True)
 
+    def _to_phonemes(self, decoded: str, use_g2p: bool, lang: str) -> str:
+        """Convert decoded text to a phoneme string (identity if unavailable)."""
         # If model already emits phonemes, skip G2P
         if self._is_phoneme_model():
-            return decoded, decoded
+            return decoded
 
         # Optional G2P conversion
         if use_g2p:
             try:
-                from gruut import sentences
-                ph_parts = []
-                for sent in sentences(decoded, lang=lang):
-                    for w in sent:
-                        ph_parts.append(" ".join(w.phonemes) if w.phonemes else w.text)
-                recorded_phoneme_str = " ".join(ph_parts)
+                return _g2p(decoded, lang)
             except Exception:
                 # Fallback to decoded text if G2P fails
                 pass
 
-        return decoded, recorded_phoneme_str
+        return decoded
+
+    def warmup(self, sample_length: int = 16000, sr: int = 16000) -> None:
+        """
+        Run one dummy forward pass so lazy allocations happen before the first user request.
+
+        Args:
+            sample_length: Number of samples of silence to transcribe
+            sr: Sample rate of the dummy clip
+
+        Raises:
+            RuntimeError: If model not loaded
+        """
+        self.transcribe(np.zeros(sample_length, dtype=np.float32), sr, use_g2p=False)
 
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
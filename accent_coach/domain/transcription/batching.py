@@ -0,0 +1,115 @@
+"""
+Micro-batching wrapper for TranscriptionService
+
+Coalesces transcription requests that arrive within a short window into
+one batched ASR call, so concurrent users share a forward pass.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional
+
+from ..audio.models import ProcessedAudio
+from .models import ASRConfig, Transcription
+from .service import TranscriptionError, TranscriptionService
+
+
+class BatchingTranscriber:
+    """
+    Drop-in replacement for TranscriptionService.transcribe that batches requests.
+
+    Callers block on a per-request Future while a background worker drains
+    up to `batch_size` queued clips (waiting at most `max_delay_ms` after
+    the first) and sends each group of clips sharing an ASRConfig through
+    TranscriptionService.transcribe_batch.
+    """
+
+    def __init__(
+        self,
+        transcription_service: TranscriptionService,
+        batch_size: int = 16,
+        max_delay_ms: float = 20.0,
+    ):
+        """
+        Args:
+            transcription_service: Service that performs the batched transcription
+            batch_size: Maximum clips per batch
+            max_delay_ms: Maximum time to wait for more clips after the first
+        """
+        self._service = transcription_service
+        self._batch_size = batch_size
+        self._max_delay = max_delay_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def transcribe(self, audio: ProcessedAudio, config: ASRConfig) -> Transcription:
+        """
+        Transcribe audio, sharing the model call with concurrent requests.
+
+        Args:
+            audio: Processed audio from AudioService
+            config: ASR configuration
+
+        Returns:
+            Transcription with text and confidence
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((audio, config, future))
+        return future.result()
+
+    def transcribe_batch(self, audios: List[ProcessedAudio], config: ASRConfig) -> List[Transcription]:
+        """Transcribe an already-assembled batch directly."""
+        return self._service.transcribe_batch(audios, config)
+
+    def _ensure_worker(self) -> None:
+        """Start the background worker on first use."""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="asr-batcher", daemon=True
+                    )
+                    self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, then dispatch it."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list) -> None:
+        """Transcribe each same-config group and resolve its futures."""
+        groups = {}
+        for audio, config, future in batch:
+            groups.setdefault(config, []).append((audio, future))
+
+        for config, items in groups.items():
+            try:
+                results = self._service.transcribe_batch([audio for audio, _ in items], config)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+                # A short result list must not leave callers blocked forever
+                for _, future in items[len(results):]:
+                    future.set_exception(TranscriptionError(
+                        f"Transcription failed: batch returned {len(results)} results for {len(items)} clips"
+                    ))
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ASRConfig:
     """Configuration for ASR (Automatic Speech Recognition)."""
     model_name: str = "facebook/wav2vec2-base-960h"
@@ -17,7 +17,7 @@ class ASRConfig:
     hf_token: Optional[str] = None  # Hugging Face token
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transcription:
     """Result of speech recognition."""
     text: str
@@ -2,7 +2,8 @@
 Transcription Service (BC2)
 """
 
-from typing import Optional
+from typing import List, Optional
+import numpy as np
 from ..audio.models import ProcessedAudio
 from .models import ASRConfig, Transcription
 from .asr_manager import ASRModelManager
@@ -13,6 +14,59 @@ class TranscriptionError(Exception):
     pass
 
 
+def _quietest_cut(waveform: np.ndarray, lo: int, hi: int, frame_len: int) -> int:
+    """Index at the middle of the lowest-energy frame in waveform[lo:hi] (hi if no full frame)."""
+    window = waveform[lo:hi]
+    n_frames = len(window) // frame_len
+    if n_frames == 0:
+        return hi
+    frames = window[:n_frames * frame_len].reshape(n_frames, frame_len)
+    energy = np.einsum("ij,ij->i", frames, frames)
+    return lo + int(np.argmin(energy)) * frame_len + frame_len // 2
+
+
+def _split_on_quiet_points(
+    waveform: np.ndarray,
+    sr: int,
+    chunk_seconds: float,
+    search_seconds: float = 1.0,
+    frame_seconds: float = 0.02,
+) -> List[np.ndarray]:
+    """
+    Split a waveform into chunks of at most chunk_seconds.
+
+    Each cut is moved back to the quietest frame within the last
+    search_seconds of its window so it is unlikely to land inside a word.
+    A tail shorter than the search window is not left on its own: the
+    last chunk and the tail are re-split at the quietest frame near their
+    midpoint, which keeps both halves within chunk_seconds. Chunks are
+    views into the original array.
+    """
+    chunk_len = max(1, int(chunk_seconds * sr))
+    search_len = min(int(search_seconds * sr), chunk_len // 2)
+    frame_len = max(1, int(frame_seconds * sr))
+
+    chunks = []
+    start = 0
+    total = len(waveform)
+    while total - start > chunk_len:
+        end = start + chunk_len
+        end = _quietest_cut(waveform, end - search_len, end, frame_len)
+        chunks.append(waveform[start:end])
+        start = end
+
+    if chunks and total - start < search_len:
+        # Previous chunk <= chunk_len and tail < search_len <= chunk_len / 2,
+        # so each side of a cut within search_len / 2 of the midpoint fits
+        start -= len(chunks.pop())
+        mid = (start + total) // 2
+        cut = _quietest_cut(waveform, mid - search_len // 2, mid + search_len // 2, frame_len)
+        chunks.append(waveform[start:cut])
+        start = cut
+    chunks.append(waveform[start:])
+    return chunks
+
+
 class TranscriptionService:
     """
     BC2: Speech Recognition
@@ -28,7 +82,9 @@ class TranscriptionService:
     def __init__(self, asr_manager: Optional[ASRModelManager] = None):
         """
         Args:
-            asr_manager: ASRModelManager instance (optional, lazy-loaded)
+            asr_manager: ASRModelManager instance (optional, lazy-loaded).
+                Managers share loaded weights process-wide, so passing a
+                fresh one per request does not reload the model.
         """
         self._asr = asr_manager
 
@@ -60,7 +116,7 @@ class TranscriptionService:
 
             # Transcribe
             text, phonemes = self._asr.transcribe(
-                audio=audio.waveform,
+                audio=audio.waveform_f32,
                 sr=audio.sample_rate,
                 use_g2p=config.use_g2p,
                 lang=config.language
@@ -76,3 +132,111 @@ class TranscriptionService:
 
         except Exception as e:
             raise TranscriptionError(f"Transcription failed: {e}")
+
+    def transcribe_batch(
+        self,
+        audios: List[ProcessedAudio],
+        config: ASRConfig
+    ) -> List[Transcription]:
+        """
+        Transcribe several recordings with one model call per sample rate.
+
+        Args:
+            audios: Processed audio clips from AudioService
+            config: ASR configuration shared by all clips
+
+        Returns:
+            Transcriptions in input order
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        if self._asr is None:
+            raise TranscriptionError("ASR manager not initialized")
+
+        try:
+            if not self._asr.is_loaded():
+                self._asr.load_model(config.model_name, config.hf_token)
+
+            # Clips must share a sample rate to be padded into one batch
+            by_rate = {}
+            for index, audio in enumerate(audios):
+                by_rate.setdefault(audio.sample_rate, []).append(index)
+
+            results: List[Optional[Transcription]] = [None] * len(audios)
+            for sample_rate, indices in by_rate.items():
+                decoded = self._asr.transcribe_batch(
+                    audios=[audios[i].waveform_f32 for i in indices],
+                    sr=sample_rate,
+                    use_g2p=config.use_g2p,
+                    lang=config.language
+                )
+                for i, (text, phonemes) in zip(indices, decoded):
+                    results[i] = Transcription(
+                        text=text,
+                        phonemes=phonemes,
+                        confidence=1.0,
+                        language=config.language
+                    )
+
+            return results
+
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}")
+
+    def transcribe_long(
+        self,
+        audio: ProcessedAudio,
+        config: ASRConfig,
+        chunk_seconds: float = 30.0,
+        batch_size: int = 4,
+    ) -> Transcription:
+        """
+        Transcribe a long recording in chunks.
+
+        The clip is cut into windows of at most chunk_seconds, each cut
+        placed at a quiet point. Windows are decoded batch_size at a time
+        through the shared model, so peak memory stays bounded while the
+        batch still keeps the cores busy. Short clips go through transcribe().
+
+        Args:
+            audio: Processed audio from AudioService
+            config: ASR configuration
+            chunk_seconds: Maximum chunk length in seconds
+            batch_size: Chunks decoded per forward pass
+
+        Returns:
+            Transcription of the whole clip, chunk results joined in order
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        if audio.duration_seconds <= chunk_seconds:
+            return self.transcribe(audio, config)
+
+        if self._asr is None:
+            raise TranscriptionError("ASR manager not initialized")
+
+        try:
+            if not self._asr.is_loaded():
+                self._asr.load_model(config.model_name, config.hf_token)
+
+            chunks = _split_on_quiet_points(audio.waveform_f32, audio.sample_rate, chunk_seconds)
+            decoded = []
+            for i in range(0, len(chunks), batch_size):
+                decoded.extend(self._asr.transcribe_batch(
+                    audios=chunks[i:i + batch_size],
+                    sr=audio.sample_rate,
+                    use_g2p=config.use_g2p,
+                    lang=config.language
+                ))
+
+            return Transcription(
+                text=" ".join(text for text, _ in decoded if text),
+                phonemes=" ".join(phonemes for _, phonemes in decoded if phonemes),
+                confidence=1.0,
+                language=config.language
+            )
+
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}")
@@ -3,7 +3,7 @@ Writing Evaluation domain models
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Tuple
 from enum import Enum
 
 
@@ -14,6 +14,13 @@ class QuestionDifficulty(Enum):
     HARD = "hard"
 
 
+_XP_BY_DIFFICULTY = {
+    QuestionDifficulty.EASY: 10,
+    QuestionDifficulty.MEDIUM: 20,
+    QuestionDifficulty.HARD: 40,
+}
+
+
 class QuestionCategory(Enum):
     """Interview question categories."""
     BEHAVIORAL = "behavioral"
@@ -21,7 +28,7 @@ class QuestionCategory(Enum):
     REMOTE_WORK = "remote_work"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterviewQuestion:
     """Interview practice question."""
     text: str
@@ -30,31 +37,27 @@ class InterviewQuestion:
 
     def get_xp_value(self) -> int:
         """Calculate XP points for this question."""
-        xp_map = {
-            QuestionDifficulty.EASY: 10,
-            QuestionDifficulty.MEDIUM: 20,
-            QuestionDifficulty.HARD: 40,
-        }
-        return xp_map[self.difficulty]
+        return _XP_BY_DIFFICULTY[self.difficulty]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WritingConfig:
     """Configuration for writing evaluation."""
     model: str = "llama-3.1-8b-instant"
     temperature: float = 0.1
     max_tokens: int = 800
     generate_teacher_feedback: bool = True
+    max_concurrent: int = 5  # Parallel LLM calls in evaluate_writing_many
 
 
-@dataclass
+@dataclass(slots=True)
 class CEFRMetrics:
     """CEFR evaluation metrics."""
     cefr_level: str  # A2, B1-B2, C1-C2
     variety_score: int  # 0-10
 
 
-@dataclass
+@dataclass(slots=True)
 class VocabularyExpansion:
     """Vocabulary expansion suggestion."""
     word: str
@@ -63,19 +66,14 @@ class VocabularyExpansion:
     meaning_context: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WritingEvaluation:
     """Result of writing evaluation."""
     corrected: str
-    improvements: List[str]
-    questions: List[str]
-    expansion_words: List[VocabularyExpansion]
     metrics: CEFRMetrics
-
-    def __post_init__(self):
-        if self.improvements is None:
-            self.improvements = []
-        if self.questions is None:
-            self.questions = []
-        if self.expansion_words is None:
-            self.expansion_words = []
+    # Read-only LLM output, so tuples rather than lists
+    improvements: Tuple[str, ...] = ()
+    questions: Tuple[str, ...] = ()
+    expansion_words: Tuple[VocabularyExpansion, ...] = ()
+    # LLM JSON this evaluation was parsed from, reused for teacher feedback
+    raw_json: Optional[str] = field(default=None, repr=False, compare=False)
@@ -2,7 +2,7 @@
 Activity Tracking models
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict
@@ -16,15 +16,11 @@ class ActivityType(Enum):
     LANGUAGE_QUERY = "language_query"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityLog:
     """User activity log entry."""
     user_id: str
     activity_type: ActivityType
     timestamp: datetime
     score: int
-    metadata: Dict
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict = field(default_factory=dict)
@@ -49,6 +49,9 @@ class ActivityTracker:
         log = ActivityLog(
             user_id=user_id,
             activity_type=ActivityType.PRONUNCIATION,
+            # Repositories call .date()/.strftime() on this, so it stays a
+            # datetime; datetime.now() is already cheaper than building one
+            # from time.time()
             timestamp=datetime.now(),
             score=score,
             metadata={
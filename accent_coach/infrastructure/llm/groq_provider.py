@@ -2,14 +2,30 @@
 Groq LLM Provider Implementation
 """
 
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Iterator, List
 from .service import LLMService
 from .models import LLMConfig, LLMResponse
 
 
+# USD per 1M tokens by exact model name (Groq pricing as of 2025)
+_COST_PER_MILLION: Dict[str, float] = {
+    "llama-3.1-70b-versatile": 0.64,
+    "llama-3.3-70b-versatile": 0.64,
+    "llama3-70b-8192": 0.64,
+    "llama-3.1-8b-instant": 0.10,
+    "llama3-8b-8192": 0.10,
+}
+DEFAULT_COST_PER_MILLION = 0.10
+
+
 class GroqLLMService(LLMService):
     """Groq implementation of LLM service."""
 
+    # One Groq client (and HTTP connection pool) per API key, process-wide
+    _CLIENTS: Dict[str, Any] = {}
+    _CLIENTS_LOCK = threading.Lock()
+
     def __init__(self, api_key: str):
         """
         Args:
@@ -35,12 +51,7 @@ class GroqLLMService(LLMService):
         # Ensure client is initialized
         self._ensure_client()
 
-        # Build messages
-        messages = [{"role": "user", "content": prompt}]
-
-        # Add system message if context provided
-        if context.get("system_message"):
-            messages.insert(0, {"role": "system", "content": context["system_message"]})
+        messages = self._build_messages(prompt, context)
 
         try:
             # Call Groq API
@@ -54,28 +65,100 @@ class GroqLLMService(LLMService):
             # Extract response
             text = completion.choices[0].message.content
             tokens_used = completion.usage.total_tokens if completion.usage else 0
+            cached_tokens = self._extract_cached_tokens(completion.usage)
 
-            # Estimate cost (Groq pricing as of 2025)
-            # llama-3.1-70b: $0.64 per 1M tokens
-            cost_per_million = 0.64 if "70b" in config.model else 0.10
+            # Estimate cost; unlisted models use the default rate
+            cost_per_million = _COST_PER_MILLION.get(config.model, DEFAULT_COST_PER_MILLION)
             cost_usd = (tokens_used / 1_000_000) * cost_per_million
 
             return LLMResponse(
                 text=text,
                 tokens_used=tokens_used,
                 cost_usd=cost_usd,
+                cached_tokens=cached_tokens,
             )
 
         except Exception as e:
             # Re-raise with more context
             raise RuntimeError(f"Groq API call failed: {str(e)}") from e
 
+    def generate_stream(
+        self, prompt: str, context: Dict[str, Any], config: LLMConfig
+    ) -> Iterator[str]:
+        """
+        Stream text from the Groq API as it is generated.
+
+        Args:
+            prompt: Prompt text
+            context: Additional context (system_message is honoured)
+            config: LLM configuration
+
+        Returns:
+            Iterator of text chunks whose concatenation is the full response
+        """
+        self._ensure_client()
+        messages = self._build_messages(prompt, context)
+
+        try:
+            stream = self._client.chat.completions.create(
+                messages=messages,
+                model=config.model,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens,
+                stream=True,
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+        except Exception as e:
+            raise RuntimeError(f"Groq API call failed: {str(e)}") from e
+
+    @staticmethod
+    def _build_messages(prompt: str, context: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt and optional system message."""
+        messages = [{"role": "user", "content": prompt}]
+
+        # Add system message if context provided. Groq caches identical
+        # prompt prefixes automatically, so context["cache_hints"] needs no
+        # extra request fields here; keeping the system message first and
+        # unchanged across turns is what makes the prefix reusable.
+        if context.get("system_message"):
+            messages.insert(0, {"role": "system", "content": context["system_message"]})
+
+        return messages
+
+    @staticmethod
+    def _extract_cached_tokens(usage) -> int:
+        """Prompt tokens served from Groq's prefix cache (0 if not reported)."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0)
+        return cached if isinstance(cached, int) else 0
+
     def _ensure_client(self):
-        """Lazy initialization of Groq client."""
+        """Lazy initialization of Groq client (shared across instances per API key)."""
         if self._client is None:
-            try:
-                from groq import Groq
-
-                self._client = Groq(api_key=self._api_key)
-            except ImportError:
-                raise ImportError("groq package not installed. Run: pip install groq")
+            with GroqLLMService._CLIENTS_LOCK:
+                client = GroqLLMService._CLIENTS.get(self._api_key)
+                if client is None:
+                    try:
+                        from groq import Groq
+                    except ImportError:
+                        raise ImportError("groq package not installed. Run: pip install groq")
+                    client = Groq(api_key=self._api_key)
+                    GroqLLMService._CLIENTS[self._api_key] = client
+            self._client = client
+
+    @classmethod
+    def close_all_clients(cls) -> None:
+        """Close and forget the shared Groq clients (services keep their references)."""
+        with cls._CLIENTS_LOCK:
+            clients = list(cls._CLIENTS.values())
+            cls._CLIENTS.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
@@ -19,3 +19,4 @@ class LLMResponse:
     text: str
     tokens_used: int = 0
     cost_usd: float = 0.0
+    cached_tokens: int = 0  # prompt tokens served from the provider's prefix cache
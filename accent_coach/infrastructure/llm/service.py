@@ -2,11 +2,76 @@
 LLM Service Abstract Interface
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from .models import LLMConfig, LLMResponse
 
 
+# Shape of one writing evaluation, shared by the single and batched prompts
+_WRITING_JSON_STRUCTURE = """{
+    "metrics": {
+        "cefr_level": "String (e.g., B2, C1, C2)",
+        "variety_score": Integer (1-10 based on professional vocabulary)
+    },
+    "corrected": "String (Polished, professional version suitable for a job interview)",
+    "improvements": ["String (Specific advice on tone, clarity, or STAR method)", "String", "String"],
+    "questions": ["String (Follow-up interview question)", "String (Technical or behavioral probe)"],
+    "expansion_words": [
+        {
+            "word": "String (Power verb or industry term)",
+            "ipa": "String (IPA pronunciation)",
+            "replaces_simple_word": "String (The weaker word used)",
+            "meaning_context": "String (Why this word is better for interviews)"
+        },
+        ... (Total 3 items)
+    ]
+}"""
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def _split_json_array(text: str) -> List[Tuple[Any, str]]:
+    """
+    Parse a JSON array in one pass, keeping each element's source text.
+
+    Returns:
+        (parsed element, raw JSON slice of that element) per element
+
+    Raises:
+        json.JSONDecodeError: If text is not a single JSON array
+    """
+    idx = len(text) - len(text.lstrip(_JSON_WHITESPACE))
+    if not text.startswith("[", idx):
+        raise json.JSONDecodeError("Expecting '['", text, idx)
+
+    items = []
+    idx += 1
+    while True:
+        while idx < len(text) and text[idx] in _JSON_WHITESPACE:
+            idx += 1
+        if text.startswith("]", idx) and not items:
+            idx += 1
+            break
+        value, end = _JSON_DECODER.raw_decode(text, idx)
+        items.append((value, text[idx:end]))
+        idx = end
+        while idx < len(text) and text[idx] in _JSON_WHITESPACE:
+            idx += 1
+        if text.startswith(",", idx):
+            idx += 1
+        elif text.startswith("]", idx):
+            idx += 1
+            break
+        else:
+            raise json.JSONDecodeError("Expecting ',' or ']'", text, idx)
+
+    if text[idx:].strip(_JSON_WHITESPACE):
+        raise json.JSONDecodeError("Extra data", text, idx)
+    return items
+
+
 class LLMService(ABC):
     """
     BC6: LLM Orchestration - ABSTRACTION
@@ -32,6 +97,25 @@ class LLMService(ABC):
         """
         pass
 
+    def generate_stream(
+        self, prompt: str, context: Dict[str, Any], config: LLMConfig
+    ) -> Iterator[str]:
+        """
+        Generate text incrementally, yielding chunks as they arrive.
+
+        Providers that support streaming override this; the default yields
+        the full generate() result as a single chunk.
+
+        Args:
+            prompt: Template or direct prompt
+            context: Additional context for generation
+            config: LLM configuration
+
+        Returns:
+            Iterator of text chunks whose concatenation is the full response
+        """
+        yield self.generate(prompt, context, config).text
+
     def generate_pronunciation_feedback(
         self,
         reference_text: str,
@@ -65,29 +149,37 @@ class LLMService(ABC):
         model: str,
         temperature: float = 0.3,
         max_tokens: int = 500,
+        cache_hints: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Domain-specific: Generate conversation tutor feedback.
 
+        The system prompt is sent as its own leading message so it forms a
+        byte-identical prefix across turns, which lets providers with
+        prompt/prefix caching reuse it instead of re-prefilling it.
+
         Args:
             system_prompt: System instructions for the LLM
             user_message: User's message to analyze
             model: LLM model to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_hints: Optional provider cache markers for the system prompt
+                (e.g. {"cache_control": {"type": "ephemeral"}})
 
         Returns:
             Feedback text with corrections and follow-up
         """
-        # Build combined prompt
-        combined_prompt = f"{system_prompt}\n\n{user_message}"
+        context = {"system_message": system_prompt}
+        if cache_hints:
+            context["cache_hints"] = cache_hints
 
         config = LLMConfig(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        response = self.generate(combined_prompt, {}, config)
+        response = self.generate(user_message, context, config)
         return response.text
 
     def generate_writing_feedback(
@@ -118,6 +210,49 @@ class LLMService(ABC):
         response = self.generate(prompt, {}, config)
         return response.text
 
+    def generate_writing_feedback_batch(
+        self,
+        texts: List[str],
+        model: str,
+        temperature: float = 0.1,
+    ) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        Domain-specific: Evaluate several written answers in one request.
+
+        Packs every answer into a single prompt so N evaluations share one
+        round-trip instead of paying it N times. The array is parsed once;
+        each item comes back parsed alongside its own slice of the response.
+
+        Args:
+            texts: Students' written answers
+            model: LLM model to use
+            temperature: Sampling temperature (default 0.1 for consistency)
+
+        Returns:
+            One (evaluation dict, raw JSON text) pair per input text, in input order
+
+        Raises:
+            RuntimeError: If the response is not a JSON array of one object per text
+        """
+        if not texts:
+            return []
+
+        prompt = self._build_writing_batch_prompt(texts)
+        config = LLMConfig(model=model, temperature=temperature, max_tokens=800 * len(texts))
+        response = self.generate(prompt, {}, config)
+
+        try:
+            items = _split_json_array(response.text)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse batched LLM response as JSON: {e}")
+
+        if len(items) != len(texts) or not all(isinstance(item, dict) for item, _ in items):
+            raise RuntimeError(
+                f"Expected a JSON array of {len(texts)} evaluation objects"
+            )
+
+        return items
+
     def generate_teacher_feedback(
         self,
         analysis_data: str,
@@ -142,6 +277,32 @@ class LLMService(ABC):
         response = self.generate(prompt, {}, config)
         return response.text
 
+    def generate_teacher_feedback_stream(
+        self,
+        analysis_data: str,
+        original_text: str,
+        model: str,
+        temperature: float = 0.4,
+    ) -> Iterator[str]:
+        """
+        Domain-specific: Stream the teacher-style feedback email.
+
+        Same prompt as generate_teacher_feedback, but chunks are yielded as
+        the model produces them so the UI can render before it finishes.
+
+        Args:
+            analysis_data: JSON string of analysis results
+            original_text: Student's original text
+            model: LLM model to use
+            temperature: Sampling temperature (default 0.4 for warmth)
+
+        Returns:
+            Iterator of text chunks of the email body
+        """
+        prompt = self._build_teacher_feedback_prompt(analysis_data, original_text)
+        config = LLMConfig(model=model, temperature=temperature, max_tokens=600)
+        return self.generate_stream(prompt, {}, config)
+
     def generate_language_query_response(
         self,
         user_query: str,
@@ -197,27 +358,29 @@ INSTRUCTIONS:
 Analyze the text and return a valid JSON object.
 
 REQUIRED JSON STRUCTURE (Do not deviate):
-{{
-    "metrics": {{
-        "cefr_level": "String (e.g., B2, C1, C2)",
-        "variety_score": Integer (1-10 based on professional vocabulary)
-    }},
-    "corrected": "String (Polished, professional version suitable for a job interview)",
-    "improvements": ["String (Specific advice on tone, clarity, or STAR method)", "String", "String"],
-    "questions": ["String (Follow-up interview question)", "String (Technical or behavioral probe)"],
-    "expansion_words": [
-        {{
-            "word": "String (Power verb or industry term)",
-            "ipa": "String (IPA pronunciation)",
-            "replaces_simple_word": "String (The weaker word used)",
-            "meaning_context": "String (Why this word is better for interviews)"
-        }},
-        ... (Total 3 items)
-    ]
-}}
+{_WRITING_JSON_STRUCTURE}
 
 Output ONLY valid JSON. No markdown, no explanation."""
 
+    def _build_writing_batch_prompt(self, texts: List[str]) -> str:
+        """Build a prompt that evaluates several answers at once."""
+        numbered = "\n".join(
+            f'{i}) "{text}"' for i, text in enumerate(texts, start=1)
+        )
+        return f"""
+Role: Senior Tech Recruiter & Communication Coach for US Companies.
+Goal: Optimize each candidate's answer for clarity, professionalism, and impact in a remote software engineering interview context.
+Input Texts:
+{numbered}
+
+INSTRUCTIONS:
+Evaluate each answer independently and return a JSON array with exactly {len(texts)} objects, one per input, in the same order.
+
+REQUIRED JSON STRUCTURE FOR EACH OBJECT (Do not deviate):
+{_WRITING_JSON_STRUCTURE}
+
+Output ONLY a valid JSON array. No markdown, no explanation."""
+
     def _build_teacher_feedback_prompt(self, analysis_data: str, original_text: str) -> str:
         """Build teacher feedback prompt for warm, supportive email."""
         return f"""
@@ -186,6 +186,9 @@ class FirestoreConversationRepository(ConversationRepository):
     Collection: 'conversation_turns'
     """
 
+    # Firestore's per-batch write limit
+    MAX_BATCH_WRITES = 500
+
     def __init__(self, db):
         """Initialize repository with Firestore client."""
         if db is None:
@@ -208,19 +211,7 @@ class FirestoreConversationRepository(ConversationRepository):
         """
         try:
             doc_ref = self._db.collection(self._collection_name).document()
-            
-            data = {
-                "session_id": session_id,
-                "timestamp": timestamp or firestore.SERVER_TIMESTAMP,
-                "user_transcript": getattr(turn, 'user_transcript', ''),
-                "correction": getattr(turn, 'correction', ''),
-                "improved_version": getattr(turn, 'improved_version', ''),
-                "explanation": getattr(turn, 'explanation', ''),
-                "errors_detected": getattr(turn, 'errors_detected', []),
-                "follow_up_question": getattr(turn, 'follow_up_question', ''),
-            }
-            
-            doc_ref.set(data)
+            doc_ref.set(self._turn_data(session_id, turn, timestamp))
             logger.info(f"Saved conversation turn for session {session_id}")
             return doc_ref.id
             
@@ -228,6 +219,51 @@ class FirestoreConversationRepository(ConversationRepository):
             logger.error(f"Failed to save conversation turn: {e}")
             raise
     
+    def save_turns(self, session_id: str, turns: List, timestamp: Optional[datetime] = None) -> List[str]:
+        """
+        Save several conversation turns with batched writes.
+        
+        Args:
+            session_id: Conversation session identifier
+            turns: TurnResult objects, oldest first
+            timestamp: Optional custom timestamp
+            
+        Returns:
+            Document IDs of saved turns
+        """
+        try:
+            collection = self._db.collection(self._collection_name)
+            doc_ids = []
+            
+            for start in range(0, len(turns), self.MAX_BATCH_WRITES):
+                batch = self._db.batch()
+                for turn in turns[start:start + self.MAX_BATCH_WRITES]:
+                    doc_ref = collection.document()
+                    batch.set(doc_ref, self._turn_data(session_id, turn, timestamp))
+                    doc_ids.append(doc_ref.id)
+                batch.commit()
+            
+            logger.info(f"Saved {len(doc_ids)} conversation turns for session {session_id}")
+            return doc_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to save conversation turns: {e}")
+            raise
+    
+    @staticmethod
+    def _turn_data(session_id: str, turn, timestamp: Optional[datetime]) -> Dict[str, Any]:
+        """Build the Firestore document for a turn."""
+        return {
+            "session_id": session_id,
+            "timestamp": timestamp or firestore.SERVER_TIMESTAMP,
+            "user_transcript": getattr(turn, 'user_transcript', ''),
+            "correction": getattr(turn, 'correction', ''),
+            "improved_version": getattr(turn, 'improved_version', ''),
+            "explanation": getattr(turn, 'explanation', ''),
+            "errors_detected": getattr(turn, 'errors_detected', []),
+            "follow_up_question": getattr(turn, 'follow_up_question', ''),
+        }
+    
     def get_session_history(self, session_id: str) -> List[Dict[str, Any]]:
         """
         Get full conversation session history.
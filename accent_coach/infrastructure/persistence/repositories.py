@@ -60,6 +60,20 @@ class ConversationRepository(ABC):
         """
         pass
 
+    def save_turns(self, session_id: str, turns: List["TurnResult"]) -> None:
+        """
+        Save several turns of one session, in order.
+
+        Default implementation saves one turn at a time; backends with bulk
+        writes should override it to use a single round trip.
+
+        Args:
+            session_id: Conversation session ID
+            turns: Turn results, oldest first
+        """
+        for turn in turns:
+            self.save_turn(session_id, turn)
+
     @abstractmethod
     def get_session_history(self, session_id: str) -> List["TurnResult"]:
         """
@@ -7,7 +7,7 @@ import streamlit as st
 
 class ConversationController:
     """
-    Controller: UI → ConversationTutorService
+    Controller: UI → ConversationService
 
     Responsibilities:
     - Handle conversation turns
@@ -20,7 +20,7 @@ class ConversationController:
     def __init__(self, tutor_service, activity_tracker):
         """
         Args:
-            tutor_service: ConversationTutorService instance
+            tutor_service: ConversationService instance
             activity_tracker: ActivityTracker instance
         """
         self._service = tutor_service
@@ -14,13 +14,16 @@ import streamlit as st
 # Domain Services
 from accent_coach.domain.audio.service import AudioService
 from accent_coach.domain.transcription.service import TranscriptionService
+from accent_coach.domain.transcription.batching import BatchingTranscriber
 from accent_coach.domain.phonetic.service import PhoneticAnalysisService
+from accent_coach.domain.phonetic.analyzer import G2PConverter
 from accent_coach.domain.pronunciation.service import PronunciationPracticeService
 from accent_coach.domain.conversation.service import ConversationService
 from accent_coach.domain.conversation.models import ConversationConfig, ConversationMode
 from accent_coach.domain.writing.service import WritingService
 from accent_coach.domain.writing.models import QuestionCategory, QuestionDifficulty
 from accent_coach.domain.language_query.service import LanguageQueryService
+from accent_coach.domain.language_query.cache import SemanticCache
 from accent_coach.domain.language_query.models import QueryConfig, QueryCategory
 
 # Infrastructure Services
@@ -110,6 +113,98 @@ def initialize_repositories():
         return pronunciation_repo, conversation_repo, writing_repo, activity_repo, {'type': 'in-memory', 'error': str(e)}
 
 
+MODEL_OPTIONS = {
+    "Wav2Vec2 Base (Fast, Cloud-Friendly)": "facebook/wav2vec2-base-960h",
+    "Wav2Vec2 Large (Better Accuracy, Needs More RAM)": "facebook/wav2vec2-large-960h",
+    "Wav2Vec2 XLSR (Phonetic)": "mrrubino/wav2vec2-large-xlsr-53-l2-arctic-phoneme",
+}
+DEFAULT_MODEL = "facebook/wav2vec2-base-960h"
+
+# Coalesce concurrent conversation transcriptions into batched ASR calls
+# (useful for multi-user deployments; off by default)
+ASR_MICRO_BATCHING = os.environ.get("ACCENT_COACH_ASR_BATCHING", "0") == "1"
+
+# torch.compile the ASR model at startup (slower boot, faster transcription)
+ASR_COMPILE = os.environ.get("ACCENT_COACH_COMPILE", "0") == "1"
+
+# ASR runtime: "torch" (default) or "onnx" (ONNX Runtime, CPU-only deployments)
+ASR_BACKEND = os.environ.get("ACCENT_COACH_ASR_BACKEND", "torch")
+
+
+@st.cache_resource
+def initialize_asr_manager():
+    """
+    Create the ASR manager and warm-load the default model at startup.
+    Cached so the model is loaded once per process, not on the first request.
+
+    Returns:
+        ASRModelManager: Shared manager (model lazily loaded if warm-up failed)
+    """
+    from accent_coach.domain.transcription.asr_manager import ASRModelManager
+
+    asr_manager = ASRModelManager(
+        DEFAULT_MODEL, MODEL_OPTIONS, compile_model=ASR_COMPILE, backend=ASR_BACKEND
+    )
+    try:
+        asr_manager.load_model(DEFAULT_MODEL)
+        asr_manager.warmup()
+    except Exception:
+        # Non-fatal: TranscriptionService loads the model on first use
+        pass
+    return asr_manager
+
+
+@st.cache_resource
+def warm_up_audio(_audio_service):
+    """
+    Prime the audio pipeline and TTS connection once per process.
+
+    Args:
+        _audio_service: AudioService to warm up (underscore: not hashed by Streamlit)
+    """
+    try:
+        _audio_service.warmup()
+    except Exception:
+        # Non-fatal: first request simply pays the cold-start cost
+        pass
+
+
+@st.cache_resource
+def get_language_query_cache():
+    """
+    Process-wide cache for language query answers.
+    Shared across reruns and sessions so repeated questions skip the LLM;
+    only exact (normalized) repeats asked without history are served.
+
+    Returns:
+        SemanticCache: Shared response cache
+    """
+    return SemanticCache()
+
+
+@st.cache_resource
+def get_batching_transcriber():
+    """
+    Process-wide micro-batching transcriber shared by all sessions.
+
+    Returns:
+        BatchingTranscriber: Wrapper around a TranscriptionService
+    """
+    return BatchingTranscriber(TranscriptionService(asr_manager=initialize_asr_manager()))
+
+
+@st.cache_resource
+def enable_g2p_disk_cache():
+    """
+    Persist G2P results across app restarts (set up once per process).
+    No-op when the optional diskcache package is not installed.
+
+    Returns:
+        bool: True if the disk cache is active
+    """
+    return G2PConverter.enable_disk_cache(os.environ.get("ACCENT_COACH_G2P_CACHE_DIR"))
+
+
 def initialize_services():
     """
     Initialize all domain services with dependency injection.
@@ -123,20 +218,13 @@ def initialize_services():
     except:
         groq_api_key = os.environ.get("GROQ_API_KEY")
 
+    enable_g2p_disk_cache()
+
     # Initialize infrastructure services
     llm_service = GroqLLMService(api_key=groq_api_key) if groq_api_key else None
 
-    # Initialize ASR Manager for transcription
-    from accent_coach.domain.transcription.asr_manager import ASRModelManager
-
-    MODEL_OPTIONS = {
-        "Wav2Vec2 Base (Fast, Cloud-Friendly)": "facebook/wav2vec2-base-960h",
-        "Wav2Vec2 Large (Better Accuracy, Needs More RAM)": "facebook/wav2vec2-large-960h",
-        "Wav2Vec2 XLSR (Phonetic)": "mrrubino/wav2vec2-large-xlsr-53-l2-arctic-phoneme",
-    }
-    DEFAULT_MODEL = "facebook/wav2vec2-base-960h"
-
-    asr_manager = ASRModelManager(DEFAULT_MODEL, MODEL_OPTIONS)
+    # ASR Manager for transcription (loaded and warmed once per process)
+    asr_manager = initialize_asr_manager()
 
     # Initialize repositories using cached function
     pronunciation_repo, conversation_repo, writing_repo, activity_repo, connection_status = initialize_repositories()
@@ -153,6 +241,7 @@ def initialize_services():
 
     # Initialize domain services with dependency injection
     audio_service = AudioService()
+    warm_up_audio(audio_service)
     transcription_service = TranscriptionService(asr_manager=asr_manager)
     phonetic_service = PhoneticAnalysisService()
 
@@ -166,7 +255,7 @@ def initialize_services():
 
     conversation_service = ConversationService(
         audio_service=audio_service,
-        transcription_service=transcription_service,
+        transcription_service=get_batching_transcriber() if ASR_MICRO_BATCHING else transcription_service,
         llm_service=llm_service,
         repository=conversation_repo
     )
@@ -176,7 +265,8 @@ def initialize_services():
     )
 
     language_query_service = LanguageQueryService(
-        llm_service=llm_service
+        llm_service=llm_service,
+        response_cache=get_language_query_cache()
     )
 
     # Legacy components
@@ -881,7 +971,7 @@ def render_conversation_tutor_tab(user: dict, conversation_service: Conversation
             if st.button("🔄 End Session", use_container_width=True):
                 # Close session
                 try:
-                    conversation_service.close_session(session.session_id)
+                    conversation_service.close_session(session)
                     st.session_state.conversation_session = None
                     st.session_state.conversation_turns = []
                     st.success("Session ended successfully!")
@@ -1174,13 +1264,17 @@ def render_writing_coach_tab(user: dict, writing_service: WritingService, activi
         if st.button("👨‍🏫 Get Teacher Feedback", type="secondary"):
             with st.spinner("Generating personalized feedback..."):
                 try:
-                    teacher_feedback = writing_service.generate_teacher_feedback(
+                    st.subheader("👨‍🏫 Teacher's Feedback")
+                    placeholder = st.empty()
+
+                    # Render the email as it streams in instead of waiting for all of it
+                    teacher_feedback = ""
+                    for chunk in writing_service.generate_teacher_feedback_stream(
                         evaluation=evaluation,
                         original_text=writing_text
-                    )
-
-                    st.subheader("👨‍🏫 Teacher's Feedback")
-                    st.info(teacher_feedback)
+                    ):
+                        teacher_feedback += chunk
+                        placeholder.info(teacher_feedback)
 
                 except Exception as e:
                     st.error(f"Error generating feedback: {str(e)}")
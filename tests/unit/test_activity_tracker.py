@@ -4,8 +4,9 @@ Unit tests for Activity Tracker
 
 import pytest
 from datetime import datetime
+from unittest.mock import Mock
 from accent_coach.infrastructure.activity.tracker import ActivityTracker
-from accent_coach.infrastructure.activity.models import ActivityType
+from accent_coach.infrastructure.activity.models import ActivityLog, ActivityType
 from accent_coach.infrastructure.persistence.in_memory_repositories import (
     InMemoryActivityRepository,
 )
@@ -147,3 +148,24 @@ class TestActivityTracker:
         assert log.metadata["audio_duration"] == 12.5
         assert log.metadata["word_count"] == 8
         assert log.metadata["error_count"] == 3
+
+    def test_daily_progress_sees_direct_repository_writes(self):
+        """Test that activities logged outside the tracker count toward progress."""
+        # Given
+        repo = Mock()
+        repo.get_today_activities.return_value = [
+            ActivityLog("user123", ActivityType.WRITING, datetime.now(), 30, {}),
+        ]
+        tracker = ActivityTracker(repo)
+        first = tracker.get_daily_progress("user123")
+
+        # When
+        repo.get_today_activities.return_value = [
+            ActivityLog("user123", ActivityType.WRITING, datetime.now(), 30, {}),
+            ActivityLog("user123", ActivityType.CONVERSATION, datetime.now(), 20, {}),
+        ]
+        second = tracker.get_daily_progress("user123")
+
+        # Then
+        assert first["score"] == 30
+        assert second["score"] == 50
@@ -17,6 +17,15 @@ from accent_coach.domain.audio import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_tts_cache(tmp_path, monkeypatch):
+    """Keep TTS cache tiers from leaking between tests."""
+    monkeypatch.setattr(TTSGenerator, "CACHE_DIR", tmp_path / "tts")
+    TTSGenerator.clear_cache()
+    yield
+    TTSGenerator.clear_cache()
+
+
 @pytest.mark.unit
 class TestAudioProcessor:
     """Test AudioProcessor utilities."""
@@ -44,6 +53,65 @@ class TestAudioProcessor:
         # Then
         assert np.all(normalized == 0)
 
+    def test_normalize_audio_inplace(self):
+        """Test in-place normalization reuses the input buffer."""
+        # Given
+        waveform = np.array([-0.5, 0.25, 0.1], dtype=np.float32)
+
+        # When
+        normalized = AudioProcessor.normalize_audio(waveform, target_level=1.0, inplace=True)
+
+        # Then
+        assert normalized is waveform
+        assert waveform.min() == pytest.approx(-1.0)
+
+    def test_normalize_audio_keeps_input_by_default(self):
+        """Test normalization does not mutate the caller's array by default."""
+        # Given
+        waveform = np.array([0.1, -0.2], dtype=np.float32)
+
+        # When
+        AudioProcessor.normalize_audio(waveform, target_level=1.0)
+
+        # Then
+        assert waveform[1] == pytest.approx(-0.2)
+
+    def test_load_from_bytes_resamples_stereo_wav(self):
+        """Test soundfile decode + soxr resample to mono 16 kHz."""
+        # Given
+        import io
+        import soundfile as sf
+
+        buffer = io.BytesIO()
+        sf.write(buffer, np.random.randn(44100, 2) * 0.1, 44100, format="WAV")
+
+        # When
+        waveform, sr = AudioProcessor.load_from_bytes(buffer.getvalue(), target_sr=16000)
+
+        # Then
+        assert sr == 16000
+        assert waveform.ndim == 1
+        assert waveform.dtype == np.float32
+        assert len(waveform) == 16000
+
+    def test_peak_and_rms(self):
+        """Test peak and RMS reductions."""
+        # Given
+        waveform = np.array([-0.8, 0.6, 0.0, 0.0], dtype=np.float32)
+
+        # When/Then
+        assert AudioProcessor.peak(waveform) == pytest.approx(0.8)
+        assert AudioProcessor.rms(waveform) == pytest.approx(0.5)
+        assert AudioProcessor.peak(np.array([], dtype=np.float32)) == 0.0
+
+    def test_rms_int16_does_not_overflow(self):
+        """Test RMS of full-scale int16 PCM is computed without integer overflow."""
+        # Given
+        waveform = np.full(16000, -32768, dtype=np.int16)
+
+        # When/Then
+        assert AudioProcessor.rms(waveform) == pytest.approx(32768.0)
+
 
 @pytest.mark.unit
 class TestTTSGenerator:
@@ -94,6 +162,88 @@ class TestTTSGenerator:
         assert b"slow_audio_data" in result
         mock_gtts_class.assert_called_once_with(text="practice", lang="en", slow=True)
 
+    def test_generate_audio_uses_shared_session(self):
+        """Test gTTS requests go through the pooled session."""
+        # Given
+        import base64
+
+        payload = base64.b64encode(b"mp3_bytes").decode("ascii")
+        response = Mock()
+        response.iter_lines.return_value = [
+            ('[["wrb.fr","jQ1olc","[\\"' + payload + '\\"]"]]').encode("utf-8")
+        ]
+        session = Mock()
+        session.send.return_value = response
+
+        # When
+        with patch.object(TTSGenerator, "_get_session", return_value=session):
+            result = TTSGenerator.generate_audio("hello", "en")
+
+        # Then
+        assert result == b"mp3_bytes"
+        session.send.assert_called_once()
+
+    @patch("gtts.gTTS")
+    def test_stream_audio_failure_yields_nothing(self, mock_gtts_class):
+        """Test streaming stops quietly when gTTS fails."""
+        # Given
+        mock_gtts_class.side_effect = Exception("API error")
+
+        # When/Then
+        assert list(TTSGenerator.stream_audio("test", "en")) == []
+
+    @patch("gtts.gTTS")
+    def test_generate_audio_is_cached(self, mock_gtts_class, tmp_path):
+        """Test repeated phrases are served from the memory and disk caches."""
+        # Given
+        mock_tts = Mock()
+        mock_tts.write_to_fp.side_effect = lambda fp: fp.write(b"cached_audio")
+        mock_gtts_class.return_value = mock_tts
+
+        # When
+        first = TTSGenerator.generate_audio("Can you tell me more?", "en")
+        second = TTSGenerator.generate_audio("Can you tell me more?", "en")
+        TTSGenerator.clear_cache()
+        third = TTSGenerator.generate_audio("Can you tell me more?", "en")
+
+        # Then
+        assert first == second == third == b"cached_audio"
+        mock_gtts_class.assert_called_once()
+        assert len(list((tmp_path / "tts").glob("*.mp3"))) == 1
+
+    @patch("gtts.gTTS")
+    def test_failed_generation_is_not_cached(self, mock_gtts_class):
+        """Test failures are retried rather than cached."""
+        # Given
+        mock_gtts_class.side_effect = Exception("API error")
+
+        # When
+        TTSGenerator.generate_audio("retry me", "en")
+        TTSGenerator.generate_audio("retry me", "en")
+
+        # Then
+        assert mock_gtts_class.call_count == 2
+
+    def test_gtts_internals_contract(self):
+        """Test the gTTS internals _pooled_stream depends on are unchanged."""
+        # Given
+        import inspect
+        import requests
+        from gtts import gTTS
+        from accent_coach.domain.audio.audio_processor import _GTTS_AUDIO_RE
+
+        # When
+        prepared = gTTS(text="hello", lang="en")._prepare_requests()
+        stream_source = inspect.getsource(gTTS.stream)
+
+        # Then
+        assert prepared and all(isinstance(p, requests.PreparedRequest) for p in prepared)
+        assert _GTTS_AUDIO_RE.pattern in stream_source
+
+    def test_get_session_is_shared(self):
+        """Test all generators share one HTTP session."""
+        assert TTSGenerator._get_session() is TTSGenerator()._get_session()
+
     @patch("gtts.gTTS")
     def test_generate_audio_failure(self, mock_gtts_class):
         """Test TTS generation failure handling."""
@@ -174,6 +324,19 @@ class TestAudioService:
             with pytest.raises(AudioValidationError, match="too short"):
                 service.process_recording(b"short", config)
 
+    def test_process_recording_nan_audio(self):
+        """Test processing audio that contains NaN samples."""
+        # Given
+        service = AudioService()
+        config = AudioConfig()
+
+        bad_audio = np.random.randn(16000).astype(np.float32)
+        bad_audio[100] = np.nan
+        with patch.object(service._processor, "load_from_bytes", return_value=(bad_audio, 16000)):
+            # When/Then
+            with pytest.raises(AudioValidationError, match="NaN"):
+                service.process_recording(b"nan", config)
+
     def test_generate_tts_normal(self):
         """Test normal TTS generation."""
         # Given
@@ -204,6 +367,35 @@ class TestAudioService:
         assert result == b"slow_audio_data"
         mock_tts.generate_slow_audio.assert_called_once_with("practice", "en")
 
+    def test_generate_tts_stream(self):
+        """Test streaming TTS delegates to the generator's chunk iterator."""
+        # Given
+        mock_tts = Mock()
+        mock_tts.stream_audio.return_value = iter([b"chunk1", b"chunk2"])
+
+        service = AudioService(tts_generator=mock_tts)
+
+        # When
+        chunks = list(service.generate_tts_stream("hello", "en"))
+
+        # Then
+        assert chunks == [b"chunk1", b"chunk2"]
+        mock_tts.stream_audio.assert_called_once_with("hello", "en", slow=False)
+
+    def test_warmup_runs_pipeline_and_tts(self):
+        """Test warm-up decodes a synthetic clip and primes TTS."""
+        # Given
+        mock_tts = Mock()
+        service = AudioService(tts_generator=mock_tts)
+
+        # When
+        with patch.object(service, "process_recording", wraps=service.process_recording) as spy:
+            service.warmup()
+
+        # Then
+        spy.assert_called_once()
+        mock_tts.warmup.assert_called_once()
+
     def test_normalization_applied(self):
         """Test that normalization is applied when configured."""
         # Given
@@ -221,6 +413,30 @@ class TestAudioService:
             # After normalization, max should be close to 0.95 (default target)
             assert np.abs(result.waveform).max() > 0.9
 
+    def test_process_recording_int16_storage(self):
+        """Test int16 storage keeps levels and converts lazily to float32."""
+        # Given
+        service = AudioService()
+        config = AudioConfig(normalize=True, store_int16=True)
+        audio = np.random.randn(16000).astype(np.float32) * 0.5
+
+        with patch.object(service._processor, "load_from_bytes", return_value=(audio, 16000)):
+            # When
+            result = service.process_recording(b"audio", config)
+
+        # Then
+        assert result.waveform.dtype == np.int16
+        assert result.waveform_f32.dtype == np.float32
+        assert np.abs(result.waveform_f32).max() == pytest.approx(0.95, abs=1e-3)
+
+    def test_int16_peak_handles_full_scale(self):
+        """Test peak of full-scale negative int16 samples does not overflow."""
+        # Given
+        waveform = np.array([-32768, 0, 100], dtype=np.int16)
+
+        # When/Then
+        assert AudioProcessor.peak(waveform) == pytest.approx(32768.0)
+
     def test_normalization_skipped(self):
         """Test that normalization is skipped when not configured."""
         # Given
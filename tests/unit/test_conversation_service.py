@@ -74,6 +74,79 @@ class TestPromptBuilder:
         assert "What do you like to read?" in prompt["user"]
         assert "What about you?" in prompt["user"]
 
+    def test_build_prompt_trims_history_to_token_budget(self):
+        """Test oldest turns are dropped when history exceeds the token budget."""
+        # Given
+        turns = [
+            ConversationTurn(
+                user_transcript=f"Message {i} " + "word " * 50,
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question=""
+                ),
+            )
+            for i in range(3)
+        ]
+        budget = turns[1].token_count() + turns[2].token_count()
+        config = ConversationConfig(max_history_turns=5, max_prompt_tokens=budget)
+
+        # When
+        prompt = PromptBuilder.build_prompt("Hello", turns, config)
+
+        # Then
+        assert "Message 0" not in prompt["user"]
+        assert "Message 1" in prompt["user"]
+        assert "Message 2" in prompt["user"]
+
+    def test_build_prompt_keeps_history_prefix_stable(self):
+        """Test the next turn's prompt extends the previous history unchanged."""
+        # Given
+        config = ConversationConfig(max_history_turns=5)
+        turns = [
+            ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question=f"Question {i}?"
+                ),
+            )
+            for i in range(3)
+        ]
+
+        # When
+        before = PromptBuilder.build_prompt("Message 2", turns[:2], config)
+        after = PromptBuilder.build_prompt("Message 3", turns, config)
+
+        # Then
+        assert before["system"] == after["system"]
+        history_prefix = before["user"].split("\n\nStudent's current message:")[0]
+        assert after["user"].startswith(history_prefix)
+        assert after["user"].rstrip().endswith("Please analyze and respond following the format above.")
+
+    def test_build_prompt_keeps_anchor_turns_first(self):
+        """Test anchor turns stay at the start of history after the window slides."""
+        # Given
+        config = ConversationConfig(max_history_turns=2, history_anchor_turns=1)
+        session = ConversationSession(
+            session_id="s", user_id="u", topic="Travel", level="B1-B2",
+            mode=ConversationMode.PRACTICE, anchor_size=1,
+        )
+        for i in range(5):
+            session.add_turn(ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question=f"Question {i}?"
+                ),
+            ))
+
+        # When
+        prompt = PromptBuilder.build_prompt(
+            "Hello", session.get_recent_history(2), config, anchor=session.get_cache_anchor()
+        )
+
+        # Then
+        assert prompt["user"].startswith("Conversation opening:\nStudent: Message 0\nTutor: Question 0?\n")
+        assert "Message 1" not in prompt["user"]
+        assert prompt["user"].index("Message 3") < prompt["user"].index("Message 4")
+
     def test_build_exam_mode_prompt(self):
         """Test building prompt for exam mode."""
         # Given
@@ -86,6 +159,37 @@ class TestPromptBuilder:
         assert "examiner" in prompt["system"].lower()
         assert "[ERRORS FOUND]" in prompt["system"]
 
+    def test_system_prompt_is_memoized(self):
+        """Test the system prompt is rendered once per configuration."""
+        # Given
+        config = ConversationConfig(topic="Travel", focus_area="past tense")
+
+        # When
+        first = PromptBuilder.build_system_prompt(config)
+        second = PromptBuilder.build_system_prompt(ConversationConfig(topic="Travel", focus_area="past tense"))
+
+        # Then
+        assert first is second
+        assert "Conversation topic: Travel" in first
+        assert "Focus area: past tense" in first
+
+    def test_turn_context_lines(self):
+        """Test turn context lines are formatted once and reused."""
+        # Given
+        turn = ConversationTurn(
+            user_transcript="I like reading",
+            tutor_response=TutorResponse(
+                correction="", explanation="", improved_version="", follow_up_question="Why?"
+            ),
+        )
+
+        # When
+        lines = turn.context_lines()
+
+        # Then
+        assert lines == ("Student: I like reading", "Tutor: Why?")
+        assert turn.context_lines() is lines
+
     def test_parse_llm_response(self):
         """Test parsing structured LLM output."""
         # Given
@@ -106,6 +210,49 @@ class TestPromptBuilder:
         assert "What did you do at school?" in parsed["follow_up_question"]
 
 
+    def test_parse_llm_response_exam_mode(self):
+        """Test parsing exam-mode output with markers on one line."""
+        # Given
+        llm_output = "[ERRORS FOUND]: 'go' should be 'went' [FOLLOW UP QUESTION] What happened next?"
+
+        # When
+        parsed = PromptBuilder.parse_llm_response(llm_output)
+
+        # Then
+        assert parsed["errors_found"] == "'go' should be 'went'"
+        assert parsed["follow_up_question"] == "What happened next?"
+        assert parsed["errors_detected"] == ["'go' should be 'went'"]
+        assert parsed["correction"] == ""
+
+    def test_parse_tutor_response(self):
+        """Test parsing LLM output directly into a TutorResponse."""
+        # Given
+        llm_output = """[CORRECTION]: There is a small mistake.
+[EXPLANATION]: Use past tense.
+[IMPROVED VERSION]: I went there.
+[FOLLOW UP QUESTION]: When?"""
+
+        # When
+        response = PromptBuilder.parse_tutor_response(llm_output)
+
+        # Then
+        assert isinstance(response, TutorResponse)
+        assert response.improved_version == "I went there."
+        assert response.follow_up_question == "When?"
+        assert response.errors_detected == ["There is a small mistake."]
+        assert response.assistant_response.endswith("When?")
+
+    def test_parse_llm_response_no_markers(self):
+        """Test parsing free text without any section markers."""
+        # When
+        parsed = PromptBuilder.parse_llm_response("Sorry, I did not understand.")
+
+        # Then
+        assert parsed["follow_up_question"] == ""
+        assert parsed["assistant_response"] == ""
+        assert "errors_found" not in parsed
+
+
 @pytest.mark.unit
 class TestConversationStarters:
     """Test conversation starters."""
@@ -134,6 +281,14 @@ class TestConversationStarters:
         # Then
         assert isinstance(starter, str)
 
+    def test_get_starter_unknown_level_falls_back_to_b1_b2(self):
+        """Test that an unknown level uses the topic's B1-B2 starters."""
+        # When
+        starter = ConversationStarters.get_starter("Travel", "C2")
+
+        # Then
+        assert starter in ConversationStarters.STARTERS_BY_TOPIC["Travel"]["B1-B2"]
+
     def test_get_topics(self):
         """Test getting list of available topics."""
         # When
@@ -248,6 +403,32 @@ class TestConversationSession:
         assert stats["total_errors"] == 1
         assert stats["topic"] == "Travel"
 
+    def test_session_stats_with_initial_history(self):
+        """Test error totals include turns passed at construction."""
+        # Given
+        turn = ConversationTurn(
+            user_transcript="I go yesterday",
+            tutor_response=TutorResponse(
+                correction="Error",
+                explanation="",
+                improved_version="I went yesterday",
+                follow_up_question="",
+                errors_detected=["past tense error", "missing object"],
+            ),
+        )
+        session = ConversationSession(
+            session_id="test", user_id="user", topic="Travel", level="B1-B2",
+            mode=ConversationMode.PRACTICE, history=[turn],
+        )
+
+        # When
+        session.add_turn(turn)
+        stats = session.get_stats()
+
+        # Then
+        assert stats["total_errors"] == 4
+        assert stats["avg_errors_per_turn"] == 2.0
+
     def test_session_to_dict(self):
         """Test converting session to dict for storage."""
         # Given
@@ -269,6 +450,48 @@ class TestConversationSession:
         assert session_dict["mode"] == "practice"
         assert "stats" in session_dict
 
+    def test_turn_to_dict_is_memoized(self):
+        """Test turn export is built once and callers get independent copies."""
+        # Given
+        turn = ConversationTurn(
+            user_transcript="Hello",
+            tutor_response=TutorResponse(
+                correction="", explanation="", improved_version="", follow_up_question="Hi?"
+            ),
+        )
+
+        # When
+        first = turn.to_dict()
+        first["user_transcript"] = "changed"
+        second = turn.to_dict()
+
+        # Then
+        assert second["user_transcript"] == "Hello"
+        assert turn._export() is turn._export()
+
+    def test_session_to_json_bytes_matches_to_dict(self):
+        """Test JSON export has the same content as to_dict."""
+        # Given
+        import json
+
+        session = ConversationSession(
+            session_id="test123", user_id="user456", topic="Travel", level="B1-B2",
+            mode=ConversationMode.PRACTICE,
+        )
+        session.add_turn(ConversationTurn(
+            user_transcript="I go yesterday",
+            tutor_response=TutorResponse(
+                correction="Error", explanation="", improved_version="I went yesterday",
+                follow_up_question="Where?", errors_detected=["tense"],
+            ),
+        ))
+
+        # When
+        exported = json.loads(session.to_json_bytes())
+
+        # Then
+        assert exported == session.to_dict()
+
 
 @pytest.mark.unit
 class TestConversationService:
@@ -319,6 +542,87 @@ class TestConversationService:
         assert session.mode == ConversationMode.PRACTICE
         assert "conv_" in session.session_id
 
+    def test_create_session_ids_are_unique(self, conversation_service):
+        """Test sessions created in the same second get distinct IDs."""
+        # When
+        ids = {conversation_service.create_session("user123", ConversationConfig()).session_id for _ in range(20)}
+
+        # Then
+        assert len(ids) == 20
+        assert all(session_id.startswith("conv_user123_") for session_id in ids)
+
+    def test_create_session_bounds_history(self, conversation_service):
+        """Test sessions keep only the LLM context window when truncation is requested."""
+        # Given
+        config = ConversationConfig(max_history_turns=3, keep_full_history=False)
+        session = conversation_service.create_session("user123", config)
+
+        # When
+        for i in range(5):
+            session.add_turn(ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question="",
+                    errors_detected=["error"],
+                ),
+            ))
+
+        # Then
+        assert len(session.history) == 3
+        assert [t.user_transcript for t in session.get_recent_history(2)] == ["Message 3", "Message 4"]
+        stats = session.get_stats()
+        assert stats["total_turns"] == 5
+        assert stats["total_errors"] == 5
+
+    def test_create_session_cache_anchor(self, conversation_service):
+        """Test the cache anchor keeps opening turns after bounded history evicts them."""
+        # Given
+        config = ConversationConfig(max_history_turns=2, history_anchor_turns=2, keep_full_history=False)
+        session = conversation_service.create_session("user123", config)
+
+        # When
+        for i in range(4):
+            session.add_turn(ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question="",
+                ),
+            ))
+
+        # Then
+        assert [t.user_transcript for t in session.get_cache_anchor()] == ["Message 0", "Message 1"]
+        assert [t.user_transcript for t in session.history] == ["Message 2", "Message 3"]
+
+    def test_config_is_immutable_and_hashable(self):
+        """Test configs can be used as cache keys and are not mutated in place."""
+        # Given
+        config = ConversationConfig(topic="Travel")
+
+        # When/Then
+        assert hash(config) == hash(ConversationConfig(topic="Travel"))
+        with pytest.raises(AttributeError):
+            config.topic = "Work"
+
+    def test_create_session_full_history(self, conversation_service):
+        """Test sessions retain every turn by default and bound only the prompt view."""
+        # Given
+        config = ConversationConfig(max_history_turns=3)
+        session = conversation_service.create_session("user123", config)
+
+        # When
+        for i in range(5):
+            session.add_turn(ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question="",
+                ),
+            ))
+
+        # Then
+        assert len(session.to_dict()["history"]) == 5
+        recent = session.get_recent_history(config.max_history_turns)
+        assert [t.user_transcript for t in recent] == ["Message 2", "Message 3", "Message 4"]
+
     def test_process_turn_success(self, conversation_service, mock_services):
         """Test successful conversation turn processing."""
         # Given
@@ -432,3 +736,124 @@ class TestConversationService:
         # Then
         assert session.status == "completed"
         mock_services["repository"].update_session.assert_called_once_with(session)
+
+    def test_process_audio_turn_overlaps_tts_with_save(self, conversation_service, mock_services):
+        """Test follow-up TTS runs concurrently with persisting the turn."""
+        # Given
+        import threading
+
+        session = ConversationSession(
+            session_id="test", user_id="user", topic="Travel", level="B1-B2", mode=ConversationMode.PRACTICE
+        )
+        mock_services["audio"].process_recording.return_value = ProcessedAudio(
+            waveform=np.zeros(16000, dtype=np.float32),
+            sample_rate=16000,
+            duration_seconds=1.0,
+        )
+        mock_services["transcription"].transcribe.return_value = Transcription(
+            text="I like traveling", phonemes="", confidence=0.9,
+        )
+        mock_services["llm"].generate_conversation_feedback.return_value = (
+            "[FOLLOW UP QUESTION]: Where have you traveled?"
+        )
+
+        tts_started = threading.Event()
+
+        def fake_tts(text):
+            tts_started.set()
+            return b"fake_tts_audio"
+
+        def save_turn(session_id, user_id, turn):
+            # TTS must already be running while the turn is being saved
+            assert tts_started.wait(timeout=5)
+            assert turn.follow_up_audio is None
+
+        mock_services["audio"].generate_audio.side_effect = fake_tts
+        mock_services["repository"].save_turn.side_effect = save_turn
+
+        # When
+        turn = conversation_service.process_audio_turn(b"fake_audio", session, ConversationConfig())
+
+        # Then
+        assert turn.follow_up_audio == b"fake_tts_audio"
+        mock_services["repository"].save_turn.assert_called_once()
+
+    def test_process_audio_turn_streams_follow_up_audio(self, conversation_service, mock_services):
+        """Test stream_audio hands back a lazy chunk iterator instead of buffered bytes."""
+        # Given
+        session = ConversationSession(
+            session_id="test", user_id="user", topic="Travel", level="B1-B2", mode=ConversationMode.PRACTICE
+        )
+        mock_services["audio"].process_recording.return_value = ProcessedAudio(
+            waveform=np.zeros(16000, dtype=np.float32),
+            sample_rate=16000,
+            duration_seconds=1.0,
+        )
+        mock_services["transcription"].transcribe.return_value = Transcription(
+            text="I like traveling", phonemes="", confidence=0.9,
+        )
+        mock_services["llm"].generate_conversation_feedback.return_value = (
+            "[FOLLOW UP QUESTION]: Where have you traveled?"
+        )
+        mock_services["audio"].generate_tts_stream.return_value = iter([b"chunk1", b"chunk2"])
+
+        # When
+        turn = conversation_service.process_audio_turn(
+            b"fake_audio", session, ConversationConfig(stream_audio=True)
+        )
+
+        # Then
+        assert turn.follow_up_audio is None
+        assert list(turn.follow_up_audio_stream) == [b"chunk1", b"chunk2"]
+        mock_services["audio"].generate_tts_stream.assert_called_once_with("Where have you traveled?")
+        mock_services["audio"].generate_audio.assert_not_called()
+        mock_services["repository"].save_turn.assert_called_once()
+
+    def test_generate_feedback_fallback_hides_error_details(self, conversation_service, mock_services):
+        """Test the fallback reply names only the error type and bounds the echoed transcript."""
+        # Given
+        mock_services["llm"].generate_conversation_feedback.side_effect = RuntimeError("secret request-id 42")
+        transcript = "word " * 100
+
+        # When
+        response = conversation_service._generate_feedback(transcript, [], ConversationConfig())
+
+        # Then
+        assert response.explanation == "Error getting feedback: RuntimeError"
+        assert "secret" not in response.assistant_response
+        assert len(response.assistant_response) < 250
+        assert response.improved_version == transcript
+
+    def test_buffered_turns_are_saved_in_bulk(self, mock_services):
+        """Test flush_threshold coalesces turn writes into save_turns calls."""
+        # Given
+        service = ConversationService(
+            audio_service=mock_services["audio"],
+            transcription_service=mock_services["transcription"],
+            llm_service=mock_services["llm"],
+            repository=mock_services["repository"],
+            flush_threshold=2,
+        )
+        session = service.create_session("user", ConversationConfig())
+        turns = [
+            ConversationTurn(
+                user_transcript=f"Message {i}",
+                tutor_response=TutorResponse(
+                    correction="", explanation="", improved_version="", follow_up_question="",
+                ),
+            )
+            for i in range(3)
+        ]
+
+        # When
+        for turn in turns:
+            service._persist_turn(session, turn)
+        saved_before_close = mock_services["repository"].save_turns.call_count
+        service.close_session(session.session_id)
+
+        # Then
+        assert saved_before_close == 1
+        calls = mock_services["repository"].save_turns.call_args_list
+        assert calls[0].args == (session.session_id, turns[:2])
+        assert calls[1].args == (session.session_id, turns[2:])
+        mock_services["repository"].save_turn.assert_not_called()
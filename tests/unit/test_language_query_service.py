@@ -5,8 +5,10 @@ Testing with mocks (no actual LLM API calls).
 """
 
 import pytest
+import numpy as np
 from unittest.mock import Mock
 from accent_coach.domain.language_query.service import LanguageQueryService
+from accent_coach.domain.language_query.cache import SemanticCache
 from accent_coach.domain.language_query.models import (
     QueryResult,
     QueryConfig,
@@ -105,6 +107,21 @@ class TestLanguageQueryService:
         with pytest.raises(ValueError, match="User query cannot be empty"):
             service.process_query(user_query="   \n  \t  ")
 
+    def test_process_query_strips_surrounding_whitespace(self):
+        """Test that the stripped query is what reaches the LLM and the result."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.return_value = "Response"
+        service = LanguageQueryService(llm_service=mock_llm)
+
+        # When
+        result = service.process_query(user_query="  What does 'break a leg' mean?\n")
+
+        # Then
+        assert result.user_query == "What does 'break a leg' mean?"
+        call_args = mock_llm.generate_language_query_response.call_args
+        assert call_args.kwargs["user_query"] == "What does 'break a leg' mean?"
+
     def test_process_query_with_custom_config(self):
         """Test query processing with custom configuration."""
         # Given
@@ -263,6 +280,17 @@ class TestLanguageQueryService:
         # Then
         assert result.category == QueryCategory.EXPRESSION
 
+    def test_detect_category_precedence_and_case(self):
+        """Test that category order wins over keyword position, case-insensitively."""
+        # Given
+        service = LanguageQueryService(llm_service=Mock())
+
+        # When/Then
+        assert service._detect_category("What is the MEANING of this IDIOM?") == QueryCategory.IDIOM
+        assert service._detect_category("Is this slang a Phrasal Verb?") == QueryCategory.PHRASAL_VERB
+        assert service._detect_category("Which tense is right?") == QueryCategory.GRAMMAR
+        assert service._detect_category("Is 'I am good' natural?") == QueryCategory.EXPRESSION
+
     def test_get_category_description(self):
         """Test category description retrieval."""
         # Given
@@ -278,6 +306,150 @@ class TestLanguageQueryService:
         assert service.get_category_description(QueryCategory.ERROR) == "error"
 
 
+@pytest.mark.unit
+class TestSemanticCache:
+    """Test semantic response caching in LanguageQueryService."""
+
+    def test_near_duplicate_query_served_from_cache(self):
+        """Test that a repeat differing only in casing and punctuation does not call the LLM again."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.return_value = "'Touch base' is very common."
+        service = LanguageQueryService(llm_service=mock_llm, response_cache=SemanticCache())
+
+        # When
+        first = service.process_query("Is 'touch base' commonly used?")
+        second = service.process_query("is touch base commonly used")
+
+        # Then
+        mock_llm.generate_language_query_response.assert_called_once()
+        assert second.llm_response == first.llm_response
+        assert second.category == first.category
+        assert second.user_query == "is touch base commonly used"
+
+    def test_different_query_misses_cache(self):
+        """Test that unrelated queries still reach the LLM."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.return_value = "Answer"
+        service = LanguageQueryService(llm_service=mock_llm, response_cache=SemanticCache())
+
+        # When
+        service.process_query("Is 'touch base' commonly used?")
+        service.process_query("What does 'break the ice' mean?")
+
+        # Then
+        assert mock_llm.generate_language_query_response.call_count == 2
+
+    def test_near_miss_queries_do_not_hit(self):
+        """Test that questions differing by a word or word order get their own answer."""
+        # Given
+        pairs = [
+            ("Is 'I am agree with you' correct?", "Is 'I agree with you' correct?"),
+            ("Is it natural to say 'I will go to home'?", "Is it natural to say 'I will go home'?"),
+            (
+                "When do I use 'affect' instead of 'effect'?",
+                "When do I use 'effect' instead of 'affect'?",
+            ),
+        ]
+
+        for first_query, second_query in pairs:
+            mock_llm = Mock()
+            mock_llm.generate_language_query_response.side_effect = ["First answer", "Second answer"]
+            service = LanguageQueryService(llm_service=mock_llm, response_cache=SemanticCache())
+
+            # When
+            service.process_query(first_query)
+            second = service.process_query(second_query)
+
+            # Then
+            assert mock_llm.generate_language_query_response.call_count == 2
+            assert second.llm_response == "Second answer"
+
+    def test_queries_with_history_bypass_cache(self):
+        """Test that follow-up questions are answered in context, not from the cache."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.return_value = "Answer"
+        cache = SemanticCache()
+        service = LanguageQueryService(llm_service=mock_llm, response_cache=cache)
+        history = [{"role": "user", "content": "What does 'touch base' mean?"}]
+
+        # When
+        service.process_query("Is it formal?")
+        service.process_query("Is it formal?", conversation_history=history)
+        service.process_query("Is it formal?", conversation_history=history)
+
+        # Then
+        assert mock_llm.generate_language_query_response.call_count == 3
+        assert len(cache) == 1
+
+    def test_semantic_matching_is_opt_in(self):
+        """Test that a supplied embedding model enables near-duplicate matching."""
+        # Given
+        result = QueryResult(user_query="q", llm_response="a", category=QueryCategory.EXPRESSION)
+        vectors = {
+            "what does touch base mean": np.array([1.0, 0.0], dtype=np.float32),
+            "meaning of touch base": np.array([0.96, 0.28], dtype=np.float32),
+            "what does break the ice mean": np.array([0.0, 1.0], dtype=np.float32),
+        }
+        cache = SemanticCache(embed_fn=lambda text: vectors[text], threshold=0.9)
+
+        # When
+        cache.store("what does touch base mean", result)
+
+        # Then
+        assert cache.lookup("meaning of touch base") is result
+        assert cache.lookup("what does break the ice mean") is None
+
+    def test_cache_partitioned_by_model(self):
+        """Test that answers from one model are not reused for another."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.return_value = "Answer"
+        service = LanguageQueryService(llm_service=mock_llm, response_cache=SemanticCache())
+
+        # When
+        service.process_query("Is 'touch base' commonly used?", config=QueryConfig(model="model-a"))
+        service.process_query("Is 'touch base' commonly used?", config=QueryConfig(model="model-b"))
+
+        # Then
+        assert mock_llm.generate_language_query_response.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        """Test that failed LLM calls are retried rather than cached."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_language_query_response.side_effect = [Exception("API down"), "Answer"]
+        service = LanguageQueryService(llm_service=mock_llm, response_cache=SemanticCache())
+
+        # When
+        first = service.process_query("Is 'touch base' commonly used?")
+        second = service.process_query("Is 'touch base' commonly used?")
+
+        # Then
+        assert first.category == QueryCategory.ERROR
+        assert second.llm_response == "Answer"
+
+    def test_expired_and_evicted_entries(self):
+        """Test TTL expiry and LRU eviction."""
+        # Given
+        result = QueryResult(user_query="q", llm_response="a", category=QueryCategory.EXPRESSION)
+        expired_cache = SemanticCache(ttl_seconds=0)
+        small_cache = SemanticCache(max_entries=1)
+
+        # When
+        expired_cache.store("break the ice", result)
+        small_cache.store("break the ice", result)
+        small_cache.store("touch base", result)
+
+        # Then
+        assert expired_cache.lookup("break the ice") is None
+        assert small_cache.lookup("break the ice") is None
+        assert small_cache.lookup("touch base") is result
+        assert len(small_cache) == 1
+
+
 @pytest.mark.unit
 class TestLanguageQueryServiceIntegration:
     """Integration tests for LanguageQueryService with realistic scenarios."""
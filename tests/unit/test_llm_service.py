@@ -14,6 +14,13 @@ from accent_coach.infrastructure.llm.models import LLMConfig, LLMResponse
 class TestGroqLLMService:
     """Test GroqLLMService with mocked Groq API."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_client_cache(self):
+        """Keep the process-wide client cache from leaking between tests."""
+        GroqLLMService.close_all_clients()
+        yield
+        GroqLLMService.close_all_clients()
+
     def test_generate_calls_groq_api(self):
         """Test that generate() calls Groq API correctly."""
         # Given
@@ -121,6 +128,27 @@ class TestGroqLLMService:
         expected_cost = (1000 / 1_000_000) * 0.10
         assert abs(response.cost_usd - expected_cost) < 0.0001
 
+    def test_cost_calculation_unlisted_model_uses_default(self):
+        """Test that models missing from the price table use the default rate."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+
+        mock_client = Mock()
+        mock_completion = Mock()
+        mock_completion.choices = [Mock(message=Mock(content="Text"))]
+        mock_completion.usage = Mock(total_tokens=1_000_000)
+        mock_client.chat.completions.create.return_value = mock_completion
+
+        service._client = mock_client
+
+        config = LLMConfig(model="some-new-70b-preview")
+
+        # When
+        response = service.generate("Prompt", {}, config)
+
+        # Then
+        assert response.cost_usd == pytest.approx(0.10)
+
     def test_api_error_handling(self):
         """Test that API errors are handled properly."""
         # Given
@@ -156,6 +184,68 @@ class TestGroqLLMService:
             assert service._client == mock_groq_instance
             MockGroq.assert_called_once_with(api_key="test_api_key")
 
+    def test_generate_stream_yields_deltas(self):
+        """Test that streaming yields each non-empty content delta."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+
+        def chunk(content):
+            return Mock(choices=[Mock(delta=Mock(content=content))])
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = iter(
+            [chunk("Great "), chunk(None), Mock(choices=[]), chunk("work!")]
+        )
+        service._client = mock_client
+
+        # When
+        chunks = list(service.generate_stream(
+            "Prompt", {"system_message": "Be kind."}, LLMConfig()
+        ))
+
+        # Then
+        assert chunks == ["Great ", "work!"]
+        call_args = mock_client.chat.completions.create.call_args
+        assert call_args.kwargs["stream"] is True
+        assert call_args.kwargs["messages"][0]["role"] == "system"
+
+    def test_generate_stream_wraps_errors(self):
+        """Test that streaming errors are re-raised with context."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        service._client = mock_client
+
+        # When/Then
+        with pytest.raises(RuntimeError, match="Groq API call failed"):
+            list(service.generate_stream("Prompt", {}, LLMConfig()))
+
+    def test_client_shared_across_instances(self):
+        """Test that services with the same API key reuse one Groq client."""
+        # Given
+        first = GroqLLMService(api_key="test_api_key")
+        second = GroqLLMService(api_key="test_api_key")
+        other = GroqLLMService(api_key="other_key")
+
+        # When
+        with patch("groq.Groq", side_effect=lambda api_key: Mock(name=api_key)) as MockGroq:
+            first._ensure_client()
+            second._ensure_client()
+            other._ensure_client()
+
+        # Then
+        assert first._client is second._client
+        assert other._client is not first._client
+        assert MockGroq.call_count == 2
+
+        # When
+        GroqLLMService.close_all_clients()
+
+        # Then
+        first._client.close.assert_called_once()
+        assert GroqLLMService._CLIENTS == {}
+
 
 @pytest.mark.unit
 class TestLLMServiceDomainMethods:
@@ -224,6 +314,44 @@ class TestLLMServiceDomainMethods:
         # Verify generate was called with proper config
         service.generate.assert_called_once()
 
+    def test_generate_conversation_feedback_sends_system_prefix(self):
+        """Test the system prompt is sent as a separate, cacheable message."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        service.generate = Mock(return_value=LLMResponse(text="ok"))
+        hints = {"cache_control": {"type": "ephemeral"}}
+
+        # When
+        service.generate_conversation_feedback(
+            system_prompt="You are a tutor",
+            user_message="I go yesterday",
+            model="llama-3.1-70b-versatile",
+            cache_hints=hints,
+        )
+
+        # Then
+        prompt, context, _ = service.generate.call_args[0]
+        assert prompt == "I go yesterday"
+        assert context["system_message"] == "You are a tutor"
+        assert context["cache_hints"] == hints
+
+    def test_generate_records_cached_tokens(self):
+        """Test cached prompt tokens are read from usage details."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        mock_client = Mock()
+        mock_completion = Mock()
+        mock_completion.choices = [Mock(message=Mock(content="Response"))]
+        mock_completion.usage = Mock(total_tokens=50, prompt_tokens_details=Mock(cached_tokens=32))
+        mock_client.chat.completions.create.return_value = mock_completion
+        service._client = mock_client
+
+        # When
+        response = service.generate("User prompt", {}, LLMConfig())
+
+        # Then
+        assert response.cached_tokens == 32
+
     def test_generate_writing_feedback(self):
         """Test writing evaluation feedback generation."""
         # Given
@@ -254,6 +382,50 @@ class TestLLMServiceDomainMethods:
         assert "Tech Recruiter" in prompt
         assert "interview" in prompt.lower()
 
+    def test_generate_writing_feedback_batch(self):
+        """Test that several answers are evaluated in one request."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        service.generate = Mock(return_value=LLMResponse(
+            text='[{"corrected": "First"}, {"corrected": "Second"}]',
+            tokens_used=400,
+            cost_usd=0.006
+        ))
+
+        # When
+        feedback = service.generate_writing_feedback_batch(
+            texts=["first answer", "second answer"],
+            model="llama-3.1-8b-instant",
+        )
+
+        # Then
+        assert feedback == [
+            ({"corrected": "First"}, '{"corrected": "First"}'),
+            ({"corrected": "Second"}, '{"corrected": "Second"}'),
+        ]
+        service.generate.assert_called_once()
+        prompt = service.generate.call_args[0][0]
+        assert '1) "first answer"' in prompt
+        assert '2) "second answer"' in prompt
+        assert service.generate.call_args[0][2].max_tokens == 1600
+
+    def test_generate_writing_feedback_batch_length_mismatch(self):
+        """Test that a batched response with the wrong item count is rejected."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        service.generate = Mock(return_value=LLMResponse(
+            text='[{"corrected": "Only one"}]',
+            tokens_used=200,
+            cost_usd=0.003
+        ))
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="2 evaluation objects"):
+            service.generate_writing_feedback_batch(
+                texts=["first answer", "second answer"],
+                model="llama-3.1-8b-instant",
+            )
+
     def test_generate_teacher_feedback(self):
         """Test teacher-style feedback generation."""
         # Given
@@ -286,6 +458,25 @@ class TestLLMServiceDomainMethods:
         prompt = call_args[0][0]
         assert "friendly" in prompt.lower() or "warm" in prompt.lower()
 
+    def test_generate_teacher_feedback_stream(self):
+        """Test that teacher feedback can be streamed with the same prompt."""
+        # Given
+        service = GroqLLMService(api_key="test_api_key")
+        service.generate_stream = Mock(return_value=iter(["Dear ", "student"]))
+
+        # When
+        chunks = list(service.generate_teacher_feedback_stream(
+            analysis_data='{"corrected": "Text"}',
+            original_text="I like programming",
+            model="llama-3.1-8b-instant",
+        ))
+
+        # Then
+        assert "".join(chunks) == "Dear student"
+        prompt, _, config = service.generate_stream.call_args[0]
+        assert "friendly" in prompt.lower()
+        assert config.max_tokens == 600
+
     def test_generate_language_query_response(self):
         """Test language query response generation."""
         # Given
@@ -42,6 +42,17 @@ class TestPhonemeTokenizer:
         assert len(tokens) >= 1
         assert tokens[0] == "hɛloʊ"
 
+    def test_tokenize_groups_by_unicode_category(self):
+        """Test IPA letters and combining marks are grouped consistently."""
+        # Given
+        phonemes = "θæŋk-d͡ʒʌmp"
+
+        # When
+        tokens = PhonemeTokenizer.tokenize(phonemes)
+
+        # Then
+        assert tokens == ["θæŋk", "-", "d͡ʒʌmp"]
+
     def test_tokenize_empty_string(self):
         """Test tokenization of empty string."""
         # Given
@@ -98,6 +109,115 @@ class TestG2PConverter:
         assert len(words) == 2
         assert words == ["hello", "world"]
 
+    def test_text_to_phonemes_is_cached(self):
+        """Test repeated texts skip gruut and return independent lists."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        analyzer._text_to_phonemes_cached.cache_clear()
+        first_lexicon, first_words = G2PConverter.text_to_phonemes("good morning")
+        first_words.append("mutated")
+
+        # When
+        with patch.object(analyzer, "sentences", side_effect=AssertionError("cache miss")):
+            lexicon, words = G2PConverter.text_to_phonemes("good morning")
+
+        # Then
+        assert lexicon == first_lexicon
+        assert words == ["good", "morning"]
+
+    def test_text_to_phonemes_reuses_punctuation_stripper(self):
+        """Test G2P does not build a new Punctuation per call."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        analyzer._text_to_phonemes_cached.cache_clear()
+
+        # When
+        with patch.object(analyzer, "Punctuation", side_effect=AssertionError("rebuilt")):
+            lexicon, words = G2PConverter.text_to_phonemes("Hello, world!")
+
+        # Then
+        assert words == ["hello", "world"]
+
+    def test_text_to_phonemes_uses_disk_cache(self):
+        """Test LRU misses are served from and stored in the disk tier."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        disk = {}
+
+        class FakeDiskCache:
+            def get(self, key):
+                return disk.get(key)
+
+            def set(self, key, value):
+                disk[key] = value
+
+        analyzer._text_to_phonemes_cached.cache_clear()
+        with patch.object(analyzer, "_g2p_disk_cache", FakeDiskCache()):
+            G2PConverter.text_to_phonemes("good night")
+            analyzer._text_to_phonemes_cached.cache_clear()
+
+            # When
+            with patch.object(analyzer, "sentences", side_effect=AssertionError("disk miss")):
+                lexicon, words = G2PConverter.text_to_phonemes("good night")
+
+        # Then
+        assert len(disk) == 1
+        assert words == ["good", "night"]
+        analyzer._text_to_phonemes_cached.cache_clear()
+
+    def test_enable_disk_cache_without_diskcache(self):
+        """Test the disk tier stays off when diskcache is not installed."""
+        # Given
+        from unittest.mock import patch
+
+        # When
+        with patch.dict("sys.modules", {"diskcache": None}):
+            enabled = G2PConverter.enable_disk_cache("/tmp/unused")
+
+        # Then
+        assert enabled is False
+
+
+@pytest.mark.unit
+class TestPhonemeAligner:
+    """Test per-word phoneme alignment."""
+
+    def test_align_per_word_splits_by_reference_word(self):
+        """Test deletions stay with their word and insertions are dropped."""
+        # Given
+        lexicon = [('hello', 'h ɛ l oʊ'), ('', ''), ('world', 'w ɜr l d')]
+        recorded = ['h', 'ɛ', 'oʊ', 'w', 'ɜr', 'ʃ', 'l', 'd']
+
+        # When
+        ref, rec = PhonemeAligner.align_per_word(lexicon, recorded)
+
+        # Then
+        assert ref == ['hɛloʊ', '', 'wɜrld']
+        assert rec == ['hɛoʊ', '', 'wɜrld']
+
+    def test_align_per_word_skips_alignment_for_near_exact_attempt(self):
+        """Test a same-length attempt with one wrong phoneme is split positionally."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        lexicon = [('hello', 'h ɛ l oʊ'), ('world', 'w ɜr l d')]
+        recorded = ['h', 'ɛ', 'l', 'oʊ', 'w', 'ɜr', 'ɹ', 'd']
+
+        # When
+        with patch.object(analyzer.SequenceAligner, "align", side_effect=AssertionError("aligned")):
+            ref, rec = PhonemeAligner.align_per_word(lexicon, recorded)
+
+        # Then
+        assert ref == ['hɛloʊ', 'wɜrld']
+        assert rec == ['hɛloʊ', 'wɜrɹd']
+
 
 @pytest.mark.unit
 class TestMetricsCalculator:
@@ -159,6 +279,50 @@ class TestMetricsCalculator:
         assert metrics['total_words'] == 2
         assert metrics['substitutions'] > 0
 
+    def test_character_alignment_is_memoized(self):
+        """Test repeated (ref, rec) pairs are aligned only once."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        analyzer._score_alignment.cache_clear()
+        comparison = [
+            {'word': 'world', 'ref_phonemes': 'wɜrld', 'rec_phonemes': 'wɛld', 'match': False},
+        ]
+        first = MetricsCalculator.calculate_metrics(comparison)
+
+        # When
+        with patch.object(analyzer.SequenceAligner, "align", side_effect=AssertionError("cache miss")):
+            second = MetricsCalculator.calculate_metrics(comparison)
+
+        # Then
+        assert second == first
+        assert second['substitutions'] == 1
+        assert second['deletions'] == 1
+
+    def test_single_edit_skips_alignment(self):
+        """Test words one edit apart are counted without running NW."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.phonetic import analyzer
+
+        comparison = [
+            {'word': 'hello', 'ref_phonemes': 'hɛloʊ', 'rec_phonemes': 'xɛloʊ', 'match': False},
+            {'word': 'world', 'ref_phonemes': 'wɜrld', 'rec_phonemes': 'wɜld', 'match': False},
+            {'word': 'cat', 'ref_phonemes': 'kæt', 'rec_phonemes': 'kæts', 'match': False},
+        ]
+
+        # When
+        with patch.object(analyzer.SequenceAligner, "align", side_effect=AssertionError("aligned")):
+            metrics = MetricsCalculator.calculate_metrics(comparison)
+
+        # Then
+        assert metrics['total_phonemes'] == 13
+        assert metrics['correct_phonemes'] == 11
+        assert metrics['substitutions'] == 1
+        assert metrics['deletions'] == 1
+        assert metrics['insertions'] == 1
+
 
 @pytest.mark.unit
 class TestPhoneticAnalysisService:
@@ -233,6 +397,25 @@ class TestPhoneticAnalysisService:
         # "hello" might still be suggested if stress marks don't align perfectly
         # This is expected behavior - minor differences still suggest practice
 
+    def test_suggest_drill_words_filters_mismatches_and_low_accuracy(self):
+        """Test drill words are mismatched or under 80% accurate, in order."""
+        # Given
+        from accent_coach.domain.phonetic import WordComparison
+
+        service = PhoneticAnalysisService()
+        alignment = [
+            WordComparison("good", "ɡʊd", "ɡʊd", True, 100.0),
+            WordComparison("night", "naɪt", "naɪ", False, 75.0),
+            WordComparison("moon", "mun", "mun", True, 50.0),
+        ]
+
+        # When
+        drill_words = service._suggest_drill_words(alignment)
+
+        # Then
+        assert drill_words == ["night", "moon"]
+        assert not hasattr(alignment[0], "__dict__")
+
     def test_analyze_with_different_language(self):
         """Test analysis with different language code."""
         # Given
@@ -12,6 +12,7 @@ from accent_coach.domain.pronunciation.service import (
     PronunciationError,
 )
 from accent_coach.domain.pronunciation.models import PracticeConfig, PracticeResult
+from accent_coach.domain.pronunciation.practice_texts import PracticeTextManager
 from accent_coach.domain.audio.models import ProcessedAudio
 from accent_coach.domain.transcription.models import Transcription
 from accent_coach.domain.phonetic.models import (
@@ -528,6 +529,23 @@ class TestPronunciationPracticeService:
         assert transcription_call[0][1].use_g2p is False
 
 
+    def test_derived_configs_reused_while_unchanged(self):
+        """Test audio/ASR configs are rebuilt only when their settings change."""
+        # Given
+        service = PronunciationPracticeService(Mock(), Mock(), Mock())
+
+        # When
+        first = service._configs_for(PracticeConfig())
+        second = service._configs_for(PracticeConfig(use_llm_feedback=False))
+        changed = service._configs_for(PracticeConfig(language="en-gb"))
+
+        # Then
+        assert second[0] is first[0] and second[1] is first[1]
+        assert changed[1] is not first[1]
+        assert changed[1].language == "en-gb"
+        assert changed[0].sample_rate == 16000
+
+
 @pytest.mark.unit
 class TestPronunciationServiceIntegration:
     """Integration tests for PronunciationPracticeService with realistic scenarios."""
@@ -618,3 +636,61 @@ class TestPronunciationServiceIntegration:
 
         # Verify result was saved
         mock_repo.save_analysis.assert_called_once()
+
+
+@pytest.mark.unit
+class TestPracticeTextManager:
+    """Test practice text lookups."""
+
+    def test_texts_are_built_once(self):
+        """Test repeated lookups return the same PracticeText objects."""
+        # When
+        first = PracticeTextManager.get_texts_for_category("Idioms")
+        second = PracticeTextManager.get_texts_for_category("Idioms")
+
+        # Then
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert first[0].focus == "Idiomatic expressions"
+        assert first[0].difficulty == "Medium"
+
+    def test_index_and_random_lookups(self):
+        """Test index and random lookups use the precomputed texts."""
+        # When
+        by_index = PracticeTextManager.get_text_by_index("Beginner", 0)
+        random_text = PracticeTextManager.get_random_text("Tongue Twisters")
+
+        # Then
+        assert by_index.text == PracticeTextManager.TEXTS["Beginner"][0]
+        assert PracticeTextManager.get_text_by_index("Beginner", 99) is None
+        assert random_text.text in PracticeTextManager.TEXTS["Tongue Twisters"]
+        assert PracticeTextManager.get_random_text("Unknown") is None
+
+    def test_search_texts_matches_substrings_case_insensitively(self):
+        """Test indexed search keeps substring semantics and text order."""
+        # When
+        results = PracticeTextManager.search_texts("SEASHELL")
+        partial = PracticeTextManager.search_texts("hell")
+
+        # Then
+        assert [r.category for r in results] == ["Beginner", "Tongue Twisters"]
+        assert all("seashell" in r.text.lower() for r in results)
+        assert any(r.text.startswith("Hello") for r in partial)
+        assert PracticeTextManager.search_texts("no such phrase") == []
+
+    def test_category_info_is_precomputed_and_copied(self):
+        """Test category stats are correct and safe to mutate."""
+        # Given
+        info = PracticeTextManager.get_category_info("Beginner")
+
+        # When
+        info['count'] = -1
+
+        # Then
+        fresh = PracticeTextManager.get_category_info("Beginner")
+        texts = PracticeTextManager.TEXTS["Beginner"]
+        assert fresh['count'] == len(texts)
+        assert fresh['avg_words'] == sum(len(t.split()) for t in texts) / len(texts)
+        assert PracticeTextManager.get_category_info("Unknown") == {}
+        assert PracticeTextManager.get_total_text_count() == 70
@@ -204,6 +204,18 @@ class TestInMemoryConversationRepository:
         history = repo.get_session_history(session_id)
         assert len(history) == 3
 
+    def test_save_turns_bulk(self):
+        """Test bulk-saving turns keeps their order."""
+        # Given
+        repo = InMemoryConversationRepository()
+        turns = [MockTurnResult() for _ in range(3)]
+
+        # When
+        repo.save_turns("session_123", turns)
+
+        # Then
+        assert repo.get_session_history("session_123") == turns
+
 
 # ============================================================================
 # WRITING REPOSITORY TESTS
@@ -7,12 +7,14 @@ Testing with mocked ASR manager (no actual model loading).
 import pytest
 import numpy as np
 from unittest.mock import Mock
+from concurrent.futures import Future
 from accent_coach.domain.transcription import (
     TranscriptionService,
     TranscriptionError,
     ASRConfig,
     Transcription,
     ASRModelManager,
+    BatchingTranscriber,
 )
 from accent_coach.domain.audio import ProcessedAudio
 
@@ -168,11 +170,172 @@ class TestTranscriptionService:
         call_args = mock_asr.transcribe.call_args
         assert call_args.kwargs["use_g2p"] is False
 
+    def test_transcribe_batch_groups_by_sample_rate(self):
+        """Test batch transcription keeps input order across sample rates."""
+        # Given
+        mock_asr = Mock(spec=ASRModelManager)
+        mock_asr.is_loaded.return_value = True
+        mock_asr.transcribe_batch.side_effect = lambda audios, sr, use_g2p, lang: [
+            (f"clip@{sr}", "") for _ in audios
+        ]
+        service = TranscriptionService(asr_manager=mock_asr)
+        audios = [
+            ProcessedAudio(waveform=np.zeros(160, dtype=np.float32), sample_rate=rate, duration_seconds=0.01)
+            for rate in (16000, 8000, 16000)
+        ]
+
+        # When
+        results = service.transcribe_batch(audios, ASRConfig(use_g2p=False))
+
+        # Then
+        assert [r.text for r in results] == ["clip@16000", "clip@8000", "clip@16000"]
+        assert mock_asr.transcribe_batch.call_count == 2
+
+    def test_transcribe_long_decodes_chunks_in_batches(self):
+        """Test long audio is split at quiet points and stitched in order."""
+        # Given
+        mock_asr = Mock(spec=ASRModelManager)
+        mock_asr.is_loaded.return_value = True
+        mock_asr.transcribe_batch.side_effect = lambda audios, sr, use_g2p, lang: [
+            (f"part{len(a)}", "") for a in audios
+        ]
+        service = TranscriptionService(asr_manager=mock_asr)
+        sr = 1000
+        waveform = np.ones(70 * sr, dtype=np.float32)
+        waveform[29_500:29_520] = 0.0  # silence just before the first 30s boundary
+        audio = ProcessedAudio(waveform=waveform, sample_rate=sr, duration_seconds=70.0)
+
+        # When
+        result = service.transcribe_long(
+            audio, ASRConfig(use_g2p=False), chunk_seconds=30.0, batch_size=2
+        )
+
+        # Then
+        chunk_lengths = [
+            len(a)
+            for call in mock_asr.transcribe_batch.call_args_list
+            for a in call.kwargs["audios"]
+        ]
+        assert sum(chunk_lengths) == len(waveform)
+        assert chunk_lengths[0] == 29_510  # cut in the middle of the silent frame
+        assert mock_asr.transcribe_batch.call_count == 2
+        assert result.text == " ".join(f"part{n}" for n in chunk_lengths)
+
+    def test_transcribe_long_short_tail_stays_within_chunk_seconds(self):
+        """Test a short tail is shared with the previous chunk instead of overflowing it."""
+        # Given
+        mock_asr = Mock(spec=ASRModelManager)
+        mock_asr.is_loaded.return_value = True
+        mock_asr.transcribe_batch.side_effect = lambda audios, sr, use_g2p, lang: [
+            ("part", "") for _ in audios
+        ]
+        service = TranscriptionService(asr_manager=mock_asr)
+        sr = 1000
+        waveform = np.ones(59_011, dtype=np.float32)  # second cut leaves a 991-sample tail
+        audio = ProcessedAudio(waveform=waveform, sample_rate=sr, duration_seconds=59.011)
+
+        # When
+        service.transcribe_long(audio, ASRConfig(use_g2p=False), chunk_seconds=30.0)
+
+        # Then
+        chunk_lengths = [
+            len(a)
+            for call in mock_asr.transcribe_batch.call_args_list
+            for a in call.kwargs["audios"]
+        ]
+        assert sum(chunk_lengths) == len(waveform)
+        assert len(chunk_lengths) == 3
+        assert max(chunk_lengths) <= 30 * sr
+        assert min(chunk_lengths) > 1 * sr
+
+    def test_transcribe_long_short_audio_uses_single_pass(self):
+        """Test clips within one chunk go through transcribe()."""
+        # Given
+        mock_asr = Mock(spec=ASRModelManager)
+        mock_asr.is_loaded.return_value = True
+        mock_asr.transcribe.return_value = ("hello", "h ə l oʊ")
+        service = TranscriptionService(asr_manager=mock_asr)
+        audio = ProcessedAudio(
+            waveform=np.zeros(16000, dtype=np.float32), sample_rate=16000, duration_seconds=1.0
+        )
+
+        # When
+        result = service.transcribe_long(audio, ASRConfig())
+
+        # Then
+        assert result.text == "hello"
+        mock_asr.transcribe_batch.assert_not_called()
+
+
+@pytest.mark.unit
+class TestBatchingTranscriber:
+    """Test request coalescing in BatchingTranscriber."""
+
+    def test_concurrent_requests_share_a_batch(self):
+        """Test that requests arriving together are transcribed in one call."""
+        # Given
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_service = Mock()
+        mock_service.transcribe_batch.side_effect = lambda audios, config: [
+            Transcription(text=str(int(a.waveform[0])), confidence=1.0) for a in audios
+        ]
+        batcher = BatchingTranscriber(mock_service, batch_size=4, max_delay_ms=200)
+        audios = [
+            ProcessedAudio(waveform=np.full(160, i, dtype=np.float32), sample_rate=16000, duration_seconds=0.01)
+            for i in range(4)
+        ]
+
+        # When
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda a: batcher.transcribe(a, ASRConfig()), audios))
+
+        # Then
+        assert [r.text for r in results] == ["0", "1", "2", "3"]
+        assert mock_service.transcribe_batch.call_count < 4
+
+    def test_errors_propagate_to_callers(self):
+        """Test that a failed batch raises in the waiting caller."""
+        # Given
+        mock_service = Mock()
+        mock_service.transcribe_batch.side_effect = TranscriptionError("Transcription failed: boom")
+        batcher = BatchingTranscriber(mock_service, max_delay_ms=1)
+        audio = ProcessedAudio(waveform=np.zeros(160, dtype=np.float32), sample_rate=16000, duration_seconds=0.01)
+
+        # When/Then
+        with pytest.raises(TranscriptionError, match="boom"):
+            batcher.transcribe(audio, ASRConfig())
+
+    def test_short_batch_fails_leftover_callers(self):
+        """Test that callers without a result get an error instead of hanging."""
+        # Given
+        mock_service = Mock()
+        mock_service.transcribe_batch.return_value = [Transcription(text="only one", confidence=1.0)]
+        batcher = BatchingTranscriber(mock_service)
+        audio = ProcessedAudio(waveform=np.zeros(160, dtype=np.float32), sample_rate=16000, duration_seconds=0.01)
+        first, second = Future(), Future()
+
+        # When
+        batcher._dispatch([(audio, ASRConfig(), first), (audio, ASRConfig(), second)])
+
+        # Then
+        mock_service.transcribe_batch.assert_called_once()
+        assert first.result(timeout=1).text == "only one"
+        with pytest.raises(TranscriptionError, match="1 results for 2 clips"):
+            second.result(timeout=1)
+
 
 @pytest.mark.unit
 class TestASRModelManager:
     """Test ASRModelManager basic functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_model_cache(self):
+        """Keep the process-wide model cache from leaking between tests."""
+        ASRModelManager.clear_model_cache()
+        yield
+        ASRModelManager.clear_model_cache()
+
     def test_initialization(self):
         """Test ASR manager initialization."""
         # Given/When
@@ -209,3 +372,319 @@ class TestASRModelManager:
 
         # When/Then
         assert not manager._is_phoneme_model()
+
+    def test_decode_runs_in_inference_mode_and_decodes_host_ids(self):
+        """Test the forward pass skips autograd and decoding gets CPU ids."""
+        # Given
+        import torch
+        from types import SimpleNamespace
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        manager.processor = Mock()
+        manager.processor.return_value = {"input_values": torch.zeros(1, 8)}
+        manager.processor.batch_decode.return_value = ["hello"]
+        seen = {}
+
+        def forward(**inputs):
+            seen["inference_mode"] = torch.is_inference_mode_enabled()
+            return SimpleNamespace(logits=torch.tensor([[[0.1, 0.9], [0.8, 0.2]]]))
+
+        manager.model = Mock(side_effect=forward)
+
+        # When
+        decoded = manager._decode_batch([np.zeros(8, dtype=np.float32)], 16000)
+
+        # Then
+        assert decoded == ["hello"]
+        assert seen["inference_mode"] is True
+        assert manager.model.call_args.kwargs["input_values"] is manager.processor.return_value["input_values"]
+        pred_ids = manager.processor.batch_decode.call_args[0][0]
+        assert pred_ids.device.type == "cpu"
+        assert pred_ids.tolist() == [[1, 0]]
+
+    def test_load_model_uses_inference_dtype_and_eval_mode(self):
+        """Test weights load in the device's inference dtype and in eval mode."""
+        # Given
+        import torch
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        model = Mock()
+        model.to.return_value = model
+
+        # When
+        with patch.object(asr_manager, "AutoProcessor"), \
+                patch.object(asr_manager, "AutoModelForCTC") as auto_model:
+            auto_model.from_pretrained.return_value = model
+            manager.load_model("test")
+
+        # Then
+        assert manager._is_phoneme_model() is False
+        assert manager.dtype == torch.float32
+        assert auto_model.from_pretrained.call_args.kwargs["torch_dtype"] == torch.float32
+        model.eval.assert_called_once()
+
+    def test_phoneme_vocab_detected_once_at_load(self):
+        """Test the vocab scan happens at load, not on every transcription."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+
+        with patch.object(asr_manager, "AutoProcessor") as auto_processor, \
+                patch.object(asr_manager, "AutoModelForCTC"):
+            processor = auto_processor.from_pretrained.return_value
+            processor.tokenizer.get_vocab.return_value = {"AA": 0, "SH": 1}
+            manager.load_model("test")
+
+        # When
+        results = [manager._is_phoneme_model() for _ in range(3)]
+
+        # Then
+        assert results == [True, True, True]
+        processor.tokenizer.get_vocab.assert_called_once()
+
+    def test_transcribe_batch_runs_one_forward_pass(self):
+        """Test several clips are padded together and decoded in one call."""
+        # Given
+        import torch
+        from types import SimpleNamespace
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        manager.processor = Mock()
+        manager.processor.return_value = {"input_values": torch.zeros(3, 8)}
+        manager.processor.feature_extractor.return_attention_mask = True
+        manager.processor.batch_decode.return_value = ["a", "b", "c"]
+        manager.model = Mock(return_value=SimpleNamespace(logits=torch.zeros(3, 4, 2)))
+        audios = [np.zeros(n, dtype=np.float32) for n in (4, 8, 6)]
+
+        # When
+        results = manager.transcribe_batch(audios, 16000, use_g2p=False)
+
+        # Then
+        assert results == [("a", "a"), ("b", "b"), ("c", "c")]
+        manager.model.assert_called_once()
+        args, kwargs = manager.processor.call_args
+        assert args[0] is not audios and len(args[0]) == 3
+        assert kwargs["padding"] == "longest"
+
+    def test_transcribe_batch_trims_padding_frames(self):
+        """Test each clip is decoded only over the frames its own samples produce."""
+        # Given
+        import torch
+        from types import SimpleNamespace
+
+        class TinyCTC(torch.nn.Module):
+            def forward(self, input_values):
+                return SimpleNamespace(logits=torch.zeros(input_values.shape[0], 4, 2))
+
+            def _get_feat_extract_output_lengths(self, lengths):
+                return lengths // 2
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        manager.processor = Mock()
+        manager.processor.return_value = {"input_values": torch.zeros(2, 8)}
+        manager.processor.feature_extractor.return_attention_mask = True
+        manager.processor.batch_decode.return_value = ["a", "b"]
+        manager.model = TinyCTC()
+        audios = [np.zeros(n, dtype=np.float32) for n in (4, 8)]
+
+        # When
+        manager.transcribe_batch(audios, 16000, use_g2p=False)
+
+        # Then
+        decoded_ids = manager.processor.batch_decode.call_args[0][0]
+        assert [len(ids) for ids in decoded_ids] == [2, 4]
+
+    @pytest.mark.parametrize(
+        "feat_extract_norm, return_attention_mask", [("group", False), ("layer", True)]
+    )
+    def test_transcribe_batch_matches_single_clip_decoding(
+        self, tmp_path, feat_extract_norm, return_attention_mask
+    ):
+        """Test a padded clip in a batch decodes the same as on its own."""
+        # Given
+        import json
+        import torch
+        from transformers import (
+            Wav2Vec2Config,
+            Wav2Vec2CTCTokenizer,
+            Wav2Vec2FeatureExtractor,
+            Wav2Vec2ForCTC,
+            Wav2Vec2Processor,
+        )
+
+        vocab_file = tmp_path / "vocab.json"
+        vocab_file.write_text(json.dumps({"<pad>": 0, "|": 1, "a": 2, "b": 3, "c": 4, "d": 5}))
+        torch.manual_seed(0)
+        config = Wav2Vec2Config(
+            vocab_size=6, hidden_size=16, num_hidden_layers=1, num_attention_heads=2,
+            intermediate_size=32, conv_dim=(8, 8), conv_stride=(5, 2), conv_kernel=(10, 3),
+            num_conv_pos_embeddings=4, num_conv_pos_embedding_groups=2,
+            feat_extract_norm=feat_extract_norm, do_stable_layer_norm=feat_extract_norm == "layer",
+        )
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        manager.processor = Wav2Vec2Processor(
+            feature_extractor=Wav2Vec2FeatureExtractor(return_attention_mask=return_attention_mask),
+            tokenizer=Wav2Vec2CTCTokenizer(str(vocab_file)),
+        )
+        manager.model = Wav2Vec2ForCTC(config).eval()
+        rng = np.random.default_rng(0)
+        audios = [rng.standard_normal(n).astype(np.float32) for n in (400, 1600)]
+
+        # When
+        batched = manager.transcribe_batch(audios, 16000, use_g2p=False)
+        single = [manager.transcribe_batch([a], 16000, use_g2p=False)[0] for a in audios]
+
+        # Then
+        assert batched == single
+
+    def test_g2p_results_are_cached(self):
+        """Test repeated transcripts skip gruut after the first conversion."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        manager = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        asr_manager._g2p.cache_clear()
+        first = manager._to_phonemes("good morning", use_g2p=True, lang="en-us")
+
+        # When
+        with patch.object(asr_manager, "sentences", side_effect=AssertionError("cache miss")):
+            second = manager._to_phonemes("good morning", use_g2p=True, lang="en-us")
+
+        # Then
+        assert second == first
+        assert first != "good morning"
+
+    def test_models_are_frozen(self):
+        """Test ASRConfig and Transcription are immutable value objects."""
+        # Given
+        import dataclasses
+        from accent_coach.domain.transcription import Transcription
+
+        config = ASRConfig()
+        transcription = Transcription(text="hi", confidence=1.0)
+
+        # When/Then
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.use_g2p = False
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            transcription.text = "bye"
+
+    def test_as_waveform_avoids_copies_for_float32_input(self):
+        """Test waveform normalisation only copies when layout or dtype differ."""
+        # Given
+        ready = np.zeros(16, dtype=np.float32)
+        strided = np.zeros((16, 2), dtype=np.float64)[:, 0]
+
+        # When
+        same = ASRModelManager._as_waveform(ready)
+        converted = ASRModelManager._as_waveform(strided)
+        from_list = ASRModelManager._as_waveform([0.0, 0.5])
+
+        # Then
+        assert np.shares_memory(same, ready)
+        assert converted.dtype == np.float32 and converted.flags.c_contiguous
+        assert from_list.dtype == np.float32 and from_list.shape == (2,)
+
+    def test_compile_model_wraps_loaded_model(self):
+        """Test torch.compile is applied only when requested."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        manager = ASRModelManager(
+            default_model="test", model_options={}, device="cpu", compile_model=True
+        )
+
+        # When
+        with patch.object(asr_manager, "AutoProcessor"), \
+                patch.object(asr_manager, "AutoModelForCTC") as auto_model, \
+                patch.object(asr_manager.torch, "compile") as compile_fn:
+            loaded = auto_model.from_pretrained.return_value.to.return_value
+            manager.load_model("test")
+
+        # Then
+        compile_fn.assert_called_once_with(loaded, dynamic=True)
+        assert manager.model is compile_fn.return_value
+
+    def test_onnx_backend_runs_on_cpu_and_needs_optimum(self):
+        """Test the ONNX backend pins the CPU and reports a missing optimum."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        manager = ASRModelManager(
+            default_model="test", model_options={}, device="cuda", backend="onnx"
+        )
+
+        # When
+        with patch.object(asr_manager, "AutoProcessor"), \
+                patch.dict("sys.modules", {"optimum.onnxruntime": None}):
+            with pytest.raises(RuntimeError, match="optimum"):
+                manager.load_model("test")
+
+        # Then
+        assert manager.device == "cpu"
+        with pytest.raises(ValueError):
+            ASRModelManager(default_model="test", model_options={}, backend="tflite")
+
+    def test_model_weights_shared_across_managers(self):
+        """Test a second manager reuses the first one's loaded model."""
+        # Given
+        from unittest.mock import patch
+        from accent_coach.domain.transcription import asr_manager
+
+        first = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        second = ASRModelManager(default_model="test", model_options={}, device="cpu")
+
+        # When
+        with patch.object(asr_manager, "AutoProcessor"), \
+                patch.object(asr_manager, "AutoModelForCTC") as auto_model:
+            first.load_model("test")
+            second.load_model("test")
+
+        # Then
+        auto_model.from_pretrained.assert_called_once()
+        assert second.model is first.model
+        assert second.processor is first.processor
+        assert second.is_loaded()
+
+    def test_slow_download_does_not_block_other_models(self):
+        """Test that loading one model leaves other keys and cache hits free."""
+        # Given
+        import threading
+        from unittest.mock import patch
+
+        cached = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        with patch.object(ASRModelManager, "_load_from_hub"):
+            cached.load_model("cached-model")
+
+        download_started = threading.Event()
+        release_download = threading.Event()
+
+        def slow_load(manager, model_name, hf_token):
+            download_started.set()
+            release_download.wait(timeout=5)
+
+        slow = ASRModelManager(default_model="test", model_options={}, device="cpu")
+        other = ASRModelManager(default_model="test", model_options={}, device="cpu")
+
+        # When
+        with patch.object(ASRModelManager, "_load_from_hub", autospec=True, side_effect=slow_load):
+            loader = threading.Thread(target=slow.load_model, args=("slow-model",))
+            loader.start()
+            assert download_started.wait(timeout=5)
+            other.load_model("cached-model")
+            hit_while_loading = not release_download.is_set()
+            release_download.set()
+            loader.join(timeout=5)
+
+        # Then
+        assert hit_while_loading
+        assert other.model_name == "cached-model"
+        assert slow.model_name == "slow-model"
+
@@ -75,6 +75,7 @@ class TestWritingService:
         assert len(evaluation.questions) == 2
         assert len(evaluation.expansion_words) == 2
         assert evaluation.expansion_words[0].word == "extensive"
+        assert isinstance(evaluation.expansion_words, tuple)
 
         # Verify LLM was called correctly
         mock_llm.generate_writing_feedback.assert_called_once()
@@ -149,6 +150,53 @@ class TestWritingService:
         assert len(evaluation.questions) == 0
         assert len(evaluation.expansion_words) == 0
 
+    def test_evaluate_writing_null_fields_default_to_empty(self):
+        """Test that explicit nulls in the LLM output become defaults."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.return_value = json.dumps({
+            "metrics": None,
+            "corrected": "Corrected text",
+            "improvements": None,
+            "questions": None,
+            "expansion_words": None,
+        })
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        evaluation = service.evaluate_writing(text="Original text")
+
+        # Then
+        assert evaluation.metrics.cefr_level == "B1"
+        assert evaluation.improvements == ()
+        assert evaluation.questions == ()
+        assert evaluation.expansion_words == ()
+        assert evaluation.raw_json is None
+
+    def test_evaluate_writing_interns_repeated_labels(self):
+        """Test that CEFR levels and IPA strings are shared across evaluations."""
+        # Given
+        def respond(text, model, temperature):
+            return json.dumps({
+                "metrics": {"cefr_level": "B2", "variety_score": 6},
+                "expansion_words": [{"word": "adept", "ipa": "/əˈdɛpt/",
+                                     "replaces_simple_word": "good"}],
+            })
+
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.side_effect = respond
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        first = service.evaluate_writing("first")
+        second = service.evaluate_writing("second")
+
+        # Then
+        assert first.metrics.cefr_level is second.metrics.cefr_level
+        assert first.expansion_words[0].ipa is second.expansion_words[0].ipa
+        assert (first.expansion_words[0].replaces_simple_word
+                is second.expansion_words[0].replaces_simple_word)
+
     def test_evaluate_writing_custom_config(self):
         """Test evaluation with custom configuration."""
         # Given
@@ -238,6 +286,210 @@ class TestWritingService:
         # Verify temperature is higher (warmth)
         assert call_args.kwargs["temperature"] == 0.4
 
+    def test_evaluate_writing_batch(self):
+        """Test that a batch of texts is evaluated with one LLM call."""
+        # Given
+        mock_llm = Mock()
+        items = [
+            {"metrics": {"cefr_level": "B2", "variety_score": 6}, "corrected": "First polished"},
+            {"metrics": {"cefr_level": "C1", "variety_score": 8}},
+        ]
+        mock_llm.generate_writing_feedback_batch.return_value = [(item, json.dumps(item)) for item in items]
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        evaluations = service.evaluate_writing_batch(["first", "second"])
+
+        # Then
+        mock_llm.generate_writing_feedback_batch.assert_called_once()
+        mock_llm.generate_writing_feedback.assert_not_called()
+        assert [e.metrics.cefr_level for e in evaluations] == ["B2", "C1"]
+        assert evaluations[0].corrected == "First polished"
+        assert evaluations[1].corrected == "second"  # Falls back to original
+
+    def test_evaluate_writing_batch_shares_eval_cache(self):
+        """Test that batched and single evaluations reuse each other's cached responses."""
+        # Given
+        mock_llm = Mock()
+        cached = {"metrics": {"cefr_level": "B2", "variety_score": 6}, "corrected": "Cached"}
+        fresh = {"metrics": {"cefr_level": "C1", "variety_score": 8}, "corrected": "Fresh"}
+        mock_llm.generate_writing_feedback.return_value = json.dumps(cached)
+        mock_llm.generate_writing_feedback_batch.return_value = [(fresh, json.dumps(fresh))]
+        service = WritingService(llm_service=mock_llm)
+        service.evaluate_writing("first")
+
+        # When
+        evaluations = service.evaluate_writing_batch(["  first ", "second", "second"])
+        repeat = service.evaluate_writing("second")
+
+        # Then
+        mock_llm.generate_writing_feedback_batch.assert_called_once()
+        assert mock_llm.generate_writing_feedback_batch.call_args.kwargs["texts"] == ["second"]
+        assert [e.corrected for e in evaluations] == ["Cached", "Fresh", "Fresh"]
+        assert repeat.corrected == "Fresh"
+        mock_llm.generate_writing_feedback.assert_called_once()
+
+    def test_evaluate_writing_batch_rejects_empty_text(self):
+        """Test that an empty text in a batch is rejected before calling the LLM."""
+        # Given
+        mock_llm = Mock()
+        service = WritingService(llm_service=mock_llm)
+
+        # When / Then
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            service.evaluate_writing_batch(["fine", "   "])
+        mock_llm.generate_writing_feedback_batch.assert_not_called()
+
+    def test_evaluate_writing_caches_identical_inputs(self):
+        """Test that repeated inputs reuse the cached LLM response."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.return_value = json.dumps(
+            {"corrected": "Polished"}
+        )
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        first = service.evaluate_writing("My answer")
+        second = service.evaluate_writing("  My answer ")
+        service.evaluate_writing("My answer", WritingConfig(temperature=0.5))
+
+        # Then
+        assert first == second
+        assert mock_llm.generate_writing_feedback.call_count == 2
+
+        service.clear_cache()
+        service.evaluate_writing("My answer")
+        assert mock_llm.generate_writing_feedback.call_count == 3
+
+    def test_evaluate_writing_cache_evicts_least_recent(self):
+        """Test that the evaluation cache is bounded."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.return_value = "{}"
+        service = WritingService(llm_service=mock_llm)
+        service.EVAL_CACHE_SIZE = 2
+
+        # When
+        service.evaluate_writing("a")
+        service.evaluate_writing("b")
+        service.evaluate_writing("a")  # Refresh "a"
+        service.evaluate_writing("c")  # Evicts "b"
+        service.evaluate_writing("a")
+        service.evaluate_writing("b")
+
+        # Then
+        assert mock_llm.generate_writing_feedback.call_count == 4
+
+    def test_evaluate_writing_does_not_cache_invalid_json(self):
+        """Test that unparseable responses are retried instead of replayed."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.side_effect = ["oops", "{}"]
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        with pytest.raises(RuntimeError):
+            service.evaluate_writing("text")
+        evaluation = service.evaluate_writing("text")
+
+        # Then
+        assert evaluation.corrected == "text"
+        assert mock_llm.generate_writing_feedback.call_count == 2
+
+    def test_evaluate_writing_many_keeps_order_and_errors(self):
+        """Test concurrent evaluation maps results and failures by index."""
+        # Given
+        def respond(text, model, temperature):
+            if text == "bad":
+                return "not json"
+            return json.dumps({"corrected": text.upper()})
+
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.side_effect = respond
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        results = service.evaluate_writing_many(
+            ["one", "bad", "three"], WritingConfig(max_concurrent=2)
+        )
+
+        # Then
+        assert results[0].corrected == "ONE"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].corrected == "THREE"
+        assert mock_llm.generate_writing_feedback.call_count == 3
+
+    def test_generate_teacher_feedback_stream(self):
+        """Test that streamed teacher feedback passes chunks through."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_teacher_feedback_stream.return_value = iter(["Nice ", "job!"])
+        service = WritingService(llm_service=mock_llm)
+        evaluation = WritingEvaluation(
+            corrected="Text",
+            improvements=[],
+            questions=[],
+            expansion_words=[],
+            metrics=CEFRMetrics(cefr_level="B1", variety_score=5),
+        )
+
+        # When
+        chunks = list(service.generate_teacher_feedback_stream(evaluation, "text"))
+
+        # Then
+        assert chunks == ["Nice ", "job!"]
+        call_args = mock_llm.generate_teacher_feedback_stream.call_args
+        assert json.loads(call_args.kwargs["analysis_data"])["corrected"] == "Text"
+        assert call_args.kwargs["temperature"] == 0.4
+
+    def test_teacher_feedback_reuses_raw_llm_json(self):
+        """Test that a complete LLM response is passed through unchanged."""
+        # Given
+        raw = json.dumps({
+            "metrics": {"cefr_level": "C1", "variety_score": 8},
+            "corrected": "Polished answer",
+            "improvements": ["Be concise"],
+            "questions": [],
+            "expansion_words": [],
+        })
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.return_value = raw
+        mock_llm.generate_teacher_feedback.return_value = "Nice job!"
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        evaluation = service.evaluate_writing("My answer")
+        service.generate_teacher_feedback(evaluation, "My answer")
+
+        # Then
+        assert evaluation.raw_json == raw
+        call_args = mock_llm.generate_teacher_feedback.call_args
+        assert call_args.kwargs["analysis_data"] is raw
+
+    def test_teacher_feedback_serializes_when_defaults_filled(self):
+        """Test that responses with missing fields are re-serialized with defaults."""
+        # Given
+        mock_llm = Mock()
+        mock_llm.generate_writing_feedback.return_value = json.dumps({
+            "corrected": "Corrected text",
+        })
+        mock_llm.generate_teacher_feedback.return_value = "Nice job!"
+        service = WritingService(llm_service=mock_llm)
+
+        # When
+        evaluation = service.evaluate_writing("Original text")
+        service.generate_teacher_feedback(evaluation, "Original text")
+
+        # Then
+        assert evaluation.raw_json is None
+        analysis_data = mock_llm.generate_teacher_feedback.call_args.kwargs["analysis_data"]
+        assert "\n" not in analysis_data
+        assert json.loads(analysis_data)["metrics"] == {
+            "cefr_level": "B1",
+            "variety_score": 5,
+        }
+
     def test_compute_variety_score_high_variety(self):
         """Test variety score calculation with high vocabulary variety."""
         # Given
@@ -287,6 +539,27 @@ class TestWritingService:
         # Then
         assert score == 10  # Perfect uniqueness
 
+    def test_compute_variety_score_ascii_fast_path_matches_regex(self):
+        """Test the ASCII tokenizer counts the same words as the regex path."""
+        # Given
+        import re
+
+        service = WritingService(llm_service=Mock())
+        samples = [
+            "It's a team_work thing: team_work, TEAM_WORK and 2 APIs (v2/v2).",
+            "go go go -- GO! go?",
+            "a\tb\nc  a_b a-b 123 123",
+        ]
+
+        # When / Then
+        for text in samples:
+            words = re.findall(r"\b\w+\b", text.lower())
+            expected = max(1, min(10, int(len(set(words)) / len(words) * 10)))
+            assert service.compute_variety_score(text) == expected
+
+        # Non-ASCII text still goes through the regex
+        assert service.compute_variety_score("café café") == 5
+
     def test_get_question_by_category_behavioral(self):
         """Test getting behavioral question."""
         # Given
@@ -376,6 +649,53 @@ class TestWritingService:
         assert medium_q.get_xp_value() == 20
         assert hard_q.get_xp_value() == 40
 
+    def test_question_bank_shared_across_instances(self):
+        """Test that the question bank is built once and shared."""
+        # Given
+        first = WritingService(llm_service=Mock())
+        second = WritingService(llm_service=Mock())
+
+        # When
+        question = first.get_all_questions()[0]
+
+        # Then
+        assert first._question_bank is second._question_bank
+        with pytest.raises(AttributeError):
+            question.text = "changed"
+
+    def test_writing_models_use_slots(self):
+        """Test that writing models are slotted and the config is immutable."""
+        # Given
+        config = WritingConfig()
+        evaluation = WritingEvaluation(
+            corrected="Text",
+            metrics=CEFRMetrics(cefr_level="B1", variety_score=5),
+        )
+
+        # Then
+        assert not hasattr(evaluation, "__dict__")
+        assert not hasattr(evaluation.metrics, "__dict__")
+        assert evaluation.improvements == ()
+        with pytest.raises(AttributeError):
+            config.model = "other"
+
+    def test_question_index_matches_bank(self):
+        """Test that indexed lookups only draw from the matching bucket."""
+        # Given
+        service = WritingService(llm_service=Mock())
+        bank = service.get_all_questions()
+
+        # When / Then
+        for category in QuestionCategory:
+            for difficulty in (None, *QuestionDifficulty):
+                expected = [
+                    q for q in bank
+                    if q.category == category
+                    and (difficulty is None or q.difficulty == difficulty)
+                ]
+                bucket = service._questions_by_category.get((category, difficulty), ())
+                assert list(bucket) == expected
+
 
 @pytest.mark.unit
 class TestWritingServiceIntegration: